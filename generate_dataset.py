@@ -0,0 +1,405 @@
+# generate_dataset.py
+"""
+Synthetic data at production scale
+
+    python generate_dataset.py data --users 100000 --uploads 5000000 --queries 500000 --workers 8
+    python generate_dataset.py data --preset small --dry-run
+    python generate_dataset.py images bench_images --count 1000 --size 4032x3024
+
+data writes users, user_uploads and user_query documents shaped like the
+ones the app creates. Volumes are skewed the way real traffic is: pests
+follow a Zipf distribution, uploads grow over the --days window with a
+seasonal peak and daytime hours, and early users upload much more than
+recent ones. Users can sign in as <prefix><n>@example.com / loadtest.
+
+Everything is derived from --seed, --batch and the document index (ObjectIds
+included), so the output does not depend on --workers and an interrupted
+run can simply be repeated: documents already present are skipped.
+Batches are written with unordered insert_many from --workers processes.
+
+images writes JPEG "field photos" (foliage texture with a few insect-like
+blobs) for upload benchmarks, e.g. load_test.py run --images DIR.
+"""
+import argparse
+import hashlib
+import io
+import json
+import math
+import os
+import random
+import struct
+import time
+from datetime import datetime, timedelta, timezone
+from multiprocessing import Pool
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CLASS_MAP = os.path.join(ROOT, 'ml_model', 'class_mapping.json')
+
+EMAIL_PREFIX = 'loadtest'
+USER_PASSWORD = 'loadtest'
+ERROR_CLASSES = ['Unknown', 'Error']
+
+PRESETS = {
+    'small': {'users': 1000, 'uploads': 20000, 'queries': 2000},
+    'medium': {'users': 20000, 'uploads': 500000, 'queries': 50000},
+    'production': {'users': 100000, 'uploads': 5000000, 'queries': 500000},
+}
+
+# ObjectId tag byte per collection, so ids never collide across collections
+COLLECTIONS = {'users': 1, 'user_uploads': 2, 'user_query': 3}
+
+# Share of uploads per hour of day (local time)
+HOUR_WEIGHTS = [1, 1, 1, 1, 1, 2, 4, 7, 9, 9, 8, 7, 6, 6, 7, 8, 8, 7, 5, 4, 3, 2, 2, 1]
+
+QUERY_MESSAGES = [
+    "My {pest} problem is getting worse after rain, what should I spray?",
+    "Is the organic treatment for {pest} safe for vegetables close to harvest?",
+    "Found {pest} on young plants, how often should I apply neem oil?",
+    "The detection said {pest} but I am not sure, can an expert check?",
+    "What is the recommended dose of pesticide for {pest}?",
+]
+QUERY_RESPONSE = "Thanks for your question. Please follow the prevention methods listed on the pest page and contact your local agriculture office if it spreads."
+
+
+def class_names():
+    with open(CLASS_MAP, encoding='utf-8') as f:
+        mapping = json.load(f)
+    return [mapping[str(i)] for i in range(len(mapping))]
+
+
+def object_id(moment, collection, index):
+    """Deterministic ObjectId: creation time, collection tag, document index"""
+    from bson.objectid import ObjectId
+    # Naive moments are UTC, so the ids do not depend on the host's timezone
+    seconds = int(moment.replace(tzinfo=timezone.utc).timestamp())
+    return ObjectId(struct.pack('>IB', seconds, COLLECTIONS[collection]) + index.to_bytes(7, 'big'))
+
+
+class Generator:
+    """Documents for one dataset; any index range can be produced independently"""
+
+    def __init__(self, users, uploads, queries, seed=0, days=365, end=None, zipf=1.1, owner_skew=3.0,
+                 growth=2.0, email_prefix=EMAIL_PREFIX, details=True):
+        self.users = max(1, users)
+        self.uploads = uploads
+        self.queries = queries
+        self.seed = seed
+        self.end = (end or datetime(2026, 1, 1)).replace(microsecond=0)
+        self.start = self.end - timedelta(days=days)
+        self.span = (self.end - self.start).total_seconds()
+        self.owner_skew = owner_skew
+        self.growth = growth
+        self.email_prefix = email_prefix
+        self.password = hashlib.sha256(USER_PASSWORD.encode()).hexdigest()
+
+        pests = class_names()
+        random.Random(f'{seed}-pests').shuffle(pests)
+        self.pests = pests + ERROR_CLASSES
+        self.pest_weights = [1 / (rank + 1) ** zipf for rank in range(len(pests))]
+        # about 1% failed predictions
+        self.pest_weights += [sum(self.pest_weights) * 0.005] * len(ERROR_CLASSES)
+        self.hours = list(range(24))
+        self._details = {}
+        self.details = details
+
+    def _rng(self, collection, chunk):
+        return random.Random(f'{self.seed}-{collection}-{chunk}')
+
+    # ---- users ---------------------------------------------------------
+
+    def user_created(self, index):
+        """Users sign up evenly over the window, so user n exists from user_created(n) on"""
+        return self.start + timedelta(seconds=self.span * index / self.users)
+
+    def user_id(self, index):
+        return object_id(self.user_created(index), 'users', index)
+
+    def user_docs(self, chunk, start, stop):
+        rng = self._rng('users', chunk)
+        docs = []
+        for index in range(start, stop):
+            created = self.user_created(index)
+            docs.append({
+                '_id': self.user_id(index),
+                'email': f'{self.email_prefix}{index}@example.com',
+                'username': f'{self.email_prefix}{index}',
+                'password': self.password,
+                'role': 'user',
+                'auth_method': 'local',
+                'email_verified': rng.random() < 0.9,
+                'is_active': rng.random() < 0.98,
+                'created_at': created,
+                'last_login': created + timedelta(seconds=rng.uniform(0, (self.end - created).total_seconds())),
+                'language': rng.choices(['english', 'hindi', 'bangla'], [70, 20, 10])[0],
+                'uploads': [],
+                'total_uploads': 0,
+                'total_queries': 0,
+            })
+        return docs
+
+    # ---- activity --------------------------------------------------------
+
+    def moment(self, rng):
+        """Time of an upload/query: growing volume, a seasonal peak in the middle of the window, daytime hours"""
+        while True:
+            # inverse CDF of a density rising linearly from 1 to 1 + growth
+            u = rng.random()
+            x = (math.sqrt(1 + u * ((1 + self.growth) ** 2 - 1)) - 1) / self.growth if self.growth else u
+            season = 1 + 0.6 * math.sin(math.pi * x)
+            if rng.random() * 1.6 <= season:
+                break
+        day = self.start + timedelta(days=int(x * self.span / 86400))
+        when = day.replace(hour=rng.choices(self.hours, HOUR_WEIGHTS)[0], minute=rng.randrange(60),
+                           second=rng.randrange(60))
+        return min(max(when, self.start), self.end)
+
+    def owner(self, rng, when):
+        """A user who already existed at `when`, early users far more active"""
+        existing = min(self.users, int((when - self.start).total_seconds() / self.span * self.users) + 1)
+        return int(existing * rng.random() ** self.owner_skew)
+
+    def pest_details(self, pest):
+        if pest not in self._details:
+            try:
+                from user.utils.pests import get_pest_details
+                self._details[pest] = get_pest_details(pest, 'english')
+            except Exception:
+                self._details[pest] = {'name': pest}
+        return self._details[pest]
+
+    def upload_docs(self, chunk, start, stop):
+        rng = self._rng('user_uploads', chunk)
+        docs = []
+        for index in range(start, stop):
+            when = self.moment(rng)
+            owner = self.owner(rng, when)
+            pest = rng.choices(self.pests, self.pest_weights)[0]
+            failed = pest in ERROR_CLASSES
+            confidence = 0.0 if failed else round(min(99.99, 100 * rng.betavariate(5, 1.5)), 2)
+            rest = (100 - confidence) / (len(self.pests) - len(ERROR_CLASSES) - 1)
+            filename = f"{when:%Y%m%d_%H%M%S}_IMG_{rng.randrange(10000):04d}.jpg"
+            public_id = f"pest_uploads/{when:%Y%m%d%H%M%S}_{index:x}"
+            doc = {
+                '_id': object_id(when, 'user_uploads', index),
+                'user_id': str(self.user_id(owner)),
+                'username': f'{self.email_prefix}{owner}',
+                'email': f'{self.email_prefix}{owner}@example.com',
+                'image_filename': filename,
+                'pest_detected': pest,
+                'confidence': confidence,
+                'all_predictions': {} if failed else {
+                    name: confidence if name == pest else round(rest, 2)
+                    for name in self.pests if name not in ERROR_CLASSES},
+                'uploaded_at': when,
+                'status': 'processed',
+                'language': 'english',
+                'cloudinary_url': f'https://res.cloudinary.com/demo/image/upload/{public_id}.jpg',
+                'cloudinary_public_id': public_id,
+            }
+            if self.details:
+                doc['pest_details'] = self.pest_details(pest)
+            docs.append(doc)
+        return docs
+
+    def query_docs(self, chunk, start, stop):
+        rng = self._rng('user_query', chunk)
+        pests = self.pests[:-len(ERROR_CLASSES)]
+        docs = []
+        for index in range(start, stop):
+            when = self.moment(rng)
+            owner = self.owner(rng, when)
+            answered = when < self.end - timedelta(days=2) and rng.random() < 0.7
+            docs.append({
+                '_id': object_id(when, 'user_query', index),
+                'user_id': str(self.user_id(owner)),
+                'username': f'{self.email_prefix}{owner}',
+                'email': f'{self.email_prefix}{owner}@example.com',
+                'name': f'User {owner}',
+                'message': rng.choice(QUERY_MESSAGES).format(pest=rng.choices(pests, self.pest_weights[:len(pests)])[0]),
+                'status': 'responded' if answered else 'pending',
+                'timestamp': when,
+                'response': QUERY_RESPONSE if answered else None,
+                'responded_at': when + timedelta(hours=rng.expovariate(1 / 20)) if answered else None,
+                'admin_id': 'admin' if answered else None,
+            })
+        return docs
+
+    def docs(self, collection, chunk, start, stop):
+        builder = {'users': self.user_docs, 'user_uploads': self.upload_docs, 'user_query': self.query_docs}[collection]
+        return builder(chunk, start, stop)
+
+    def chunks(self, batch):
+        """(collection, chunk, start, stop) for everything, users first"""
+        for collection, total in (('users', self.users), ('user_uploads', self.uploads), ('user_query', self.queries)):
+            for chunk, start in enumerate(range(0, total, batch)):
+                yield collection, chunk, start, min(total, start + batch)
+
+    def write(self, db, batch=5000):
+        """Insert everything into db from this process (small datasets, tests)"""
+        counts = {}
+        for collection, chunk, start, stop in self.chunks(batch):
+            counts[collection] = counts.get(collection, 0) + insert(db[collection], self.docs(collection, chunk, start, stop))
+        return counts
+
+
+def insert(collection, docs):
+    """Unordered bulk insert that skips documents already present; returns the number inserted"""
+    from pymongo.errors import BulkWriteError
+    if not docs:
+        return 0
+    try:
+        return len(collection.insert_many(docs, ordered=False).inserted_ids)
+    except BulkWriteError as e:
+        errors = e.details.get('writeErrors', [])
+        if any(error.get('code') != 11000 for error in errors):
+            raise
+        return e.details.get('nInserted', len(docs) - len(errors))
+
+
+# ==================== PARALLEL WRITERS ====================
+
+_worker = {}
+
+
+def _init_worker(options, uri):
+    _worker['generator'] = Generator(**options)
+    if uri:
+        from pymongo import MongoClient
+        _worker['db'] = MongoClient(uri).get_default_database('pest')
+
+
+def _write_chunk(spec):
+    collection, chunk, start, stop = spec
+    docs = _worker['generator'].docs(collection, chunk, start, stop)
+    db = _worker.get('db')
+    inserted = insert(db[collection], docs) if db is not None else 0
+    return collection, len(docs), inserted
+
+
+def generate_data(options):
+    settings = dict(PRESETS[options.preset]) if options.preset else {}
+    for key in ('users', 'uploads', 'queries'):
+        if getattr(options, key) is not None:
+            settings[key] = getattr(options, key)
+    settings = {**PRESETS['small'], **settings}
+    generator_options = dict(settings, seed=options.seed, days=options.days, zipf=options.zipf,
+                             email_prefix=options.email_prefix, details=not options.no_details)
+    uri = None if options.dry_run else options.mongo_uri
+
+    if uri and options.drop:
+        from pymongo import MongoClient
+        db = MongoClient(uri).get_default_database('pest')
+        for collection in COLLECTIONS:
+            db[collection].delete_many({'email': {'$regex': f'^{options.email_prefix}\\d+@example\\.com$'}})
+
+    generator = Generator(**generator_options)
+    specs = list(generator.chunks(options.batch))
+    print(f"Generating {settings['users']:,} users, {settings['uploads']:,} uploads, {settings['queries']:,} queries "
+          f"({len(specs)} batches, {options.workers} writers{', dry run' if uri is None else ''})", flush=True)
+
+    started = time.perf_counter()
+    totals = {}
+    done = 0
+    with Pool(options.workers, initializer=_init_worker, initargs=(generator_options, uri)) as pool:
+        for collection, generated, inserted in pool.imap_unordered(_write_chunk, specs):
+            total = totals.setdefault(collection, [0, 0])
+            total[0] += generated
+            total[1] += inserted
+            done += generated
+            if done % (options.batch * 20) < generated:
+                elapsed = time.perf_counter() - started
+                print(f"  {done:,} documents, {done / elapsed:,.0f}/s", flush=True)
+    elapsed = time.perf_counter() - started
+
+    for collection, (generated, inserted) in totals.items():
+        print(f"{collection}: {generated:,} generated, {inserted:,} inserted")
+    print(f"Done in {elapsed:.1f}s ({done / elapsed:,.0f} documents/s)")
+    if uri is None and options.dry_run:
+        sample = {collection: generator.docs(collection, 0, 0, 1)[0] for collection in COLLECTIONS}
+        print(json.dumps(sample, indent=2, default=str)[:3000])
+
+
+# ==================== IMAGES ====================
+
+def field_image(seed, width, height, quality=85):
+    """JPEG bytes of a foliage-like background with a few dark insect-like blobs"""
+    import numpy as np
+    from PIL import Image, ImageDraw, ImageFilter
+
+    rng = np.random.default_rng(seed)
+    # low-resolution noise scaled up gives leaf-sized patches of colour
+    small = rng.normal(0, 1, (max(2, height // 64), max(2, width // 64), 3))
+    base = np.array([70, 120, 45]) + small * np.array([18, 25, 12])
+    image = Image.fromarray(np.clip(base, 0, 255).astype(np.uint8)).resize((width, height), Image.BICUBIC)
+    grain = rng.integers(-12, 12, (height, width, 1), dtype=np.int16)
+    image = Image.fromarray(np.clip(np.asarray(image, dtype=np.int16) + grain, 0, 255).astype(np.uint8))
+
+    draw = ImageDraw.Draw(image)
+    for _ in range(int(rng.integers(1, 6))):
+        size = int(rng.integers(max(4, width // 120), max(8, width // 25)))
+        x, y = int(rng.integers(0, width - size)), int(rng.integers(0, height - size))
+        colour = tuple(int(c) for c in rng.integers(10, 90, 3))
+        draw.ellipse((x, y, x + size, y + size * 0.6), fill=colour)
+    image = image.filter(ImageFilter.GaussianBlur(radius=float(rng.uniform(0, 1.5))))
+
+    buffer = io.BytesIO()
+    image.save(buffer, format='JPEG', quality=quality)
+    return buffer.getvalue()
+
+
+def _write_image(spec):
+    path, seed, width, height = spec
+    data = field_image(seed, width, height)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return len(data)
+
+
+def generate_images(options):
+    width, height = (int(value) for value in options.size.lower().split('x'))
+    os.makedirs(options.directory, exist_ok=True)
+    specs = [(os.path.join(options.directory, f'field_{i:05d}.jpg'), options.seed * 1000003 + i, width, height)
+             for i in range(options.count)]
+    started = time.perf_counter()
+    with Pool(options.workers) as pool:
+        sizes = pool.map(_write_image, specs, chunksize=4)
+    elapsed = time.perf_counter() - started
+    print(f"{len(sizes)} images ({width}x{height}, {sum(sizes) / len(sizes) / 1024:.0f} KiB average) "
+          f"in {options.directory}, {elapsed:.1f}s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Synthetic data at production scale')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    data = commands.add_parser('data', help='users, uploads and queries in MongoDB')
+    data.add_argument('--preset', choices=list(PRESETS))
+    data.add_argument('--users', type=int)
+    data.add_argument('--uploads', type=int)
+    data.add_argument('--queries', type=int)
+    data.add_argument('--seed', type=int, default=0)
+    data.add_argument('--days', type=int, default=365, help='time window the activity is spread over')
+    data.add_argument('--zipf', type=float, default=1.1, help='pest popularity skew')
+    data.add_argument('--email-prefix', default=EMAIL_PREFIX)
+    data.add_argument('--no-details', action='store_true', help='leave pest_details out of uploads')
+    data.add_argument('--mongo-uri', default='mongodb://localhost:27017/pest')
+    data.add_argument('--drop', action='store_true', help='delete previously generated documents first')
+    data.add_argument('--dry-run', action='store_true', help='generate without writing (measures generation speed)')
+    data.add_argument('--batch', type=int, default=5000)
+    data.add_argument('--workers', type=int, default=os.cpu_count() or 4)
+    data.set_defaults(func=generate_data)
+
+    images = commands.add_parser('images', help='JPEG field photos for upload benchmarks')
+    images.add_argument('directory')
+    images.add_argument('--count', type=int, default=100)
+    images.add_argument('--size', default='1600x1200', help='WIDTHxHEIGHT, phones take about 4032x3024')
+    images.add_argument('--seed', type=int, default=0)
+    images.add_argument('--workers', type=int, default=os.cpu_count() or 4)
+    images.set_defaults(func=generate_images)
+
+    options = parser.parse_args(argv)
+    options.func(options)
+
+
+if __name__ == "__main__":
+    main()
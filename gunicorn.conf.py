@@ -0,0 +1,41 @@
+# gunicorn.conf.py
+"""
+gunicorn settings, picked up automatically from the working directory
+
+    gunicorn main:app                      # WEB_CONCURRENCY workers (default 2)
+    MODEL_CPU_PIN=1 gunicorn main:app      # each worker pinned to its own CPUs
+
+Every worker gets a stable slot (0..workers-1) that is reused when a worker
+is restarted, and passes it to ml_model/runtime.py, which sizes TensorFlow's
+thread pools and the optional CPU pinning from it. Run
+`python -m ml_model.runtime` to find the best settings for the machine.
+
+With METRICS_DIR set, the workers' metric snapshots from the previous run
+are removed when the server starts (user/utils/metrics.py).
+"""
+import os
+
+workers = int(os.getenv('WEB_CONCURRENCY', '2'))
+
+# The model must load after fork: TensorFlow's thread pools do not survive it,
+# and each worker sizes its own from its slot
+preload_app = False
+
+
+def on_starting(server):
+    """Start the merged /metrics counters from zero"""
+    directory = os.getenv('METRICS_DIR')
+    if directory and os.path.isdir(directory):
+        from user.utils.metrics import MultiprocessStore
+        MultiprocessStore.clear(directory)
+
+
+def pre_fork(server, worker):
+    """Give the new worker the lowest free slot"""
+    taken = {getattr(other, 'model_slot', None) for other in server.WORKERS.values()}
+    worker.model_slot = next(slot for slot in range(len(taken) + 1) if slot not in taken)
+
+
+def post_fork(server, worker):
+    os.environ['MODEL_WORKERS'] = str(server.cfg.workers)
+    os.environ['MODEL_WORKER_INDEX'] = str(worker.model_slot)
@@ -0,0 +1,613 @@
+# load_test.py
+"""
+End-to-end load test: start the app, drive traffic mixes, write JSON results
+
+    python load_test.py run                                  # in-memory Mongo, stub model, werkzeug
+    python load_test.py run --mongo local --server gunicorn --workers 4
+    python load_test.py run --scenarios browse,upload --concurrency 1,8,32 --duration 20
+    python load_test.py compare load_results/a.json load_results/b.json
+
+The app runs in a separate process with a fake Cloudinary (uploads stay in a
+temp folder, optional latency), the offline crop advice model and either a
+stub or the real pest model. Mongo is one of:
+  memory  mongomock inside the server process (werkzeug only)
+  local   a throwaway mongod on a free port (needs mongod on PATH)
+  uri     --mongo-uri / MONGO_URI, used as is
+
+Each scenario runs at every concurrency level for --duration seconds with
+closed-loop clients (each waits for its response before sending the next).
+Results (throughput, latency percentiles per action, errors, server CPU and
+memory) go to load_results/<commit>-<time>.json.
+"""
+import argparse
+import io
+import json
+import os
+import random
+import re
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+
+from generate_dataset import EMAIL_PREFIX, USER_PASSWORD, Generator, class_names
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(ROOT, 'load_results')
+
+ADMIN_EMAIL = 'admin@gmail.com'
+ADMIN_PASSWORD = 'admin'
+DB_NAME = 'pest'
+
+# action -> weight, per scenario
+SCENARIOS = {
+    'browse': {'home': 10, 'pest_library': 45, 'pest_detail': 40, 'about': 5},
+    'results': {'result': 60, 'history': 30, 'user_dashboard': 10},
+    'upload': {'predict': 100},
+    'admin': {'admin_dashboard': 30, 'admin_analytics': 30, 'admin_user_management': 20, 'admin_uploads': 20},
+    'mixed': {'home': 5, 'pest_library': 25, 'pest_detail': 20, 'result': 15, 'history': 10,
+              'user_dashboard': 5, 'predict': 12, 'admin_dashboard': 3, 'admin_analytics': 2,
+              'admin_user_management': 2, 'admin_uploads': 1},
+}
+ADMIN_ACTIONS = {'admin_dashboard', 'admin_analytics', 'admin_user_management', 'admin_uploads'}
+
+
+def percentile(sorted_values, fraction):
+    from user.utils.latency import percentile as nearest_rank
+    return nearest_rank(sorted_values, fraction)
+
+
+# ==================== SERVER SIDE ====================
+
+def seed_database(db, users=200, uploads=2000, queries=300, seed=0):
+    """Users, uploads and queries over the last 30 days (see generate_dataset.py)"""
+    generator = Generator(users, uploads, queries, seed=seed, days=30, end=datetime.now())
+    return generator.write(db)
+
+
+def install_stub_model(latency_ms):
+    """Replace ml_model.predictor with a model that decodes the image for real and sleeps for inference"""
+    import types
+    from contextlib import nullcontext
+
+    import numpy as np
+    from PIL import Image
+
+    names = class_names()
+    module = types.ModuleType('ml_model.predictor')
+
+    def predict_pest(image_bytes, span=nullcontext):
+        try:
+            with span('decode'):
+                img = Image.open(io.BytesIO(image_bytes)).convert('RGB').resize((224, 224))
+                pixels = np.asarray(img, dtype=np.float32) / 255.0
+        except Exception as e:
+            return {'success': False, 'error': str(e)}
+        with span('inference'):
+            time.sleep(latency_ms / 1000)
+        top = int(pixels.sum()) % len(names)
+        scores = {name: (91.0 if i == top else round(9.0 / (len(names) - 1), 2)) for i, name in enumerate(names)}
+        return {'success': True, 'predicted_class': names[top], 'confidence': 91.0, 'all_predictions': scores}
+
+    def predict_tiles(image_bytes, span=nullcontext, **options):
+        result = predict_pest(image_bytes, span=span)
+        if result['success']:
+            result['detections'] = []
+            result['summary'] = {'pests': {}, 'tiles': 1, 'image_size': [224, 224], 'skipped_scales': []}
+        return result
+
+    def predict_batch(batch):
+        time.sleep(latency_ms / 1000)
+        results = []
+        for pixels in batch:
+            top = int(pixels.sum()) % len(names)
+            scores = {name: (91.0 if i == top else round(9.0 / (len(names) - 1), 2)) for i, name in enumerate(names)}
+            results.append({'success': True, 'predicted_class': names[top], 'confidence': 91.0,
+                            'all_predictions': scores})
+        return results
+
+    def scan_frames(frames, report, diff_threshold=None, max_batch=16):
+        from ml_model import video
+        threshold = video.DIFF_THRESHOLD if diff_threshold is None else diff_threshold
+        return video.scan(frames, predict_batch, 224, report, diff_threshold=threshold, max_batch=max_batch)
+
+    module.predict_pest = predict_pest
+    module.predict_tiles = predict_tiles
+    module.predict_batch = predict_batch
+    module.scan_frames = scan_frames
+    module.class_names = names
+    module.IMG_SIZE = 224
+    sys.modules['ml_model.predictor'] = module
+
+
+def install_memory_mongo():
+    """Make flask_pymongo.PyMongo hand out a mongomock client"""
+    try:
+        import mongomock
+    except ImportError:
+        sys.exit("--mongo memory needs mongomock (pip install mongomock), or use --mongo local")
+    import flask_pymongo
+
+    class MemoryPyMongo:
+        def __init__(self, app=None, **kwargs):
+            self.cx = mongomock.MongoClient()
+            self.db = self.cx[DB_NAME]
+
+    flask_pymongo.PyMongo = MemoryPyMongo
+
+
+def build_app():
+    """The Flask app configured from LOAD_TEST_* environment variables"""
+    os.environ.setdefault('LLM_ADVICE_FAKE', '1')
+    os.environ.setdefault('LOG_LEVEL', 'WARNING')
+    if os.environ.get('LOAD_TEST_MODEL', 'stub') == 'stub':
+        install_stub_model(float(os.environ.get('LOAD_TEST_MODEL_LATENCY_MS', '40')))
+    if os.environ.get('LOAD_TEST_MONGO') == 'memory':
+        install_memory_mongo()
+
+    sys.path.insert(0, ROOT)
+    import user.user as web
+
+    upload_dir = os.environ.get('LOAD_TEST_UPLOAD_DIR') or tempfile.mkdtemp(prefix='load-test-uploads-')
+    web.app.config['UPLOAD_FOLDER'] = upload_dir
+    cloudinary_latency = float(os.environ.get('LOAD_TEST_CLOUDINARY_LATENCY_MS', '0')) / 1000
+
+    def upload_to_cloudinary(path, *args, **kwargs):
+        time.sleep(cloudinary_latency)
+        public_id = os.path.splitext(os.path.basename(path))[0]
+        return {'success': True, 'url': f'https://fake-cloudinary.invalid/{public_id}.jpg', 'public_id': public_id}
+
+    def delete_from_cloudinary(public_id, *args, **kwargs):
+        time.sleep(cloudinary_latency)
+        return {'success': True}
+
+    web.upload_to_cloudinary = upload_to_cloudinary
+    web.delete_from_cloudinary = delete_from_cloudinary
+    return web
+
+
+def wsgi_app():
+    """gunicorn entry point: gunicorn 'load_test:wsgi_app()'"""
+    return build_app().app
+
+
+def serve(port, seed_counts):
+    """werkzeug server for one run (the memory database is seeded here)"""
+    from werkzeug.serving import make_server
+
+    web = build_app()
+    if os.environ.get('LOAD_TEST_MONGO') == 'memory':
+        seed_database(web.mongo.db, *seed_counts)
+    make_server('127.0.0.1', port, web.app, threaded=True).serve_forever()
+
+
+# ==================== RESOURCES ====================
+
+def _proc_children(pid):
+    children = []
+    for entry in os.listdir('/proc'):
+        if entry.isdigit():
+            try:
+                with open(f'/proc/{entry}/stat') as f:
+                    fields = f.read().rsplit(')', 1)[1].split()
+                if int(fields[1]) == pid:
+                    children.append(int(entry))
+            except (OSError, IndexError, ValueError):
+                continue
+    return children
+
+
+def process_tree_usage(pid):
+    """(cpu seconds, rss bytes) of a process and its children, from /proc; None elsewhere"""
+    if not os.path.isdir('/proc'):
+        return None
+    ticks = os.sysconf('SC_CLK_TCK')
+    cpu, rss = 0.0, 0
+    for process in [pid] + _proc_children(pid):
+        try:
+            with open(f'/proc/{process}/stat') as f:
+                fields = f.read().rsplit(')', 1)[1].split()
+            cpu += (int(fields[11]) + int(fields[12])) / ticks
+            with open(f'/proc/{process}/status') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        rss += int(line.split()[1]) * 1024
+        except (OSError, IndexError, ValueError):
+            continue
+    return cpu, rss
+
+
+class ResourceSampler:
+    """Server CPU time and peak RSS over one step"""
+
+    def __init__(self, pid, interval=0.5):
+        self.pid = pid
+        self.interval = interval
+        self.peak_rss = 0
+        self._stop = threading.Event()
+        self._thread = None
+        self._start_cpu = None
+
+    def __enter__(self):
+        usage = process_tree_usage(self.pid)
+        self._start_cpu = usage[0] if usage else None
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            usage = process_tree_usage(self.pid)
+            if usage:
+                self.peak_rss = max(self.peak_rss, usage[1])
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        usage = process_tree_usage(self.pid)
+        elapsed = time.perf_counter() - self._started
+        if usage is None or self._start_cpu is None:
+            self.result = None
+        else:
+            self.peak_rss = max(self.peak_rss, usage[1])
+            cpu = usage[0] - self._start_cpu
+            self.result = {'server_cpu_seconds': round(cpu, 2),
+                           'server_cpu_percent': round(100 * cpu / elapsed, 1),
+                           'server_peak_rss_mb': round(self.peak_rss / 2 ** 20, 1)}
+        return False
+
+
+# ==================== CLIENT SIDE ====================
+
+def sample_image(rng, images):
+    """Bytes of a real image from --images, or a generated JPEG"""
+    if images:
+        path = rng.choice(images)
+        with open(path, 'rb') as f:
+            return os.path.basename(path), f.read()
+    from PIL import Image
+    import numpy as np
+    pixels = np.random.default_rng(rng.getrandbits(32)).integers(0, 255, (480, 640, 3), dtype=np.uint8)
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format='JPEG', quality=85)
+    return 'field.jpg', buffer.getvalue()
+
+
+class Client:
+    """One closed-loop virtual user with a user session and an admin session"""
+
+    def __init__(self, base_url, user_index, context, seed):
+        import requests
+
+        self.base_url = base_url
+        self.context = context
+        self.rng = random.Random(seed)
+        self.user = requests.Session()
+        self.admin = requests.Session()
+        # a few generated accounts are deactivated, move on to the next one
+        for index in range(user_index, user_index + 20):
+            if self._login(self.user, f'{EMAIL_PREFIX}{index}@example.com', USER_PASSWORD):
+                break
+        self._login(self.admin, ADMIN_EMAIL, ADMIN_PASSWORD)
+
+    def _login(self, http, email, password):
+        response = http.post(f'{self.base_url}/auth/process',
+                             data={'email': email, 'password': password, 'action': 'signin'},
+                             allow_redirects=False, timeout=30)
+        return '/login' not in response.headers.get('Location', '/login')
+
+    def request(self, action):
+        http = self.admin if action in ADMIN_ACTIONS else self.user
+        context = self.context
+        if action == 'predict':
+            name, data = self.rng.choice(context['images'])
+            return http.post(f'{self.base_url}/predict', files={'file': (name, data, 'image/jpeg')},
+                             allow_redirects=False, timeout=60)
+        if action == 'pest_detail':
+            path = f"/pest/{self.rng.choice(context['pests'])}"
+        elif action == 'result':
+            path = f"/result/{self.rng.choice(context['uploads'])}/language/english"
+        else:
+            path = {
+                'home': '/', 'about': '/about', 'pest_library': '/pest-library', 'history': '/history',
+                'user_dashboard': '/user/dashboard', 'admin_dashboard': '/admin/dashboard',
+                'admin_analytics': '/admin/analytics', 'admin_user_management': '/admin/user_management',
+                'admin_uploads': '/admin/uploads',
+            }[action]
+        return http.get(f'{self.base_url}{path}', allow_redirects=False, timeout=60)
+
+
+def run_step(base_url, scenario, concurrency, duration, warmup, context, server_pid, users):
+    """Closed-loop load at one concurrency level; returns the result record"""
+    actions = list(SCENARIOS[scenario])
+    weights = [SCENARIOS[scenario][action] for action in actions]
+    clients = [Client(base_url, i % users, context, seed=f'{scenario}-{concurrency}-{i}')
+               for i in range(concurrency)]
+    samples = {action: [] for action in actions}
+    statuses = {action: Counter() for action in actions}
+    lock = threading.Lock()
+    measuring = threading.Event()
+    stop = threading.Event()
+
+    def worker(client):
+        while not stop.is_set():
+            action = client.rng.choices(actions, weights)[0]
+            started = time.perf_counter()
+            try:
+                response = client.request(action)
+                location = response.headers.get('Location', '')
+                status = 'auth' if response.is_redirect and ('/login' in location or '/auth' in location) \
+                    else str(response.status_code)
+            except Exception as e:
+                status = type(e).__name__
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if measuring.is_set():
+                with lock:
+                    samples[action].append(elapsed_ms)
+                    statuses[action][status] += 1
+
+    threads = [threading.Thread(target=worker, args=(client,), daemon=True) for client in clients]
+    for thread in threads:
+        thread.start()
+    time.sleep(warmup)
+    with ResourceSampler(server_pid) as resources:
+        measuring.set()
+        started = time.perf_counter()
+        time.sleep(duration)
+        measuring.clear()
+        elapsed = time.perf_counter() - started
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    def summarize(values):
+        values = sorted(values)
+        if not values:
+            return {'count': 0}
+        return {'count': len(values), 'mean': round(sum(values) / len(values), 1),
+                'p50': round(percentile(values, 0.50), 1), 'p90': round(percentile(values, 0.90), 1),
+                'p95': round(percentile(values, 0.95), 1), 'p99': round(percentile(values, 0.99), 1),
+                'max': round(values[-1], 1)}
+
+    def failed(counter):
+        return sum(count for status, count in counter.items() if not (status.isdigit() and int(status) < 400))
+
+    everything = [value for values in samples.values() for value in values]
+    total_statuses = sum(statuses.values(), Counter())
+    return {
+        'scenario': scenario,
+        'concurrency': concurrency,
+        'seconds': round(elapsed, 2),
+        'requests': len(everything),
+        'errors': failed(total_statuses),
+        'throughput_rps': round(len(everything) / elapsed, 1),
+        'latency_ms': summarize(everything),
+        'statuses': dict(total_statuses),
+        'actions': {action: {'latency_ms': summarize(samples[action]), 'statuses': dict(statuses[action]),
+                             'errors': failed(statuses[action])}
+                    for action in actions if samples[action]},
+        'resources': resources.result,
+    }
+
+
+# ==================== ORCHESTRATION ====================
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def wait_until_up(url, process, timeout=180):
+    import requests
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            sys.exit(f"Server exited with code {process.returncode}")
+        try:
+            if requests.get(url, timeout=2).status_code < 500:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.5)
+    sys.exit(f"Server did not start within {timeout}s")
+
+
+def start_mongod(workdir):
+    if shutil.which('mongod') is None:
+        sys.exit("--mongo local needs mongod on PATH")
+    port = free_port()
+    dbpath = os.path.join(workdir, 'db')
+    os.makedirs(dbpath)
+    process = subprocess.Popen(['mongod', '--dbpath', dbpath, '--port', str(port), '--bind_ip', '127.0.0.1', '--quiet'],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    from pymongo import MongoClient
+    client = MongoClient(f'mongodb://127.0.0.1:{port}', serverSelectionTimeoutMS=30000)
+    client.admin.command('ping')
+    return process, f'mongodb://127.0.0.1:{port}/{DB_NAME}'
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def run(options):
+    if options.server == 'gunicorn' and options.mongo == 'memory':
+        sys.exit("gunicorn workers cannot share an in-memory database; use --mongo local or --mongo uri")
+
+    workdir = tempfile.mkdtemp(prefix='load-test-')
+    processes = []
+    seed_counts = (options.users, options.uploads, options.queries, options.seed)
+    env = dict(os.environ,
+               LOAD_TEST_MODEL=options.model,
+               LOAD_TEST_MODEL_LATENCY_MS=str(options.model_latency_ms),
+               LOAD_TEST_CLOUDINARY_LATENCY_MS=str(options.cloudinary_latency_ms),
+               LOAD_TEST_MONGO=options.mongo,
+               LOAD_TEST_UPLOAD_DIR=os.path.join(workdir, 'uploads'))
+    os.makedirs(env['LOAD_TEST_UPLOAD_DIR'])
+    try:
+        if options.mongo != 'memory':
+            if options.mongo == 'local':
+                mongod, uri = start_mongod(workdir)
+                processes.append(mongod)
+            else:
+                uri = options.mongo_uri or os.environ.get('MONGO_URI')
+                if not uri:
+                    sys.exit("--mongo uri needs --mongo-uri or MONGO_URI")
+            env['MONGO_URI'] = uri
+            if not options.no_seed:
+                from pymongo import MongoClient
+                seed_database(MongoClient(uri).get_default_database(DB_NAME), *seed_counts)
+
+        port = free_port()
+        if options.server == 'gunicorn':
+            command = ['gunicorn', '-w', str(options.workers), '--threads', str(options.threads),
+                       '-b', f'127.0.0.1:{port}', '--log-level', 'warning', 'load_test:wsgi_app()']
+        else:
+            command = [sys.executable, os.path.abspath(__file__), 'serve', '--port', str(port),
+                       '--seed-counts', ','.join(map(str, seed_counts))]
+        server = subprocess.Popen(command, cwd=ROOT, env=env)
+        processes.append(server)
+        base_url = f'http://127.0.0.1:{port}'
+        wait_until_up(base_url + '/', server)
+
+        context = discover(base_url, options)
+        results = []
+        for scenario in options.scenarios:
+            for concurrency in options.concurrency:
+                result = run_step(base_url, scenario, concurrency, options.duration, options.warmup,
+                                  context, server.pid, options.users)
+                results.append(result)
+                latency = result['latency_ms']
+                print(f"{scenario:<8} c={concurrency:<4} {result['throughput_rps']:>8.1f} req/s  "
+                      f"p50 {latency.get('p50', 0):>7.1f}  p95 {latency.get('p95', 0):>7.1f}  "
+                      f"p99 {latency.get('p99', 0):>7.1f} ms  errors {result['errors']}", flush=True)
+    finally:
+        for process in reversed(processes):
+            process.terminate()
+            try:
+                process.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    commit = git_commit()
+    report = {
+        'commit': commit,
+        'started_at': datetime.now().isoformat(timespec='seconds'),
+        'machine': {'cpus': os.cpu_count(), 'python': sys.version.split()[0], 'platform': sys.platform},
+        'options': {key: value for key, value in vars(options).items() if key != 'func'},
+        'results': results,
+    }
+    output = options.output or os.path.join(RESULTS_DIR, f"{commit}-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}")
+
+
+def discover(base_url, options):
+    """Pest ids, upload ids and images the clients pick from"""
+    import requests
+
+    admin = requests.Session()
+    admin.post(f'{base_url}/auth/process', data={'email': ADMIN_EMAIL, 'password': ADMIN_PASSWORD, 'action': 'signin'},
+               allow_redirects=False, timeout=30)
+    library = admin.get(f'{base_url}/pest-library', timeout=60).text
+    pests = sorted(set(re.findall(r'href="/pest/([^"]+)"', library))) or class_names()
+    uploads = set()
+    for page in range(1, 6):
+        uploads_page = admin.get(f'{base_url}/admin/uploads', params={'page': page}, timeout=60).text
+        uploads.update(re.findall(r"viewUpload\('([0-9a-f]{24})'\)", uploads_page))
+    uploads = sorted(uploads)
+    if not uploads:
+        sys.exit("No uploads found to request result pages for (seed the database or drop the results scenario)")
+
+    rng = random.Random(options.seed)
+    images = []
+    if options.images:
+        images = [os.path.join(options.images, name) for name in sorted(os.listdir(options.images))
+                  if name.lower().endswith(('.jpg', '.jpeg', '.png', '.webp'))]
+    return {'pests': pests, 'uploads': uploads, 'images': [sample_image(rng, images) for _ in range(16)]}
+
+
+def compare(options):
+    """Throughput and p95 of the same (scenario, concurrency) steps in two result files"""
+    with open(options.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    with open(options.candidate, encoding='utf-8') as f:
+        candidate = json.load(f)
+    before = {(result['scenario'], result['concurrency']): result for result in baseline['results']}
+    print(f"{baseline['commit']} -> {candidate['commit']}")
+    print(f"{'scenario':<8} {'conc':>4} {'req/s':>17} {'change':>8} {'p95 ms':>19} {'change':>8}")
+    for result in candidate['results']:
+        old = before.get((result['scenario'], result['concurrency']))
+        if old is None:
+            continue
+        rps_old, rps_new = old['throughput_rps'], result['throughput_rps']
+        p95_old, p95_new = old['latency_ms'].get('p95', 0), result['latency_ms'].get('p95', 0)
+        rps_change = (rps_new / rps_old - 1) * 100 if rps_old else 0
+        p95_change = (p95_new / p95_old - 1) * 100 if p95_old else 0
+        print(f"{result['scenario']:<8} {result['concurrency']:>4} {rps_old:>8.1f}->{rps_new:<8.1f} {rps_change:>+7.1f}% "
+              f"{p95_old:>9.1f}->{p95_new:<9.1f} {p95_change:>+7.1f}%")
+
+
+def parse_list(value, cast=str):
+    return [cast(item) for item in value.split(',') if item]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='start the app and run the scenarios')
+    run_parser.add_argument('--scenarios', type=parse_list, default=['browse', 'results', 'upload', 'admin', 'mixed'],
+                            help=f"comma separated, from {', '.join(SCENARIOS)}")
+    run_parser.add_argument('--concurrency', type=lambda value: parse_list(value, int), default=[1, 4, 16, 32])
+    run_parser.add_argument('--duration', type=float, default=15, help='measured seconds per step')
+    run_parser.add_argument('--warmup', type=float, default=2, help='unmeasured seconds before each step')
+    run_parser.add_argument('--mongo', choices=['memory', 'local', 'uri'], default='memory')
+    run_parser.add_argument('--mongo-uri')
+    run_parser.add_argument('--no-seed', action='store_true', help='use the data already in --mongo uri')
+    run_parser.add_argument('--users', type=int, default=200)
+    run_parser.add_argument('--uploads', type=int, default=2000)
+    run_parser.add_argument('--queries', type=int, default=300)
+    run_parser.add_argument('--seed', type=int, default=0)
+    run_parser.add_argument('--model', choices=['stub', 'real'], default='stub')
+    run_parser.add_argument('--model-latency-ms', type=float, default=40, help='stub model inference time')
+    run_parser.add_argument('--cloudinary-latency-ms', type=float, default=0)
+    run_parser.add_argument('--images', help='folder of images to upload (default: generated JPEGs)')
+    run_parser.add_argument('--server', choices=['werkzeug', 'gunicorn'], default='werkzeug')
+    run_parser.add_argument('--workers', type=int, default=2)
+    run_parser.add_argument('--threads', type=int, default=4)
+    run_parser.add_argument('--output', help='result file (default: load_results/<commit>-<time>.json)')
+    run_parser.set_defaults(func=run)
+
+    compare_parser = commands.add_parser('compare', help='compare two result files')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('candidate')
+    compare_parser.set_defaults(func=compare)
+
+    serve_parser = commands.add_parser('serve', help=argparse.SUPPRESS)
+    serve_parser.add_argument('--port', type=int, required=True)
+    serve_parser.add_argument('--seed-counts', type=lambda value: parse_list(value, int), default=[200, 2000, 300, 0])
+    serve_parser.set_defaults(func=lambda options: serve(options.port, options.seed_counts))
+
+    options = parser.parse_args(argv)
+    unknown = [scenario for scenario in getattr(options, 'scenarios', []) if scenario not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+    options.func(options)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,62 +1,342 @@
 # check_model.py
-import tensorflow as tf
-import numpy as np
+"""
+Model diagnostics and benchmark
+
+    python ml_model/check_model.py                         # full run, JSON in ml_model/benchmarks/
+    python ml_model/check_model.py --quick                 # sanity checks and a short benchmark
+    python ml_model/check_model.py --model other.h5 --batch-sizes 1,8,32 --threads 1,2,4
+    python ml_model/check_model.py --compare old.json new.json
+
+Measures cold load time, warm single-image latency (model.predict as the app
+calls it and a direct model call), throughput at batch sizes 1-64, how
+throughput scales with TensorFlow intra-op / inter-op threads (each setting
+in a fresh process, since TensorFlow fixes its pools at start-up) and peak
+memory, and checks the outputs: softmax sums, value ranges, determinism and
+that the class mapping matches the model. Exits with 1 if a check fails.
+"""
+import argparse
+import hashlib
 import json
+import math
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+MODEL_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_MODEL = os.path.join(MODEL_DIR, 'pest_grouped_model_v1.h5')
+DEFAULT_MAPPING = os.path.join(MODEL_DIR, 'class_mapping.json')
+RESULTS_DIR = os.path.join(MODEL_DIR, 'benchmarks')
+
+BATCH_SIZES = [1, 2, 4, 8, 16, 32, 64]
+IMG_SIZE = 224
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(fraction * len(sorted_values))
+    return sorted_values[max(0, min(len(sorted_values), rank) - 1)]
+
+
+def summarize_ms(seconds):
+    values = sorted(value * 1000 for value in seconds)
+    return {
+        'runs': len(values),
+        'mean': round(sum(values) / len(values), 2),
+        'p50': round(percentile(values, 0.50), 2),
+        'p95': round(percentile(values, 0.95), 2),
+        'p99': round(percentile(values, 0.99), 2),
+        'min': round(values[0], 2),
+        'max': round(values[-1], 2),
+    }
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process so far"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / 1024 if sys.platform != 'darwin' else peak / 2 ** 20, 1)
+
+
+def file_info(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return {
+        'path': os.path.abspath(path),
+        'size_mb': round(os.path.getsize(path) / 2 ** 20, 2),
+        'sha256': digest.hexdigest(),
+        'modified': datetime.fromtimestamp(os.path.getmtime(path)).isoformat(timespec='seconds'),
+    }
+
+
+def load(model_path, intra=None, inter=None):
+    """(tf, model, timings) with TensorFlow thread pools configured before first use"""
+    started = time.perf_counter()
+    import tensorflow as tf
+    imported = time.perf_counter()
+    if intra:
+        tf.config.threading.set_intra_op_parallelism_threads(intra)
+    if inter:
+        tf.config.threading.set_inter_op_parallelism_threads(inter)
+    model = tf.keras.models.load_model(model_path)
+    loaded = time.perf_counter()
+    return tf, model, {
+        'import_tensorflow_s': round(imported - started, 3),
+        'load_model_s': round(loaded - imported, 3),
+        'total_s': round(loaded - started, 3),
+    }
 
-print("=" * 60)
-print("MODEL DIAGNOSTIC CHECK")
-print("=" * 60)
-
-try:
-    # 1. Load model
-    print("1. Loading model...")
-    model = tf.keras.models.load_model("pest_grouped_model_v1.h5")
-    print("   ✓ Model loaded successfully")
-    
-    # 2. Check model summary
-    print("\n2. Model architecture:")
-    model.summary()
-    
-    # 3. Check output shape
-    print(f"\n3. Output shape: {model.output_shape}")
-    print(f"   Number of classes expected: {model.output_shape[-1]}")
-    
-    # 4. Load class mapping
-    print("\n4. Loading class mapping...")
-    with open("class_mapping.json") as f:
+
+def inputs(batch, seed=0):
+    import numpy as np
+    return np.random.default_rng(seed).random((batch, IMG_SIZE, IMG_SIZE, 3), dtype=np.float32)
+
+
+# ==================== CHECKS ====================
+
+def sanity_checks(model, mapping_path):
+    """List of {'name', 'passed', 'detail'}"""
+    import numpy as np
+
+    checks = []
+
+    def check(name, passed, detail=''):
+        checks.append({'name': name, 'passed': bool(passed), 'detail': detail})
+        print(f"   {'✓' if passed else '✗'} {name}{': ' + detail if detail else ''}")
+
+    with open(mapping_path, encoding='utf-8') as f:
         class_map = json.load(f)
-    print(f"   Class mapping: {class_map}")
-    print(f"   Number of classes in mapping: {len(class_map)}")
-    
-    # 5. Test with random input
-    print("\n5. Testing with random input...")
-    test_input = np.random.random((1, 224, 224, 3))
-    predictions = model.predict(test_input)[0]
-    
-    print(f"   Predictions shape: {predictions.shape}")
-    print(f"   Predictions sum: {np.sum(predictions):.4f} (should be ~1.0)")
-    
-    # Check if all predictions are the same
-    unique_values = np.unique(predictions)
-    print(f"   Unique prediction values: {len(unique_values)}")
-    
-    if len(unique_values) == 1:
-        print("   ✗ CRITICAL: All predictions are the same!")
-        print(f"   All values are: {unique_values[0]}")
-    else:
-        print("   ✓ Predictions vary across classes")
-        
-    # Show top predictions
-    sorted_indices = np.argsort(predictions)[::-1]
-    print("\n   Top 3 predictions:")
-    for i, idx in enumerate(sorted_indices[:3]):
-        class_name = class_map.get(str(idx), f"Class {idx}")
-        confidence = predictions[idx] * 100
-        print(f"   {i+1}. {class_name}: {confidence:.2f}%")
-        
-except Exception as e:
-    print(f"✗ Error: {e}")
-    import traceback
-    traceback.print_exc()
-
-print("=" * 60)
\ No newline at end of file
+    classes = model.output_shape[-1]
+    check('class map keys are 0..n-1', sorted(class_map, key=int) == [str(i) for i in range(len(class_map))],
+          f"{len(class_map)} entries")
+    check('class names are unique', len(set(class_map.values())) == len(class_map))
+    check('class map matches model outputs', classes == len(class_map), f"model {classes}, mapping {len(class_map)}")
+    check('model input is 224x224 RGB', tuple(model.input_shape[1:]) == (IMG_SIZE, IMG_SIZE, 3), str(model.input_shape))
+
+    batch = inputs(8, seed=1)
+    predictions = model.predict(batch, verbose=0)
+    sums = predictions.sum(axis=1)
+    check('outputs are finite', np.isfinite(predictions).all())
+    check('outputs are in [0, 1]', (predictions >= 0).all() and (predictions <= 1 + 1e-6).all())
+    check('softmax sums to 1', np.allclose(sums, 1.0, atol=1e-3), f"min {sums.min():.5f}, max {sums.max():.5f}")
+    check('predictions vary across classes', all(len(np.unique(row)) > 1 for row in predictions))
+    check('different inputs give different outputs', not np.allclose(predictions[0], predictions[1]))
+    again = model.predict(batch, verbose=0)
+    check('same input gives the same output', np.allclose(predictions, again, atol=1e-5))
+    single = model.predict(batch[:1], verbose=0)
+    check('batch of 1 matches the batched result', np.allclose(single[0], predictions[0], atol=1e-4))
+    top = np.argmax(predictions, axis=1)
+    check('top class indices are mapped', all(str(int(i)) in class_map for i in top),
+          ', '.join(class_map.get(str(int(i)), '?') for i in top[:3]))
+    return checks
+
+
+# ==================== BENCHMARKS ====================
+
+def latency(model, runs, warmup=5):
+    """Warm single-image latency through model.predict (as predictor.py) and a direct call"""
+    batch = inputs(1)
+    for _ in range(warmup):
+        model.predict(batch, verbose=0)
+        model(batch, training=False)
+    timings = {'predict': [], 'call': []}
+    for _ in range(runs):
+        started = time.perf_counter()
+        model.predict(batch, verbose=0)
+        timings['predict'].append(time.perf_counter() - started)
+        started = time.perf_counter()
+        model(batch, training=False).numpy()
+        timings['call'].append(time.perf_counter() - started)
+    return {name: summarize_ms(values) for name, values in timings.items()}
+
+
+def time_batches(model, size, seconds):
+    """Seconds per direct model call on batches of `size`, for at least `seconds` (3 calls minimum)"""
+    batch = inputs(size)
+    model(batch, training=False).numpy()  # trace / warm up this shape
+    timings = []
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline or len(timings) < 3:
+        started = time.perf_counter()
+        model(batch, training=False).numpy()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def throughput(model, batch_sizes, seconds):
+    """Images per second and per-batch latency at each batch size (direct model call)"""
+    results = []
+    for size in batch_sizes:
+        timings = time_batches(model, size, seconds)
+        results.append({
+            'batch_size': size,
+            'images_per_s': round(size * len(timings) / sum(timings), 1),
+            'batch_latency_ms': summarize_ms(timings),
+        })
+        print(f"   batch {size:>3}: {results[-1]['images_per_s']:>8.1f} images/s, "
+              f"p50 {results[-1]['batch_latency_ms']['p50']:.1f} ms per batch")
+    return results
+
+
+def thread_scaling(model_path, thread_counts, batch_sizes, seconds):
+    """Throughput per (intra, inter) setting, each measured in a fresh process"""
+    settings = [(intra, 1) for intra in thread_counts] + [(max(thread_counts), inter) for inter in thread_counts if inter > 1]
+    results = []
+    for intra, inter in settings:
+        command = [sys.executable, os.path.abspath(__file__), '--model', model_path, '--worker',
+                   '--intra', str(intra), '--inter', str(inter),
+                   '--batch-sizes', ','.join(map(str, batch_sizes)), '--seconds', str(seconds)]
+        try:
+            output = subprocess.run(command, capture_output=True, text=True, check=True, timeout=900).stdout
+            measured = json.loads(output.strip().splitlines()[-1])
+        except (subprocess.SubprocessError, ValueError, IndexError) as e:
+            print(f"   intra {intra} / inter {inter}: failed ({e})")
+            continue
+        results.append(measured)
+        rates = ', '.join(f"b{entry['batch_size']} {entry['images_per_s']:.1f}/s" for entry in measured['throughput'])
+        print(f"   intra {intra:>2} / inter {inter:>2}: {rates}")
+    return results
+
+
+def worker(options):
+    """One thread setting, printed as a JSON line for thread_scaling()"""
+    _, model, timings = load(options.model, options.intra, options.inter)
+    results = []
+    for size in parse_ints(options.batch_sizes):
+        runs = time_batches(model, size, options.seconds)
+        results.append({'batch_size': size, 'images_per_s': round(size * len(runs) / sum(runs), 1),
+                        'p50_ms': round(percentile(sorted(runs), 0.5) * 1000, 2)})
+    print(json.dumps({'intra_op_threads': options.intra, 'inter_op_threads': options.inter,
+                      'load': timings, 'throughput': results, 'peak_rss_mb': peak_rss_mb()}))
+
+
+# ==================== REPORT ====================
+
+def run(options):
+    print("=" * 60)
+    print("MODEL DIAGNOSTIC CHECK")
+    print("=" * 60)
+    report = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'model': file_info(options.model),
+        'environment': {'python': sys.version.split()[0], 'platform': platform.platform(),
+                        'cpus': os.cpu_count()},
+    }
+    report['model']['version'] = options.model_version or os.path.splitext(os.path.basename(options.model))[0]
+
+    print("1. Loading model (cold)...")
+    rss_before = peak_rss_mb()
+    tf, model, timings = load(options.model)
+    report['environment']['tensorflow'] = tf.__version__
+    report['load'] = dict(timings, rss_increase_mb=round(peak_rss_mb() - rss_before, 1))
+    print(f"   ✓ TensorFlow import {timings['import_tensorflow_s']}s, load_model {timings['load_model_s']}s")
+    report['model']['parameters'] = int(model.count_params())
+    report['model']['input_shape'] = list(model.input_shape)
+    report['model']['output_shape'] = list(model.output_shape)
+
+    print("\n2. Sanity checks...")
+    report['checks'] = sanity_checks(model, options.mapping)
+    passed = all(check['passed'] for check in report['checks'])
+
+    runs = 10 if options.quick else options.runs
+    print(f"\n3. Warm single-image latency ({runs} runs)...")
+    report['latency_ms'] = latency(model, runs)
+    for name, summary in report['latency_ms'].items():
+        print(f"   model.{name}: p50 {summary['p50']} ms, p95 {summary['p95']} ms, p99 {summary['p99']} ms")
+
+    batch_sizes = [1, 8] if options.quick else parse_ints(options.batch_sizes)
+    seconds = 1.0 if options.quick else options.seconds
+    print(f"\n4. Throughput by batch size ({seconds}s each)...")
+    report['throughput'] = throughput(model, batch_sizes, seconds)
+
+    if not options.quick and not options.skip_threads:
+        cpus = os.cpu_count() or 1
+        thread_counts = parse_ints(options.threads) if options.threads else sorted(n for n in {1, 2, 4, 8, cpus} if n <= cpus)
+        print(f"\n5. Thread scaling (intra-op {thread_counts}, fresh process each)...")
+        report['threads'] = thread_scaling(options.model, thread_counts, [1, min(16, max(batch_sizes))], seconds)
+
+    report['memory'] = {'peak_rss_mb': peak_rss_mb()}
+    print(f"\n6. Peak memory: {report['memory']['peak_rss_mb']} MB")
+    report['passed'] = passed
+
+    output = options.output or os.path.join(
+        RESULTS_DIR, f"{report['model']['version']}-{report['model']['sha256'][:8]}-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print("=" * 60)
+    print(f"{'✓ All checks passed' if passed else '✗ Some checks FAILED'} - results in {output}")
+    print("=" * 60)
+    return 0 if passed else 1
+
+
+def compare(baseline_path, candidate_path):
+    """Key numbers of two result files side by side"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)
+    with open(candidate_path, encoding='utf-8') as f:
+        candidate = json.load(f)
+
+    def row(label, old, new, higher_is_better=False):
+        change = (new / old - 1) * 100 if old else 0.0
+        worse = change < -5 if higher_is_better else change > 5
+        print(f"{label:<32} {old:>10} {new:>10} {change:>+8.1f}%{'  <- regression' if worse else ''}")
+
+    print(f"{'':<32} {baseline['model']['version'][:10]:>10} {candidate['model']['version'][:10]:>10}")
+    row('load_model s', baseline['load']['load_model_s'], candidate['load']['load_model_s'])
+    for name in ('predict', 'call'):
+        row(f'single image {name} p50 ms', baseline['latency_ms'][name]['p50'], candidate['latency_ms'][name]['p50'])
+        row(f'single image {name} p99 ms', baseline['latency_ms'][name]['p99'], candidate['latency_ms'][name]['p99'])
+    old_rates = {entry['batch_size']: entry['images_per_s'] for entry in baseline['throughput']}
+    for entry in candidate['throughput']:
+        if entry['batch_size'] in old_rates:
+            row(f"batch {entry['batch_size']} images/s", old_rates[entry['batch_size']], entry['images_per_s'], True)
+    row('peak RSS MB', baseline['memory']['peak_rss_mb'], candidate['memory']['peak_rss_mb'])
+    print(f"checks passed: {baseline.get('passed')} -> {candidate.get('passed')}")
+
+
+def parse_ints(value):
+    return [int(item) for item in str(value).split(',') if item]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Model diagnostics and benchmark')
+    parser.add_argument('--model', default=DEFAULT_MODEL)
+    parser.add_argument('--mapping', default=DEFAULT_MAPPING)
+    parser.add_argument('--model-version', help='label for the results (default: model file name)')
+    parser.add_argument('--runs', type=int, default=100, help='single-image latency runs')
+    parser.add_argument('--batch-sizes', default=','.join(map(str, BATCH_SIZES)))
+    parser.add_argument('--seconds', type=float, default=3.0, help='measuring time per batch size')
+    parser.add_argument('--threads', help='intra/inter-op thread counts to try, e.g. 1,2,4,8 (default: up to the CPU count)')
+    parser.add_argument('--skip-threads', action='store_true')
+    parser.add_argument('--quick', action='store_true', help='checks plus a short benchmark')
+    parser.add_argument('--output', help='result file (default: ml_model/benchmarks/<version>-<sha>-<time>.json)')
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CANDIDATE'))
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--intra', type=int, default=0, help=argparse.SUPPRESS)
+    parser.add_argument('--inter', type=int, default=0, help=argparse.SUPPRESS)
+    options = parser.parse_args(argv)
+
+    if options.compare:
+        compare(*options.compare)
+        return 0
+    if options.worker:
+        worker(options)
+        return 0
+    try:
+        return run(options)
+    except Exception as e:
+        print(f"✗ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
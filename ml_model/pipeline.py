@@ -0,0 +1,248 @@
+# pipeline.py
+"""
+Pipelined decode -> batch -> model for many images at once
+
+Decoding and resizing a phone photo in PIL takes longer than running the
+model on it, and done serially before the model call the two never overlap.
+PIL releases the GIL while it decodes and resizes, so here a bounded thread
+pool decodes into a TensorRing (ml_model/tensor_ring.py) while the calling
+thread runs the model on whole batches of already decoded slots:
+
+    pipeline = InferencePipeline(predictor.predict_batch, predictor.IMG_SIZE)
+    for result in pipeline.map(paths_or_bytes):
+        ...                                    # results in input order
+
+Backpressure: an image is only read and handed to a decoder once it has a
+free slot, so memory stays at `slots` tensors plus `decode_threads` images
+being decoded, however many images are queued. A slow model makes the
+decoders wait; slow decoding shrinks the batches instead of stalling them.
+
+    python generate_dataset.py images bench_images --count 1000 --size 4032x3024
+    python -m ml_model.pipeline bench_images                   # serial vs pipelined
+    python -m ml_model.pipeline bench_images --threads 2,4,8 --batch 8,16,32
+"""
+import argparse
+import json
+import logging
+import os
+import resource
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from ml_model.tensor_ring import TensorRing, decode_into
+
+log = logging.getLogger(__name__)
+
+MODEL_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(MODEL_DIR, 'benchmarks')
+
+
+def read_item(item):
+    """Image bytes from bytes, a path or a file-like object"""
+    if isinstance(item, (bytes, bytearray, memoryview)):
+        return item
+    if isinstance(item, (str, os.PathLike)):
+        with open(item, 'rb') as f:
+            return f.read()
+    return item.read()
+
+
+class InferencePipeline:
+    """Bounded decode pool feeding batched inference, results in input order"""
+
+    def __init__(self, predict_batch, img_size, decode_threads=None, max_batch=16,
+                 slots=None, linger_ms=5.0):
+        """
+        predict_batch(tensors) -> one result dict per image (predictor.predict_batch)
+        slots defaults to the batch being run plus the next one (and at least one per decoder)
+        """
+        self.predict_batch = predict_batch
+        self.decode_threads = decode_threads or min(8, os.cpu_count() or 1)
+        self.max_batch = max_batch
+        self.ring = TensorRing(slots or max(2 * max_batch, self.decode_threads + max_batch), img_size)
+        self.linger = linger_ms / 1000
+        self.batches = 0
+        self.decode_seconds = 0.0
+        self.inference_seconds = 0.0
+        self._lock = threading.Lock()
+        # One map() at a time: the ring hands out slots in input order
+        self._running = threading.Lock()
+
+    def _decode(self, decode, slot, item):
+        started = time.perf_counter()
+        try:
+            decode(item, self.ring.tensors[slot])
+            self.ring.publish(slot)
+        except Exception as e:
+            log.warning("Could not decode image: %s", e)
+            self.ring.publish(slot, error=str(e))
+        with self._lock:
+            self.decode_seconds += time.perf_counter() - started
+
+    def _feed(self, items, decode, pool, state, stop):
+        """Hand items to the decoders as slots come free (runs in its own thread)"""
+        try:
+            for item in items:
+                while True:
+                    try:
+                        slot = self.ring.acquire(timeout=0.1)
+                        break
+                    except TimeoutError:
+                        if stop.is_set():
+                            return
+                if stop.is_set():
+                    self.ring.release(slot)
+                    return
+                state['submitted'] += 1
+                pool.submit(self._decode, decode, slot, item)
+        except Exception as e:
+            state['error'] = e
+        finally:
+            state['done'] = True
+
+    def map(self, items, decode=None):
+        """
+        Yield one result dict per item, in order; items are bytes, paths or file objects,
+        or anything decode(item, out) can write into an input tensor
+        """
+        decode = decode or (lambda item, out: decode_into(read_item(item), out))
+        with self._running:
+            state = {'submitted': 0, 'done': False, 'error': None}
+            stop = threading.Event()
+            yielded = 0
+            with ThreadPoolExecutor(self.decode_threads, thread_name_prefix='decode') as pool:
+                feeder = threading.Thread(target=self._feed, args=(items, decode, pool, state, stop),
+                                          name='pipeline-feed', daemon=True)
+                feeder.start()
+                try:
+                    while not (state['done'] and yielded == state['submitted']):
+                        batch = self.ring.take(self.max_batch, timeout=0.1, linger=self.linger)
+                        if batch is None:
+                            continue
+                        try:
+                            results = self._run(batch)
+                        finally:
+                            self.ring.release(batch)
+                        for result in results:
+                            yielded += 1
+                            yield result
+                    if state['error'] is not None:
+                        raise state['error']
+                finally:
+                    stop.set()
+                    feeder.join()
+                    # Slots still being decoded when the caller stopped early
+                    pool.shutdown(wait=True)
+                    self._drain()
+
+    def _run(self, batch):
+        started = time.perf_counter()
+        try:
+            results = self.predict_batch(batch.tensors)
+        except Exception as e:
+            log.exception("Batch inference failed: %s", e)
+            results = [{"success": False, "error": str(e)} for _ in range(batch.count)]
+        with self._lock:
+            self.batches += 1
+            self.inference_seconds += time.perf_counter() - started
+        # A slot that failed to decode ran as zeros; report the decode error instead
+        return [{"success": False, "error": f'decode failed: {error}'} if error else result
+                for result, error in zip(results, batch.errors)]
+
+    def _drain(self):
+        while True:
+            batch = self.ring.take(self.ring.slots, timeout=0)
+            if batch is None:
+                return
+            self.ring.release(batch)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'decode_threads': self.decode_threads,
+                'max_batch': self.max_batch,
+                'batches': self.batches,
+                'avg_batch': round(self.ring.acquired / self.batches, 2) if self.batches else 0.0,
+                'decode_s': round(self.decode_seconds, 3),
+                'inference_s': round(self.inference_seconds, 3),
+                'ring': self.ring.stats(),
+            }
+
+
+# ==================== BENCHMARK ====================
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / 1024 if sys.platform != 'darwin' else peak / 2 ** 20, 1)
+
+
+def serial(paths, predictor):
+    """The current path: read, decode and predict one image at a time"""
+    started = time.perf_counter()
+    for path in paths:
+        predictor.predict_pest(read_item(path))
+    return len(paths) / (time.perf_counter() - started)
+
+
+def pipelined(paths, predictor, threads, batch):
+    pipeline = InferencePipeline(predictor.predict_batch, predictor.IMG_SIZE, decode_threads=threads, max_batch=batch)
+    started = time.perf_counter()
+    failed = sum(not result['success'] for result in pipeline.map(paths))
+    rate = len(paths) / (time.perf_counter() - started)
+    return rate, failed, pipeline.stats()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serial vs pipelined decode and inference throughput')
+    parser.add_argument('images', help='folder of images, e.g. from generate_dataset.py images')
+    parser.add_argument('--count', type=int, default=1000)
+    parser.add_argument('--threads', default=','.join(str(n) for n in sorted({1, 2, 4, os.cpu_count() or 1})),
+                        help='decode thread counts to try')
+    parser.add_argument('--batch', default='1,8,16,32', help='batch sizes to try')
+    parser.add_argument('--skip-serial', action='store_true')
+    parser.add_argument('--output', help='result file (default: ml_model/benchmarks/pipeline-<time>.json)')
+    options = parser.parse_args(argv)
+
+    paths = sorted(os.path.join(options.images, name) for name in os.listdir(options.images)
+                   if name.lower().endswith(('.jpg', '.jpeg', '.png', '.webp')))[:options.count]
+    if not paths:
+        sys.exit(f"No images in {options.images}")
+    from ml_model import predictor
+    # Warm the model up so the first configuration does not pay for it
+    predictor.predict_pest(read_item(paths[0]))
+
+    print("=" * 60)
+    print(f"PIPELINE BENCHMARK ({len(paths)} images from {options.images}, {os.cpu_count()} CPUs)")
+    print("=" * 60)
+    report = {'created_at': datetime.now().isoformat(timespec='seconds'), 'images': len(paths),
+              'directory': os.path.abspath(options.images), 'cpus': os.cpu_count(), 'pipelined': []}
+    if not options.skip_serial:
+        report['serial_images_per_s'] = round(serial(paths, predictor), 1)
+        print(f"   serial                    {report['serial_images_per_s']:>8.1f} images/s")
+
+    for threads in [int(value) for value in options.threads.split(',')]:
+        for batch in [int(value) for value in options.batch.split(',')]:
+            rate, failed, stats = pipelined(paths, predictor, threads, batch)
+            report['pipelined'].append({'decode_threads': threads, 'max_batch': batch,
+                                        'images_per_s': round(rate, 1), 'failed': failed, 'stats': stats})
+            print(f"   {threads:>2} threads, batch {batch:>3}     {rate:>8.1f} images/s  "
+                  f"avg batch {stats['avg_batch']:>5}  backpressure waits {stats['ring']['waits']}")
+    report['peak_rss_mb'] = peak_rss_mb()
+
+    best = max(report['pipelined'], key=lambda row: row['images_per_s'])
+    print(f"\nBest: {best['decode_threads']} threads, batch {best['max_batch']} "
+          f"({best['images_per_s']} images/s), peak RSS {report['peak_rss_mb']} MB")
+    output = options.output or os.path.join(RESULTS_DIR, f"pipeline-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results in {output}")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,25 @@
 # ml_model/predictor.py
-import tensorflow as tf
 import numpy as np
-from PIL import Image
-import io
 import json
+import logging
 import os
+from contextlib import nullcontext
+
+from ml_model import runtime
+from ml_model.tensor_ring import TensorRing, decode_into, load_rgb, scale_into
+from ml_model.tta import augmented_batch, parse_mode, parse_views
+from ml_model import tiling
+
+log = logging.getLogger(__name__)
+
+# Thread pools and CPU affinity must be set before TensorFlow starts (ml_model/runtime.py)
+runtime.configure()
+import tensorflow as tf
 
 # Get the directory of this file
 MODEL_DIR = os.path.dirname(os.path.abspath(__file__))
 
-print("🔄 Loading Pest Detection Model...")
+log.info("Loading Pest Detection Model...")
 MODEL_PATH = os.path.join(MODEL_DIR, 'pest_grouped_model_v1.h5')
 model = tf.keras.models.load_model(MODEL_PATH)
 
@@ -22,45 +32,148 @@ with open(MAPPING_PATH, 'r') as f:
 class_names = [class_map[str(i)] for i in range(len(class_map))]
 IMG_SIZE = 224
 
-print(f"✅ Model loaded! Found {len(class_names)} pest classes")
-print(f"🐛 Classes: {class_names}")
+log.info("Model loaded! Found %s pest classes", len(class_names))
+log.info("Classes: %s", class_names)
+
+# Input tensors for concurrent requests, preallocated once (ml_model/tensor_ring.py);
+# a request waits at most MODEL_RING_TIMEOUT seconds for a free one
+ring = TensorRing(int(os.getenv('MODEL_RING_SLOTS', '4')), IMG_SIZE)
+RING_TIMEOUT = float(os.getenv('MODEL_RING_TIMEOUT', '30'))
+
+# Test-time augmentation (ml_model/tta.py): off, auto (first pass below the threshold) or always
+TTA_MODE = parse_mode(os.getenv('MODEL_TTA'))
+TTA_THRESHOLD = float(os.getenv('MODEL_TTA_THRESHOLD', '60'))
+TTA_VIEWS = parse_views(os.getenv('MODEL_TTA_VIEWS'))
+
+def preprocess(image_bytes):
+    """Decode image bytes into the model's input batch (1, IMG_SIZE, IMG_SIZE, 3)"""
+    batch = np.empty((1, IMG_SIZE, IMG_SIZE, 3), dtype=np.float32)
+    decode_into(image_bytes, batch[0])
+    return batch
+
+def _result(predictions):
+    """Result dict for one row of model output"""
+    # Get top prediction
+    top_idx = int(np.argmax(predictions))
+    predicted_class = class_names[top_idx]
+    confidence = float(predictions[top_idx]) * 100
+    
+    # Get all predictions
+    all_predictions = {}
+    for i, class_name in enumerate(class_names):
+        all_predictions[class_name] = round(float(predictions[i]) * 100, 2)
+    
+    log.debug("Predicted: %s (%.1f%%)", predicted_class, confidence,
+              extra={'pest': predicted_class, 'confidence': round(confidence, 2)})
+    
+    return {
+        "success": True,
+        "predicted_class": predicted_class,
+        "confidence": round(confidence, 2),
+        "all_predictions": all_predictions
+    }
+
+def predict_array(img_batch):
+    """Run the model on a preprocessed batch; same result dict as predict_pest (first image)"""
+    return predict_batch(img_batch[:1])[0]
+
+def predict_batch(img_batch):
+    """Run the model once on a preprocessed batch; one result dict per image"""
+    predictions = model.predict(img_batch, verbose=0)
+    return [_result(row) for row in predictions]
+
+def predict_many(images, decode_threads=None, max_batch=16):
+    """Results for many images (bytes or paths), in order, decoding in parallel with batched inference"""
+    from ml_model.pipeline import InferencePipeline
+    pipeline = InferencePipeline(predict_batch, IMG_SIZE, decode_threads=decode_threads, max_batch=max_batch)
+    return list(pipeline.map(images))
+
+def scan_frames(frames, report, diff_threshold=None, max_batch=16):
+    """Per-frame records of a video or photo burst scan (ml_model/video.py), filling in report"""
+    from ml_model import video
+    threshold = video.DIFF_THRESHOLD if diff_threshold is None else diff_threshold
+    return video.scan(frames, predict_batch, IMG_SIZE, report, diff_threshold=threshold, max_batch=max_batch)
+
+def predict_tta(img, first_pass, base=None, views=None):
+    """Average first_pass (the model output for img) with the augmented views, in one batch"""
+    outputs = model.predict(augmented_batch(img, IMG_SIZE, views or TTA_VIEWS, base=base), verbose=0)
+    return np.vstack([first_pass[None], outputs]).mean(axis=0)
 
-def predict_pest(image_bytes):
+def predict_tiles(image_bytes, span=nullcontext, scales=None, max_tiles=None, batch_size=None,
+                  min_confidence=None):
     """
-    Predict pest from image bytes
-    Returns: dict with predicted_class, confidence, all_predictions
+    Tiled prediction for large photos with several pests (ml_model/tiling.py)
+    Returns: predict_pest's dict (from the per-class maximum over tiles)
+    plus detections (class, confidence, box per tile) and summary
     """
     try:
-        # Open and preprocess image
-        img = Image.open(io.BytesIO(image_bytes)).convert("RGB")
-        img = img.resize((IMG_SIZE, IMG_SIZE))
-        img_array = np.array(img) / 255.0
-        img_batch = np.expand_dims(img_array, axis=0)
-        
-        # Make prediction
-        predictions = model.predict(img_batch, verbose=0)[0]
-        
-        # Get top prediction
-        top_idx = int(np.argmax(predictions))
-        predicted_class = class_names[top_idx]
-        confidence = float(predictions[top_idx]) * 100
+        with span('decode'):
+            img, width, height, tiles, skipped = tiling.load(image_bytes, scales or tiling.SCALES,
+                                                             max_tiles=max_tiles or tiling.MAX_TILES, tile=IMG_SIZE)
+        batch = np.empty((min(batch_size or tiling.BATCH_SIZE, len(tiles)), IMG_SIZE, IMG_SIZE, 3), dtype=np.float32)
         
-        # Get all predictions
-        all_predictions = {}
-        for i, class_name in enumerate(class_names):
-            all_predictions[class_name] = round(float(predictions[i]) * 100, 2)
+        outputs = []
+        with span('inference'):
+            for filled in tiling.fill_batches(img, tiles, batch, width, height, tile=IMG_SIZE):
+                outputs.append(model.predict(batch[:filled], verbose=0))
         
-        print(f"✅ Predicted: {predicted_class} ({confidence:.1f}%)")
+        result = tiling.summarize(tiles, np.vstack(outputs), width, height, class_names,
+                                  tiling.MIN_CONFIDENCE if min_confidence is None else min_confidence)
+        result['summary']['skipped_scales'] = skipped
+        log.debug("Tiled prediction: %s tiles, %s detections", len(tiles), len(result['detections']))
+        return result
         
+    except Exception as e:
+        log.exception("Tiled prediction failed: %s", e)
         return {
-            "success": True,
-            "predicted_class": predicted_class,
-            "confidence": round(confidence, 2),
-            "all_predictions": all_predictions
+            "success": False,
+            "error": str(e)
         }
+
+def predict_pest(image_bytes, span=nullcontext, tta=None):
+    """
+    Predict pest from image bytes
+    span(name) is an optional timing context manager (user/utils/timing.py)
+    tta: 'off', 'auto' or 'always' (default MODEL_TTA)
+    Returns: dict with predicted_class, confidence, all_predictions
+    (and tta with the first-pass answer when augmentation ran)
+    """
+    try:
+        try:
+            slot = ring.acquire(timeout=RING_TIMEOUT)
+        except TimeoutError as e:
+            log.warning("Prediction rejected: %s for %ss", e, RING_TIMEOUT)
+            return {
+                "success": False,
+                "error": f"Model busy: {e}"
+            }
+        try:
+            with span('decode'):
+                img = load_rgb(image_bytes)
+                base = img.resize((IMG_SIZE, IMG_SIZE))
+                scale_into(base, ring.tensors[slot])
+            
+            with span('inference'):
+                first_pass = model.predict(ring.tensors[slot:slot + 1], verbose=0)[0]
+            result = _result(first_pass)
+            
+            # Still holding the slot, so MODEL_RING_SLOTS also bounds the augmented batches
+            mode = parse_mode(tta) if tta else TTA_MODE
+            if mode == 'always' or (mode == 'auto' and result['confidence'] < TTA_THRESHOLD):
+                with span('tta'):
+                    averaged = predict_tta(img, first_pass, base=base)
+                first = result
+                result = _result(averaged)
+                result['tta'] = {
+                    'views': len(TTA_VIEWS) + 1,
+                    'first_pass': {'predicted_class': first['predicted_class'], 'confidence': first['confidence']},
+                }
+        finally:
+            ring.release(slot)
+        return result
         
     except Exception as e:
-        print(f"❌ Error: {e}")
+        log.exception("Prediction failed: %s", e)
         return {
             "success": False,
             "error": str(e)
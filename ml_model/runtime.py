@@ -0,0 +1,340 @@
+# runtime.py
+"""
+TensorFlow threading and CPU affinity for one serving process
+
+By default every TensorFlow runtime sizes its intra-op and inter-op pools to
+all cores, so four gunicorn workers on an 8-core box start 64+ busy threads
+and latency collapses under load. configure() runs before TensorFlow is
+imported (predictor.py does this) and gives each worker its share instead:
+
+    MODEL_WORKERS        processes sharing the machine (default: WEB_CONCURRENCY or 1)
+    MODEL_WORKER_INDEX   this process's slot, 0-based (set by gunicorn.conf.py)
+    MODEL_CPUS           CPUs to share out, e.g. "0-7" or "0,2,4,6" (default: this process's affinity)
+    MODEL_CPU_PIN        1 to pin the worker to its slice of MODEL_CPUS (default: 0)
+    TF_INTRA_OP_THREADS  threads inside one op (default: CPUs / workers)
+    TF_INTER_OP_THREADS  ops run in parallel (default: 1, or 2 with 4+ CPUs per worker)
+
+Set a thread variable to 0 to keep TensorFlow's own default.
+
+Benchmark mode finds the best settings for the machine: for each worker
+count it starts that many processes at once, each with a candidate setting,
+and measures single-image throughput and latency the way /predict runs:
+
+    python -m ml_model.runtime                       # workers 1,2,4 up to the CPU count
+    python -m ml_model.runtime --workers 4 --seconds 10
+    python -m ml_model.runtime --show                # what configure() would apply here
+"""
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+log = logging.getLogger(__name__)
+
+MODEL_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(MODEL_DIR, 'benchmarks')
+
+# Settings applied by configure() in this process, for /admin/api/model/runtime
+_applied = {}
+
+
+def parse_cpus(value):
+    """'0-3,8,10-11' -> [0, 1, 2, 3, 8, 10, 11]"""
+    cpus = set()
+    for part in value.replace(' ', '').split(','):
+        if not part:
+            continue
+        if '-' in part:
+            first, last = part.split('-', 1)
+            cpus.update(range(int(first), int(last) + 1))
+        else:
+            cpus.add(int(part))
+    return sorted(cpus)
+
+
+def format_cpus(cpus):
+    """[0, 1, 2, 3, 8] -> '0-3,8'"""
+    ranges = []
+    for cpu in sorted(cpus):
+        if ranges and cpu == ranges[-1][1] + 1:
+            ranges[-1][1] = cpu
+        else:
+            ranges.append([cpu, cpu])
+    return ','.join(str(a) if a == b else f'{a}-{b}' for a, b in ranges)
+
+
+def available_cpus():
+    """CPUs this process may run on (cgroup/taskset aware where the OS allows)"""
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _env_int(name, default=None):
+    value = os.getenv(name, '').strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        log.warning("Ignoring %s=%r: not an integer", name, value)
+        return default
+
+
+def plan(workers=None, index=None, cpus=None, pin=None, intra=None, inter=None):
+    """
+    Settings for one worker; arguments override the environment
+    Returns: dict with workers, index, cpus (the pinned slice, or None), intra_op_threads, inter_op_threads
+    """
+    workers = max(1, workers or _env_int('MODEL_WORKERS') or _env_int('WEB_CONCURRENCY') or 1)
+    index = _env_int('MODEL_WORKER_INDEX', 0) if index is None else index
+    if cpus is None:
+        cpus = parse_cpus(os.environ['MODEL_CPUS']) if os.getenv('MODEL_CPUS') else available_cpus()
+    if pin is None:
+        pin = os.getenv('MODEL_CPU_PIN', '0').lower() in ('1', 'true', 'yes')
+
+    share = max(1, len(cpus) // workers)
+    if intra is None:
+        intra = _env_int('TF_INTRA_OP_THREADS', share)
+    if inter is None:
+        inter = _env_int('TF_INTER_OP_THREADS', 2 if share >= 4 else 1)
+
+    pinned = None
+    if pin:
+        # Worker i gets the i-th slice; with more workers than CPUs they wrap around
+        start = (index % workers) * share % len(cpus)
+        pinned = [cpus[(start + offset) % len(cpus)] for offset in range(share)]
+    return {'workers': workers, 'index': index, 'cpus': pinned,
+            'intra_op_threads': intra, 'inter_op_threads': inter}
+
+
+def _pin(cpus):
+    """Pin every thread of this process; threads started later inherit it"""
+    threads = os.listdir('/proc/self/task') if os.path.isdir('/proc/self/task') else ['0']
+    for tid in threads:
+        try:
+            os.sched_setaffinity(int(tid), cpus)
+        except OSError:
+            # The thread may have exited meanwhile
+            pass
+
+
+def configure(**overrides):
+    """
+    Apply plan() to this process; call before importing TensorFlow
+    Returns: the applied settings
+    """
+    settings = plan(**overrides)
+
+    if settings['cpus']:
+        if hasattr(os, 'sched_setaffinity'):
+            _pin(settings['cpus'])
+        else:
+            log.warning("CPU pinning is not supported on this platform")
+            settings['cpus'] = None
+
+    # oneDNN/OpenMP size their own pools from these when TensorFlow loads them
+    if settings['intra_op_threads']:
+        os.environ.setdefault('OMP_NUM_THREADS', str(settings['intra_op_threads']))
+
+    import tensorflow as tf
+    try:
+        if settings['intra_op_threads']:
+            tf.config.threading.set_intra_op_parallelism_threads(settings['intra_op_threads'])
+        if settings['inter_op_threads']:
+            tf.config.threading.set_inter_op_parallelism_threads(settings['inter_op_threads'])
+    except RuntimeError as e:
+        # TensorFlow was already used in this process; its pools are fixed
+        log.warning("TensorFlow threading left unchanged: %s", e)
+
+    settings['pid'] = os.getpid()
+    _applied.clear()
+    _applied.update(settings)
+    log.info("TensorFlow worker %s/%s: intra-op %s, inter-op %s, cpus %s",
+             settings['index'] + 1, settings['workers'],
+             settings['intra_op_threads'] or 'default', settings['inter_op_threads'] or 'default',
+             format_cpus(settings['cpus']) if settings['cpus'] else 'all',
+             extra={'tf_runtime': dict(settings)})
+    return settings
+
+
+def current():
+    """Settings configure() applied in this process ({} if it has not run)"""
+    return dict(_applied)
+
+
+# ==================== BENCHMARK ====================
+
+def candidates(workers, cpus):
+    """(label, intra, inter, pin) settings worth trying for this many workers"""
+    share = max(1, cpus // workers)
+    settings = [
+        ('tensorflow default', 0, 0, False),
+        ('auto', share, 2 if share >= 4 else 1, False),
+        ('auto + pinned', share, 2 if share >= 4 else 1, True),
+        ('single thread + pinned', 1, 1, True),
+    ]
+    if share >= 2:
+        settings.append(('half share + pinned', share // 2, 1, True))
+    if share * 2 <= cpus:
+        settings.append(('double share', share * 2, 1, False))
+    # With one CPU per worker several of these coincide; keep the first name
+    unique = {}
+    for label, intra, inter, pin in settings:
+        unique.setdefault((intra, inter, pin), label)
+    return [(label, intra, inter, pin) for (intra, inter, pin), label in unique.items()]
+
+
+def run_setting(model_path, workers, intra, inter, pin, seconds):
+    """Start `workers` processes, release them together, merge their measurements"""
+    processes = []
+    for index in range(workers):
+        command = [sys.executable, '-m', 'ml_model.runtime', '--worker', '--model', model_path,
+                   '--workers', str(workers), '--index', str(index),
+                   '--intra', str(intra), '--inter', str(inter), '--seconds', str(seconds)]
+        if pin:
+            command.append('--pin')
+        processes.append(subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                          text=True, bufsize=1, cwd=os.path.dirname(MODEL_DIR)))
+    try:
+        # Each worker prints 'ready' once loaded and warm, then waits for the start line
+        for process in processes:
+            line = process.stdout.readline()
+            if line.strip() != 'ready':
+                raise RuntimeError(f"worker did not start: {line.strip() or 'no output'}")
+        for process in processes:
+            process.stdin.write('go\n')
+            process.stdin.flush()
+        results = []
+        for process in processes:
+            output, _ = process.communicate(timeout=seconds + 300)
+            results.append(json.loads(output.strip().splitlines()[-1]))
+    finally:
+        for process in processes:
+            if process.poll() is None:
+                process.kill()
+
+    from ml_model.check_model import percentile
+    latencies = sorted(value for result in results for value in result.pop('latencies_ms'))
+    elapsed = max(result['elapsed_s'] for result in results)
+    return {
+        'images_per_s': round(sum(result['predictions'] for result in results) / elapsed, 1),
+        'p50_ms': round(percentile(latencies, 0.50), 2),
+        'p95_ms': round(percentile(latencies, 0.95), 2),
+        'p99_ms': round(percentile(latencies, 0.99), 2),
+        'processes': results,
+    }
+
+
+def worker(options):
+    """One benchmark process: configure, load, warm up, wait for 'go', predict for --seconds"""
+    settings = configure(workers=options.workers, index=options.index, pin=options.pin,
+                         intra=options.intra, inter=options.inter)
+    import tensorflow as tf
+    from ml_model.check_model import inputs
+    model = tf.keras.models.load_model(options.model)
+    image = inputs(1)
+    for _ in range(5):
+        model.predict(image, verbose=0)
+    print('ready', flush=True)
+    sys.stdin.readline()
+
+    latencies = []
+    started = time.perf_counter()
+    while time.perf_counter() - started < options.seconds:
+        begin = time.perf_counter()
+        model.predict(image, verbose=0)
+        latencies.append(round((time.perf_counter() - begin) * 1000, 3))
+    elapsed = time.perf_counter() - started
+    print(json.dumps({'index': options.index, 'cpus': settings['cpus'], 'predictions': len(latencies),
+                      'elapsed_s': round(elapsed, 3), 'latencies_ms': latencies}))
+
+
+def benchmark(options):
+    cpus = len(available_cpus())
+    worker_counts = ([int(value) for value in options.workers_list.split(',')] if options.workers_list
+                     else sorted(n for n in {1, 2, 4, cpus} if n <= cpus))
+    print("=" * 60)
+    print(f"TENSORFLOW THREADING BENCHMARK ({cpus} CPUs, {options.seconds}s per setting)")
+    print("=" * 60)
+
+    report = {'created_at': datetime.now().isoformat(timespec='seconds'), 'cpus': cpus,
+              'model': os.path.abspath(options.model), 'seconds': options.seconds, 'workers': []}
+    for workers in worker_counts:
+        print(f"\n{workers} worker(s):")
+        rows = []
+        for label, intra, inter, pin in candidates(workers, cpus):
+            try:
+                measured = run_setting(options.model, workers, intra, inter, pin, options.seconds)
+            except (RuntimeError, subprocess.SubprocessError, ValueError, IndexError) as e:
+                print(f"   {label:<24} failed ({e})")
+                continue
+            rows.append(dict(label=label, intra_op_threads=intra, inter_op_threads=inter, pin=pin, **measured))
+            print(f"   {label:<24} intra {intra or '-':>2} inter {inter or '-':>2}  "
+                  f"{measured['images_per_s']:>8.1f} images/s  p50 {measured['p50_ms']:>7.1f} ms  "
+                  f"p95 {measured['p95_ms']:>7.1f} ms")
+        if not rows:
+            continue
+        # Throughput decides; within 5% of the best, the lower p95 wins
+        top = max(row['images_per_s'] for row in rows)
+        best = min((row for row in rows if row['images_per_s'] >= top * 0.95), key=lambda row: row['p95_ms'])
+        report['workers'].append({'workers': workers, 'settings': rows, 'best': best['label']})
+        print(f"   best: {best['label']}")
+
+    best_overall = None
+    for entry in report['workers']:
+        row = next(row for row in entry['settings'] if row['label'] == entry['best'])
+        if best_overall is None or row['images_per_s'] > best_overall[1]['images_per_s']:
+            best_overall = (entry['workers'], row)
+    if best_overall:
+        workers, row = best_overall
+        report['recommended'] = {
+            'WEB_CONCURRENCY': workers,
+            'TF_INTRA_OP_THREADS': row['intra_op_threads'],
+            'TF_INTER_OP_THREADS': row['inter_op_threads'],
+            'MODEL_CPU_PIN': int(row['pin']),
+        }
+        print("\n" + "=" * 60)
+        print("Recommended environment:")
+        for name, value in report['recommended'].items():
+            print(f"   {name}={value}")
+
+    output = options.output or os.path.join(RESULTS_DIR, f"threads-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results in {output}")
+    print("=" * 60)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='TensorFlow threading and CPU affinity benchmark')
+    parser.add_argument('--model', default=os.path.join(MODEL_DIR, 'pest_grouped_model_v1.h5'))
+    parser.add_argument('--workers', dest='workers_list', help='worker counts to try, e.g. 1,2,4')
+    parser.add_argument('--seconds', type=float, default=5.0, help='measuring time per setting')
+    parser.add_argument('--output', help='result file (default: ml_model/benchmarks/threads-<time>.json)')
+    parser.add_argument('--show', action='store_true', help='print the settings configure() would apply')
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--index', type=int, default=0, help=argparse.SUPPRESS)
+    parser.add_argument('--intra', type=int, default=0, help=argparse.SUPPRESS)
+    parser.add_argument('--inter', type=int, default=0, help=argparse.SUPPRESS)
+    parser.add_argument('--pin', action='store_true', help=argparse.SUPPRESS)
+    options = parser.parse_args(argv)
+
+    if options.show:
+        print(json.dumps(plan(), indent=2))
+        return 0
+    if options.worker:
+        options.workers = int(options.workers_list)
+        worker(options)
+        return 0
+    benchmark(options)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
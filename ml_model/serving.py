@@ -0,0 +1,469 @@
+# serving.py
+"""
+Inference process pool shared by the web workers
+
+Without it every gunicorn worker loads its own copy of the model. Here a few
+model processes hold the model and many light web workers send them images:
+
+    python -m ml_model.serving --processes 2 --dir /tmp/pest-model
+    MODEL_SERVER=/tmp/pest-model gunicorn main:app
+
+Web workers decode and resize the upload themselves, straight into a slot
+of a shared-memory tensor ring (ml_model/tensor_ring.py, MODEL_SERVER_SLOTS
+slots per web worker), and send only the ring's name and the slot number over
+a Unix socket; the model process maps the same memory and runs the model on
+it, so the pixels are never serialized or copied between processes. Each model process keeps its number of in-flight requests
+(queued or running) in a small shared-memory board, and clients send every
+request to the least-loaded process.
+
+The supervisor restarts model processes that die and writes
+<dir>/server.json, which tells clients where the sockets and the board are.
+Model processes get MODEL_WORKERS / MODEL_WORKER_INDEX, so the threading and
+CPU pinning of ml_model/runtime.py apply per process.
+
+Only the resized tensor reaches a model process, so what needs the full photo
+stays with the in-process predictor: test-time augmentation (MODEL_TTA is
+ignored here), tiled mode and video scans.
+"""
+import argparse
+import atexit
+import json
+import logging
+import multiprocessing
+import os
+import random
+import signal
+import socket
+import socketserver
+import struct
+import sys
+import threading
+import time
+from contextlib import nullcontext
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from ml_model.tensor_ring import TensorRing, decode_into, map_ring
+
+log = logging.getLogger(__name__)
+
+MANIFEST = 'server.json'
+DEFAULT_DIR = '/tmp/pest-model'
+
+_header = struct.Struct('!I')
+
+
+# ==================== PROTOCOL ====================
+
+def send_frame(sock, message):
+    payload = json.dumps(message).encode('utf-8')
+    sock.sendall(_header.pack(len(payload)) + payload)
+
+
+def _recv_exact(sock, size):
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def recv_frame(sock):
+    """Next message, or None when the peer closed the connection"""
+    header = _recv_exact(sock, _header.size)
+    if header is None:
+        return None
+    payload = _recv_exact(sock, _header.unpack(header)[0])
+    return None if payload is None else json.loads(payload)
+
+
+def attach(name):
+    """Map an existing segment without letting this process's resource tracker unlink it at exit"""
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 always registers attached segments
+        shm = SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+
+# ==================== MODEL PROCESS ====================
+
+class ModelProcess:
+    """Runs predictions for one socket; counts in-flight requests on the board"""
+
+    def __init__(self, index, counts):
+        from ml_model import predictor
+        self.predictor = predictor
+        self.index = index
+        self.counts = counts
+        self.started_at = time.time()
+        self._model_lock = threading.Lock()
+        self._count_lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.inference_seconds = 0.0
+
+    def _adjust(self, delta):
+        with self._count_lock:
+            self.counts[self.index] += delta
+
+    def handle(self, request, rings):
+        op = request.get('op')
+        if op == 'stats':
+            return self.stats()
+        if op != 'predict':
+            return {'error': f'unknown op {op!r}'}
+
+        self._adjust(1)
+        try:
+            if request['ring'] not in rings:
+                shm = attach(request['ring'])
+                rings[request['ring']] = (shm, map_ring(shm, request['slots'], request['img_size']))
+            slot = request['slot']
+            batch = rings[request['ring']][1][slot:slot + 1]
+            with self._model_lock:
+                started = time.perf_counter()
+                result = self.predictor.predict_array(batch)
+                elapsed = time.perf_counter() - started
+            self.requests += 1
+            self.inference_seconds += elapsed
+            return {'result': result, 'inference_ms': round(elapsed * 1000, 2)}
+        except Exception as e:
+            self.errors += 1
+            log.exception("Prediction failed in model process %s: %s", self.index, e)
+            return {'result': {'success': False, 'error': str(e)}}
+        finally:
+            self._adjust(-1)
+
+    def stats(self):
+        from ml_model import runtime
+        return {
+            'index': self.index,
+            'pid': os.getpid(),
+            'runtime': runtime.current(),
+            'uptime_s': round(time.time() - self.started_at, 1),
+            'in_flight': int(self.counts[self.index]),
+            'requests': self.requests,
+            'errors': self.errors,
+            'avg_inference_ms': round(self.inference_seconds / self.requests * 1000, 2) if self.requests else 0.0,
+        }
+
+
+class _Handler(socketserver.BaseRequestHandler):
+    def handle(self):
+        # Tensor rings of this connection's client: name -> (SharedMemory, tensors)
+        rings = {}
+        try:
+            while True:
+                request = recv_frame(self.request)
+                if request is None:
+                    break
+                send_frame(self.request, self.server.model.handle(request, rings))
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            # The tensor views must go before their segment can be closed
+            handles = [shm for shm, _ in rings.values()]
+            rings.clear()
+            for shm in handles:
+                shm.close()
+
+
+def socket_path(directory, index):
+    return os.path.join(directory, f'model-{index}.sock')
+
+
+def serve_process(index, directory, processes, board_name, ready):
+    """Body of one model process (started with spawn, so TensorFlow never crosses a fork)"""
+    os.environ['MODEL_WORKERS'] = str(processes)
+    os.environ['MODEL_WORKER_INDEX'] = str(index)
+    logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO').upper(),
+                        format=f'%(asctime)s model-{index} %(levelname)s %(name)s: %(message)s')
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    board = attach(board_name)
+    counts = np.ndarray((processes,), dtype=np.int64, buffer=board.buf)
+    model = ModelProcess(index, counts)
+
+    path = socket_path(directory, index)
+    if os.path.exists(path):
+        os.unlink(path)
+    server = socketserver.ThreadingUnixStreamServer(path, _Handler)
+    server.daemon_threads = True
+    server.model = model
+    ready.put((index, model.predictor.IMG_SIZE))
+    server.serve_forever()
+
+
+# ==================== SUPERVISOR ====================
+
+def serve(directory, processes, ready_timeout=600):
+    """Start the model processes, publish the manifest and restart processes that die"""
+    os.makedirs(directory, exist_ok=True)
+    board = SharedMemory(create=True, size=8 * processes)
+    counts = np.ndarray((processes,), dtype=np.int64, buffer=board.buf)
+    counts[:] = 0
+
+    context = multiprocessing.get_context('spawn')
+    ready = context.Queue()
+    children = {}
+
+    def start(index):
+        counts[index] = 0
+        child = context.Process(target=serve_process, name=f'model-{index}',
+                                args=(index, directory, processes, board.name, ready), daemon=True)
+        child.start()
+        children[index] = child
+
+    stopping = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopping.set())
+    manifest_path = os.path.join(directory, MANIFEST)
+    try:
+        for index in range(processes):
+            start(index)
+        img_size = None
+        for _ in range(processes):
+            _, img_size = ready.get(timeout=ready_timeout)
+
+        manifest = {
+            'pid': os.getpid(),
+            'started_at': time.time(),
+            'board': board.name,
+            'img_size': img_size,
+            'processes': [{'index': index, 'socket': socket_path(directory, index)} for index in range(processes)],
+        }
+        temporary = f'{manifest_path}.tmp'
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(temporary, manifest_path)
+        log.info("%s model process(es) ready, manifest at %s", processes, manifest_path)
+
+        while not stopping.wait(1.0):
+            for index, child in list(children.items()):
+                if not child.is_alive():
+                    log.warning("Model process %s (pid %s) exited with %s; restarting", index, child.pid, child.exitcode)
+                    start(index)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        log.info("Stopping model processes")
+        for child in children.values():
+            child.terminate()
+        for child in children.values():
+            child.join(timeout=10)
+        for path in [manifest_path] + [socket_path(directory, index) for index in range(processes)]:
+            if os.path.exists(path):
+                os.unlink(path)
+        board.close()
+        board.unlink()
+
+
+# ==================== CLIENT ====================
+
+class InferenceClient:
+    """Web-worker side: decode into shared memory, send to the least-loaded model process"""
+
+    def __init__(self, directory, timeout=30.0, slots=8):
+        self.directory = directory
+        self.timeout = timeout
+        self.slots = slots
+        self._lock = threading.Lock()
+        self._reset()
+        os.register_at_fork(after_in_child=self._reset)
+        atexit.register(self.close)
+
+    def _reset(self):
+        # A forked child must not reuse (or later unlink) its parent's ring and sockets
+        self._ring = None
+        self._rings = []
+        self._manifest = None
+        self._board = None
+        self._counts = None
+        self._abandoned = {}
+        self._local = threading.local()
+
+    def _load(self, reload=False):
+        with self._lock:
+            if self._manifest is not None and not reload:
+                return self._manifest
+            with open(os.path.join(self.directory, MANIFEST), encoding='utf-8') as f:
+                manifest = json.load(f)
+            if self._board is not None and self._board.name.lstrip('/') != manifest['board'].lstrip('/'):
+                self._board.close()
+                self._board = None
+            if self._board is None:
+                self._board = attach(manifest['board'])
+            self._counts = np.ndarray((len(manifest['processes']),), dtype=np.int64, buffer=self._board.buf)
+            if self._ring is None or self._ring.img_size != manifest['img_size']:
+                # In-flight requests still hold slots of an old ring; it is freed at exit
+                self._ring = TensorRing(self.slots, manifest['img_size'], shared=True)
+                self._rings.append(self._ring)
+            self._manifest = manifest
+            return manifest
+
+    def _pick(self, exclude=()):
+        """Index of the least-loaded process; ties go to a random one"""
+        counts = self._counts.copy()
+        candidates = [index for index in range(len(counts)) if index not in exclude] or list(range(len(counts)))
+        lowest = min(counts[index] for index in candidates)
+        return random.choice([index for index in candidates if counts[index] == lowest])
+
+    def _connection(self, index):
+        connections = self._local.__dict__.setdefault('connections', {})
+        sock = connections.get(index)
+        if sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(self._manifest['processes'][index]['socket'])
+            connections[index] = sock
+        return sock
+
+    def _drop(self, index):
+        sock = self._local.__dict__.get('connections', {}).pop(index, None)
+        if sock is not None:
+            sock.close()
+
+    def _request(self, index, message):
+        # A kept-alive connection may belong to a process that has since restarted: retry once on a new one
+        for fresh in (index not in self._local.__dict__.get('connections', {}), True):
+            sock = self._connection(index)
+            try:
+                send_frame(sock, message)
+                reply = recv_frame(sock)
+            except TimeoutError:
+                # socket.timeout: the process is alive but busy, sending it again only waits longer
+                self._drop(index)
+                raise
+            except OSError:
+                self._drop(index)
+                if fresh:
+                    raise
+                continue
+            if reply is None:
+                self._drop(index)
+                if fresh:
+                    raise ConnectionError(f'model process {index} closed the connection')
+                continue
+            return reply
+
+    def predict(self, image_bytes, span=nullcontext):
+        """Same result dict as predictor.predict_pest"""
+        self._load()
+        ring = self._ring
+        slot = ring.acquire(timeout=self.timeout)
+        timed_out = False
+        try:
+            with span('decode'):
+                decode_into(image_bytes, ring.tensors[slot])
+
+            message = {'op': 'predict', 'ring': ring.name, 'slots': ring.slots,
+                       'img_size': ring.img_size, 'slot': slot}
+            tried = []
+            with span('inference'):
+                for _ in range(2):
+                    index = self._pick(exclude=tried)
+                    try:
+                        return self._request(index, message)['result']
+                    except TimeoutError:
+                        timed_out = True
+                        raise
+                    except OSError as e:
+                        # A restarted process or supervisor: re-read the manifest and try another one
+                        log.warning("Model process %s unavailable (%s), retrying", index, e)
+                        tried.append(index)
+                        self._load(reload=True)
+                raise ConnectionError('no model process available')
+        finally:
+            if timed_out:
+                self._abandon(ring, slot)
+            else:
+                ring.release(slot)
+
+    def _abandon(self, ring, slot):
+        """
+        Keep a timed-out request's slot out of the ring: its model process may still
+        be reading it. Once half the slots are gone the ring is replaced (the old one
+        is freed at exit, like a ring left behind by an img_size change).
+        """
+        with self._lock:
+            abandoned = self._abandoned[ring.name] = self._abandoned.get(ring.name, 0) + 1
+            log.warning("Model request timed out after %ss; tensor slot %s of ring %s not reused",
+                        self.timeout, slot, ring.name)
+            if ring is self._ring and abandoned * 2 >= ring.slots:
+                self._ring = TensorRing(self.slots, ring.img_size, shared=True)
+                self._rings.append(self._ring)
+
+    def stats(self):
+        manifest = self._load()
+        processes = []
+        for index in range(len(manifest['processes'])):
+            try:
+                processes.append(self._request(index, {'op': 'stats'}))
+            except OSError as e:
+                processes.append({'index': index, 'error': str(e)})
+        return {'directory': self.directory, 'supervisor_pid': manifest['pid'], 'processes': processes}
+
+    def close(self):
+        """Free this process's tensor rings (also happens at exit)"""
+        with self._lock:
+            rings, self._rings, self._ring = self._rings, [], None
+        for ring in rings:
+            ring.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def default_client():
+    """Client for MODEL_SERVER, created on first use"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = InferenceClient(os.getenv('MODEL_SERVER') or DEFAULT_DIR,
+                                      timeout=float(os.getenv('MODEL_SERVER_TIMEOUT', '30')),
+                                      slots=int(os.getenv('MODEL_SERVER_SLOTS', '8')))
+        return _client
+
+
+def predict_pest(image_bytes, span=nullcontext):
+    """
+    Predict pest from image bytes through the model processes
+    Drop-in for ml_model.predictor.predict_pest
+    """
+    try:
+        return default_client().predict(image_bytes, span=span)
+    except Exception as e:
+        log.exception("Prediction failed: %s", e)
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Inference process pool for the web workers')
+    parser.add_argument('--processes', type=int, default=int(os.getenv('MODEL_PROCESSES', '2')))
+    parser.add_argument('--dir', default=os.getenv('MODEL_SERVER') or DEFAULT_DIR,
+                        help='where the sockets and server.json go (MODEL_SERVER for the web workers)')
+    parser.add_argument('--stats', action='store_true', help='print the stats of a running pool')
+    options = parser.parse_args(argv)
+
+    if options.stats:
+        print(json.dumps(InferenceClient(options.dir).stats(), indent=2))
+        return 0
+    logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO').upper(),
+                        format='%(asctime)s supervisor %(levelname)s %(name)s: %(message)s')
+    serve(options.dir, options.processes)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
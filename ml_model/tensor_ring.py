@@ -0,0 +1,332 @@
+# tensor_ring.py
+"""
+Ring of preallocated input tensors shared by decoders and the model
+
+The old preprocess made four arrays per image: PIL's pixels, np.array's
+uint8 copy, a float64 copy from the division (8 bytes per channel) and the
+expand_dims view, and batching added np.concatenate on top. Here every
+input tensor lives in one preallocated (slots, size, size, 3) float32 block:
+
+    ring = TensorRing(16, 224)
+    slot = ring.acquire()                      # blocks while all slots are in use
+    decode_into(image_bytes, ring.tensors[slot])
+    ring.publish(slot)
+    batch = ring.take(max_batch=8)             # consecutive ready slots, in order
+    model.predict(batch.tensors)               # a view of the block, no copy
+    ring.release(batch)
+
+decode_into() scales the resized uint8 pixels straight into the slot, so
+the only per-image allocation left is PIL's own. With shared=True the block
+is a shared-memory segment another process can map by name (map_ring), which
+is how ml_model/serving.py hands tensors to the model processes.
+
+    python ml_model/tensor_ring.py --images bench_images --requests 500
+    python ml_model/tensor_ring.py --model     # include the real model in the throughput run
+
+measures peak transient memory per request and decode/batch throughput of
+the copying path against the ring.
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+from PIL import Image
+
+MODEL_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(MODEL_DIR, 'benchmarks')
+
+FREE, WRITING, READY, READING = range(4)
+
+
+def load_rgb(image_bytes):
+    """Decoded RGB PIL image"""
+    img = Image.open(io.BytesIO(image_bytes))
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    return img
+
+
+def scale_into(img, out):
+    """Pixels of an image already at out's size, scaled to [0, 1] straight into out (float32)"""
+    np.divide(np.asarray(img), 255.0, out=out, casting='unsafe')
+    return out
+
+
+def decode_into(image_bytes, out):
+    """Decode, resize to out's (height, width) and scale to [0, 1] straight into out (float32)"""
+    return scale_into(load_rgb(image_bytes).resize((out.shape[1], out.shape[0])), out)
+
+
+class Batch:
+    """Consecutive ready slots handed out by TensorRing.take()"""
+
+    def __init__(self, ring, start, count):
+        self.start = start
+        self.count = count
+        self.tensors = ring.tensors[start:start + count]
+        self.errors = ring._errors[start:start + count]
+
+
+class TensorRing:
+    """Preallocated float32 input tensors, handed out in ring order"""
+
+    def __init__(self, slots, img_size, shared=False):
+        shape = (slots, img_size, img_size, 3)
+        self.slots = slots
+        self.img_size = img_size
+        self._shm = None
+        if shared:
+            self._shm = SharedMemory(create=True, size=int(np.prod(shape)) * 4)
+            self.tensors = np.ndarray(shape, dtype=np.float32, buffer=self._shm.buf)
+        else:
+            self.tensors = np.empty(shape, dtype=np.float32)
+        self._state = [FREE] * slots
+        self._errors = [None] * slots
+        self._head = 0
+        self._tail = 0
+        self._cond = threading.Condition()
+        self.acquired = 0
+        self.waits = 0
+
+    @property
+    def name(self):
+        """Shared-memory name for map_ring() (None unless shared)"""
+        return self._shm.name if self._shm else None
+
+    def in_use(self):
+        with self._cond:
+            return sum(state != FREE for state in self._state)
+
+    def _free_slot(self):
+        for offset in range(self.slots):
+            slot = (self._head + offset) % self.slots
+            if self._state[slot] == FREE:
+                return slot
+        return None
+
+    def acquire(self, timeout=None):
+        """
+        A free slot to write into, the next in ring order when possible
+        Blocks while every slot is in use (backpressure); TimeoutError after timeout
+        """
+        with self._cond:
+            if self._free_slot() is None:
+                self.waits += 1
+                if not self._cond.wait_for(lambda: self._free_slot() is not None, timeout):
+                    raise TimeoutError(f'all {self.slots} tensor slots in use')
+            slot = self._free_slot()
+            self._state[slot] = WRITING
+            self._errors[slot] = None
+            self._head = (slot + 1) % self.slots
+            self.acquired += 1
+            return slot
+
+    def publish(self, slot, error=None):
+        """Mark a written slot ready for take(); error marks it as failed (its tensor is zeroed)"""
+        if error is not None:
+            self.tensors[slot].fill(0)
+        with self._cond:
+            self._state[slot] = READY
+            self._errors[slot] = error
+            self._cond.notify_all()
+
+    def take(self, max_batch, timeout=None, linger=0.0):
+        """
+        Up to max_batch consecutive ready slots starting at the oldest acquired one
+        Stops at the end of the block so the batch stays one view; None on timeout.
+        linger waits up to that many seconds for slots still being written to join the batch.
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._state[self._tail] == READY, timeout):
+                return None
+            start = self._tail
+            limit = min(max_batch, self.slots - start)
+
+            def ready_run():
+                count = 1
+                while count < limit and self._state[start + count] == READY:
+                    count += 1
+                return count
+
+            if linger > 0:
+                self._cond.wait_for(lambda: ready_run() == limit
+                                    or self._state[start + ready_run()] != WRITING, linger)
+            count = ready_run()
+            for slot in range(start, start + count):
+                self._state[slot] = READING
+            self._tail = (start + count) % self.slots
+            return Batch(self, start, count)
+
+    def release(self, batch_or_slot):
+        """Return a Batch, or a single slot used without take(), to the free list"""
+        if isinstance(batch_or_slot, Batch):
+            slots = range(batch_or_slot.start, batch_or_slot.start + batch_or_slot.count)
+        else:
+            slots = [batch_or_slot]
+        with self._cond:
+            for slot in slots:
+                self._state[slot] = FREE
+            self._cond.notify_all()
+
+    def stats(self):
+        return {'slots': self.slots, 'in_use': self.in_use(), 'acquired': self.acquired,
+                'waits': self.waits, 'mib': round(self.tensors.nbytes / 2 ** 20, 1)}
+
+    def close(self):
+        if self._shm is not None:
+            self._shm.close()
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+            self._shm = None
+
+
+def map_ring(shm, slots, img_size):
+    """Tensors of another process's shared ring, given the attached SharedMemory"""
+    return np.ndarray((slots, img_size, img_size, 3), dtype=np.float32, buffer=shm.buf)
+
+
+# ==================== BENCHMARK ====================
+
+def copying_preprocess(image_bytes, img_size):
+    """The preprocess this module replaced, kept for comparison"""
+    img = Image.open(io.BytesIO(image_bytes)).convert("RGB")
+    img = img.resize((img_size, img_size))
+    img_array = np.array(img) / 255.0
+    return np.expand_dims(img_array, axis=0)
+
+
+def load_images(directory, count):
+    if directory:
+        names = sorted(name for name in os.listdir(directory)
+                       if name.lower().endswith(('.jpg', '.jpeg', '.png', '.webp')))[:count]
+        if not names:
+            sys.exit(f"No images in {directory}")
+        images = []
+        for name in names:
+            with open(os.path.join(directory, name), 'rb') as f:
+                images.append(f.read())
+        return images
+    sys.path.insert(0, os.path.dirname(MODEL_DIR))
+    from generate_dataset import field_image
+    return [field_image(seed, 1600, 1200) for seed in range(min(count, 50))]
+
+
+def transient_memory(images, requests, img_size):
+    """Peak memory allocated above the baseline while preparing one request, per path"""
+    import tracemalloc
+    ring = TensorRing(1, img_size)
+    paths = {
+        'copying': lambda data: copying_preprocess(data, img_size),
+        'ring': lambda data: decode_into(data, ring.tensors[0]),
+    }
+    results = {}
+    tracemalloc.start()
+    try:
+        for label, prepare in paths.items():
+            peaks = []
+            for index in range(requests):
+                data = images[index % len(images)]
+                baseline = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                prepare(data)
+                peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+            results[label] = {'peak_kib_per_request': round(sum(peaks) / len(peaks) / 1024, 1)}
+    finally:
+        tracemalloc.stop()
+    return results
+
+
+def throughput(images, requests, img_size, threads, batch_size, predict):
+    """images/s through decode threads and one batching consumer, per path"""
+    results = {}
+
+    # Copying: each decoder returns its own array, the consumer concatenates a batch
+    started = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        futures = [pool.submit(copying_preprocess, images[index % len(images)], img_size)
+                   for index in range(requests)]
+        for first in range(0, requests, batch_size):
+            batch = np.concatenate([future.result() for future in futures[first:first + batch_size]])
+            predict(batch)
+    results['copying'] = {'images_per_s': round(requests / (time.perf_counter() - started), 1)}
+
+    # Ring: decoders write into slots, the consumer runs on views of the block
+    ring = TensorRing(max(2 * batch_size, threads * 2), img_size)
+
+    def decode(index):
+        slot = ring.acquire()
+        try:
+            decode_into(images[index % len(images)], ring.tensors[slot])
+            ring.publish(slot)
+        except Exception as e:
+            ring.publish(slot, error=str(e))
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        # Submitting runs ahead of the ring; acquire() is what bounds memory
+        producer = threading.Thread(target=lambda: [pool.submit(decode, index) for index in range(requests)])
+        producer.start()
+        done = 0
+        while done < requests:
+            batch = ring.take(batch_size)
+            predict(batch.tensors)
+            done += batch.count
+            ring.release(batch)
+        producer.join()
+    results['ring'] = {'images_per_s': round(requests / (time.perf_counter() - started), 1),
+                       'backpressure_waits': ring.waits}
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Copying preprocess vs tensor ring benchmark')
+    parser.add_argument('--images', help='folder of test images (default: 50 synthetic 1600x1200 photos)')
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--threads', type=int, default=os.cpu_count() or 4)
+    parser.add_argument('--batch', type=int, default=8)
+    parser.add_argument('--img-size', type=int, default=224)
+    parser.add_argument('--model', action='store_true', help='run the real model on each batch')
+    parser.add_argument('--output', help='result file (default: ml_model/benchmarks/ring-<time>.json)')
+    options = parser.parse_args(argv)
+
+    images = load_images(options.images, options.requests)
+    if options.model:
+        sys.path.insert(0, os.path.dirname(MODEL_DIR))
+        from ml_model import predictor
+        predict = lambda batch: predictor.model.predict(batch, verbose=0)
+    else:
+        predict = lambda batch: float(batch.sum())
+
+    print("=" * 60)
+    print(f"TENSOR RING BENCHMARK ({len(images)} images, {options.requests} requests, "
+          f"{options.threads} threads, batch {options.batch}{', model' if options.model else ''})")
+    print("=" * 60)
+    report = {'created_at': datetime.now().isoformat(timespec='seconds'), 'options': vars(options),
+              'memory': transient_memory(images, min(options.requests, 100), options.img_size),
+              'throughput': throughput(images, options.requests, options.img_size,
+                                       options.threads, options.batch, predict)}
+    for label in ('copying', 'ring'):
+        print(f"   {label:<8} {report['memory'][label]['peak_kib_per_request']:>8.1f} KiB peak per request  "
+              f"{report['throughput'][label]['images_per_s']:>8.1f} images/s")
+
+    output = options.output or os.path.join(RESULTS_DIR, f"ring-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results in {output}")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+# tiling.py
+"""
+Tiled inference for large field photos
+
+Squeezing a 4000x3000 photo of a crop row into 224x224 leaves a small insect
+a few pixels wide. Tiled mode resizes the photo to one or more scales, cuts
+overlapping 224-pixel tiles from each, classifies all tiles in batched
+forward passes and reports per-tile detections plus an image summary:
+
+    scale 0.125 of a 4000x3000 photo -> 500x375,   6 tiles each covering ~1800 px of the photo
+    scale 0.25                        -> 1000x750, 30 tiles each covering ~900 px
+
+    MODEL_TILE_SCALES          comma-separated scales (default 0.125,0.25)
+    MODEL_TILE_OVERLAP         fraction two neighbouring tiles share (default 0.25)
+    MODEL_TILE_MAX             tiles per image, bounds CPU time (default 48)
+    MODEL_TILE_BATCH           tiles per forward pass (default 16)
+    MODEL_TILE_MIN_CONFIDENCE  % a tile needs to count as a detection (default 50)
+
+The defaults fit both scales of a 12 MP phone photo (36 tiles) into the
+budget; adding 0.5 would need another 108. When the scales need more than
+MODEL_TILE_MAX tiles, the finest scales are dropped first; if even the
+coarsest needs more, its grid is thinned evenly. The plan is made from the
+image header, and JPEGs are then decoded at reduced size for the finest
+scale that is kept.
+
+The image-level probabilities are the per-class maximum over all tiles, so
+one clear insect is enough to name the photo, and overlapping detections of
+the same class are merged before they are counted.
+"""
+import io
+import math
+import os
+
+import numpy as np
+from PIL import Image
+
+from ml_model.tensor_ring import scale_into
+
+TILE = 224
+
+
+def _env_floats(name, default):
+    return tuple(float(value) for value in os.getenv(name, default).split(',') if value.strip())
+
+
+SCALES = _env_floats('MODEL_TILE_SCALES', '0.125,0.25')
+OVERLAP = float(os.getenv('MODEL_TILE_OVERLAP', '0.25'))
+MAX_TILES = int(os.getenv('MODEL_TILE_MAX', '48'))
+BATCH_SIZE = int(os.getenv('MODEL_TILE_BATCH', '16'))
+MIN_CONFIDENCE = float(os.getenv('MODEL_TILE_MIN_CONFIDENCE', '50'))
+
+
+def _positions(length, tile, stride):
+    """Tile offsets along one axis, the last one flush with the edge"""
+    if length <= tile:
+        return [0]
+    count = math.ceil((length - tile) / stride) + 1
+    return sorted({min(round(index * stride), length - tile) for index in range(count)})
+
+
+def plan(width, height, scales=SCALES, overlap=OVERLAP, max_tiles=MAX_TILES, tile=TILE):
+    """
+    Tiles for a width x height photo within the max_tiles budget
+    Returns: (tiles, skipped_scales); each tile is (scale, x, y) in scaled-image pixels
+    """
+    grids, sizes = [], set()
+    for scale in sorted(set(scales)):
+        scaled_w, scaled_h = max(tile, round(width * scale)), max(tile, round(height * scale))
+        if (scaled_w, scaled_h) in sizes:
+            # Clamped up to the tile size like a smaller scale: the same tiles again
+            continue
+        sizes.add((scaled_w, scaled_h))
+        stride = max(1, tile * (1 - overlap))
+        grids.append([(scale, x, y) for y in _positions(scaled_h, tile, stride)
+                      for x in _positions(scaled_w, tile, stride)])
+
+    tiles, skipped = [], []
+    for grid in grids:
+        if len(tiles) + len(grid) <= max_tiles:
+            tiles.extend(grid)
+        elif not tiles:
+            # Even the coarsest scale is over budget: take an even sample of its grid
+            step = len(grid) / max_tiles
+            tiles.extend(grid[int(index * step)] for index in range(max_tiles))
+        else:
+            skipped.append(grid[0][0])
+    return tiles, skipped
+
+
+def box(tile_spec, width, height, tile=TILE):
+    """A tile's [x0, y0, x1, y1] in pixels of the original photo"""
+    scale, x, y = tile_spec
+    scale_x = max(tile, round(width * scale)) / width
+    scale_y = max(tile, round(height * scale)) / height
+    return [round(x / scale_x), round(y / scale_y),
+            min(width, round((x + tile) / scale_x)), min(height, round((y + tile) / scale_y))]
+
+
+def overlap(a, b):
+    """Intersection of two boxes as a fraction of the smaller one"""
+    width = min(a[2], b[2]) - max(a[0], b[0])
+    height = min(a[3], b[3]) - max(a[1], b[1])
+    if width <= 0 or height <= 0:
+        return 0.0
+    return width * height / min((a[2] - a[0]) * (a[3] - a[1]), (b[2] - b[0]) * (b[3] - b[1]))
+
+
+def merge(detections, threshold=0.2):
+    """
+    Keep the most confident of overlapping same-class detections
+    Overlap is measured against the smaller box: neighbouring tiles share
+    MODEL_TILE_OVERLAP of their width and a fine tile lies wholly inside a
+    coarse one, while IoU puts both well under any usable threshold
+    """
+    kept = []
+    for detection in sorted(detections, key=lambda d: d['confidence'], reverse=True):
+        if all(other['predicted_class'] != detection['predicted_class']
+               or overlap(other['box'], detection['box']) < threshold
+               for other in kept):
+            kept.append(detection)
+    return kept
+
+
+def load(image_bytes, scales=SCALES, overlap=OVERLAP, max_tiles=MAX_TILES, tile=TILE):
+    """
+    Plan the tiles from the image header, then decode the photo
+    Returns: (RGB image, width, height, tiles, skipped_scales); JPEGs are decoded at
+    reduced size when no kept scale needs full resolution, most of the decode time saved
+    """
+    img = Image.open(io.BytesIO(image_bytes))
+    width, height = img.size
+    tiles, skipped = plan(width, height, scales, overlap, max_tiles, tile)
+    largest = min(1.0, max(scale for scale, _, _ in tiles))
+    if largest < 1.0:
+        img.draft('RGB', (max(tile, round(width * largest)), max(tile, round(height * largest))))
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    return img, width, height, tiles, skipped
+
+
+def fill_batches(img, tiles, batch, width, height, tile=TILE):
+    """
+    Write tiles of a width x height photo (img may be a reduced decode of it)
+    into batch (N, tile, tile, 3), a batch at a time
+    Yields how many leading rows of batch hold tiles; each scale is resized once
+    """
+    scaled = {}
+    filled = 0
+    for scale, x, y in tiles:
+        if scale not in scaled:
+            scaled.clear()
+            size = (max(tile, round(width * scale)), max(tile, round(height * scale)))
+            scaled[scale] = np.asarray(img.resize(size))
+        scale_into(scaled[scale][y:y + tile, x:x + tile], batch[filled])
+        filled += 1
+        if filled == len(batch):
+            yield filled
+            filled = 0
+    if filled:
+        yield filled
+
+
+def summarize(tiles, probabilities, width, height, class_names, min_confidence=MIN_CONFIDENCE):
+    """Per-tile detections and the image-level result dict (same keys as predict_pest)"""
+    detections = []
+    for tile_spec, row in zip(tiles, probabilities):
+        top = int(np.argmax(row))
+        confidence = float(row[top]) * 100
+        if confidence >= min_confidence:
+            detections.append({
+                'predicted_class': class_names[top],
+                'confidence': round(confidence, 2),
+                'box': box(tile_spec, width, height),
+                'scale': tile_spec[0],
+            })
+    detections = merge(detections)
+
+    pooled = probabilities.max(axis=0)
+    top = int(np.argmax(pooled))
+    pests = {}
+    for detection in detections:
+        entry = pests.setdefault(detection['predicted_class'], {'tiles': 0, 'max_confidence': 0.0})
+        entry['tiles'] += 1
+        entry['max_confidence'] = max(entry['max_confidence'], detection['confidence'])
+    return {
+        "success": True,
+        "predicted_class": class_names[top],
+        "confidence": round(float(pooled[top]) * 100, 2),
+        "all_predictions": {name: round(float(pooled[i]) * 100, 2) for i, name in enumerate(class_names)},
+        "detections": detections,
+        "summary": {
+            'pests': dict(sorted(pests.items(), key=lambda item: item[1]['max_confidence'], reverse=True)),
+            'tiles': len(tiles),
+            'image_size': [width, height],
+        },
+    }
@@ -0,0 +1,222 @@
+# tta.py
+"""
+Test-time augmentation for low-confidence predictions
+
+Blurry or badly framed field photos often come back with a low top
+confidence. predict_pest can then look at the photo again through a few
+augmented views and average the class probabilities:
+
+    flip_h, flip_v              mirrored copies of the resized photo
+    center                      the middle 80% of the photo
+    top_left ... bottom_right   the four 80% corners
+    zoom_in, zoom_out           10% closer, and 10% further away (edges reflected)
+
+Crops are cut from the full-resolution photo, so they carry more detail than
+the 224x224 first pass. All views run in one batched forward pass. With
+MODEL_SERVER set the web workers only send the 224x224 tensor to the model
+processes (ml_model/serving.py), so TTA does not run there and
+user/user.py logs a warning at startup if MODEL_TTA asks for it.
+
+    MODEL_TTA            off (default), auto (only below the threshold) or always
+    MODEL_TTA_THRESHOLD  first-pass confidence in % under which auto kicks in (default 60)
+    MODEL_TTA_VIEWS      comma-separated subset of the views above (default: all)
+
+Latency cost against accuracy gain on a labelled set (one folder per class,
+named as in class_mapping.json):
+
+    python -m ml_model.tta labelled_photos --thresholds 40,50,60,70,80
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+from ml_model.tensor_ring import load_rgb, scale_into
+
+MODEL_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(MODEL_DIR, 'benchmarks')
+
+VIEWS = ('flip_h', 'flip_v', 'center', 'top_left', 'top_right', 'bottom_left', 'bottom_right',
+         'zoom_in', 'zoom_out')
+MODES = ('off', 'auto', 'always')
+CROP = 0.8
+ZOOM = 1.1
+
+
+def parse_views(value):
+    """MODEL_TTA_VIEWS -> tuple of view names (all of them when empty)"""
+    if not value:
+        return VIEWS
+    views = tuple(name.strip() for name in value.split(',') if name.strip())
+    unknown = [name for name in views if name not in VIEWS]
+    if unknown:
+        raise ValueError(f"unknown TTA views {unknown}; choose from {', '.join(VIEWS)}")
+    return views
+
+
+def parse_mode(value):
+    """MODEL_TTA (or a per-call override) -> 'off', 'auto' or 'always'"""
+    mode = (value or 'off').strip().lower()
+    if mode not in MODES:
+        raise ValueError(f"unknown TTA mode {value!r}; choose from {', '.join(MODES)}")
+    return mode
+
+
+def _box(img, fraction, anchor):
+    """Crop box of `fraction` of each side, anchored at 'center' or a corner"""
+    width, height = img.size
+    w, h = int(width * fraction), int(height * fraction)
+    left = {'left': 0, 'right': width - w}.get(anchor.split('_')[-1], (width - w) // 2)
+    top = {'top': 0, 'bottom': height - h}.get(anchor.split('_')[0], (height - h) // 2)
+    return (left, top, left + w, top + h)
+
+
+def fill_view(img, base, name, out):
+    """Write one view into out; base is img already resized to the model's input"""
+    size = out.shape[0]
+    if name == 'flip_h':
+        return scale_into(np.asarray(base)[:, ::-1], out)
+    if name == 'flip_v':
+        return scale_into(np.asarray(base)[::-1], out)
+    if name == 'zoom_in':
+        return scale_into(img.resize((size, size), box=_box(img, 1 / ZOOM, 'center')), out)
+    if name == 'zoom_out':
+        inner = int(round(size / ZOOM))
+        small = np.asarray(base.resize((inner, inner)))
+        before = (size - inner) // 2
+        after = size - inner - before
+        return scale_into(np.pad(small, ((before, after), (before, after), (0, 0)), mode='reflect'), out)
+    # center and the four corners
+    return scale_into(img.resize((size, size), box=_box(img, CROP, name)), out)
+
+
+def augmented_batch(img, size, views=VIEWS, base=None):
+    """(len(views), size, size, 3) float32 batch of the views of a decoded RGB image"""
+    if base is None:
+        base = img.resize((size, size))
+    batch = np.empty((len(views), size, size, 3), dtype=np.float32)
+    for index, name in enumerate(views):
+        fill_view(img, base, name, batch[index])
+    return batch
+
+
+# ==================== EVALUATION ====================
+
+def labelled_images(directory, class_names):
+    """(path, label) for every image in a folder-per-class layout"""
+    images = []
+    for label in sorted(os.listdir(directory)):
+        folder = os.path.join(directory, label)
+        if not os.path.isdir(folder):
+            continue
+        if label not in class_names:
+            print(f"   ! skipping folder {label!r}: not a class of this model")
+            continue
+        images.extend((os.path.join(folder, name), label) for name in sorted(os.listdir(folder))
+                      if name.lower().endswith(('.jpg', '.jpeg', '.png', '.webp')))
+    return images
+
+
+def measure(path, predictor, views):
+    """First-pass and TTA probabilities of one image, with the time each took"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    started = time.perf_counter()
+    img = load_rgb(data)
+    base = img.resize((predictor.IMG_SIZE, predictor.IMG_SIZE))
+    tensor = np.empty((1, predictor.IMG_SIZE, predictor.IMG_SIZE, 3), dtype=np.float32)
+    scale_into(base, tensor[0])
+    first = predictor.model.predict(tensor, verbose=0)[0]
+    first_ms = (time.perf_counter() - started) * 1000
+    started = time.perf_counter()
+    averaged = predictor.predict_tta(img, first, base=base, views=views)
+    tta_ms = (time.perf_counter() - started) * 1000
+    return first, first_ms, averaged, tta_ms
+
+
+def summarize(rows, use_tta):
+    """Accuracy and latency when use_tta(row) decides which prediction counts"""
+    from ml_model.check_model import percentile
+    correct = 0
+    latencies = []
+    triggered = 0
+    for row in rows:
+        if use_tta(row):
+            triggered += 1
+            correct += row['tta_correct']
+            latencies.append(row['first_ms'] + row['tta_ms'])
+        else:
+            correct += row['first_correct']
+            latencies.append(row['first_ms'])
+    latencies.sort()
+    return {
+        'accuracy': round(correct / len(rows) * 100, 2),
+        'triggered': round(triggered / len(rows) * 100, 1),
+        'mean_ms': round(sum(latencies) / len(latencies), 1),
+        'p95_ms': round(percentile(latencies, 0.95), 1),
+    }
+
+
+def evaluate(options):
+    from ml_model import predictor
+    views = parse_views(options.views)
+    images = labelled_images(options.directory, predictor.class_names)[:options.limit or None]
+    if not images:
+        sys.exit(f"No labelled images in {options.directory}")
+
+    print("=" * 60)
+    print(f"TTA EVALUATION ({len(images)} images, {len(views)} views)")
+    print("=" * 60)
+    # Warm up so the first image does not pay for graph building
+    measure(images[0][0], predictor, views)
+    rows = []
+    for path, label in images:
+        first, first_ms, averaged, tta_ms = measure(path, predictor, views)
+        rows.append({
+            'path': path, 'label': label,
+            'first_class': predictor.class_names[int(np.argmax(first))],
+            'first_confidence': round(float(np.max(first)) * 100, 2),
+            'tta_class': predictor.class_names[int(np.argmax(averaged))],
+            'first_ms': round(first_ms, 2), 'tta_ms': round(tta_ms, 2),
+        })
+        rows[-1]['first_correct'] = rows[-1]['first_class'] == label
+        rows[-1]['tta_correct'] = rows[-1]['tta_class'] == label
+
+    modes = {'off': summarize(rows, lambda row: False), 'always': summarize(rows, lambda row: True)}
+    for threshold in [float(value) for value in options.thresholds.split(',')]:
+        modes[f'auto<{threshold:g}'] = summarize(rows, lambda row: row['first_confidence'] < threshold)
+    baseline = modes['off']
+    print(f"   {'mode':<12} {'accuracy':>9} {'gain':>7} {'TTA runs':>9} {'mean ms':>9} {'p95 ms':>8} {'cost':>7}")
+    for name, summary in modes.items():
+        print(f"   {name:<12} {summary['accuracy']:>8.2f}% {summary['accuracy'] - baseline['accuracy']:>+6.2f}% "
+              f"{summary['triggered']:>8.1f}% {summary['mean_ms']:>9.1f} {summary['p95_ms']:>8.1f} "
+              f"{summary['mean_ms'] / baseline['mean_ms']:>6.2f}x")
+
+    report = {'created_at': datetime.now().isoformat(timespec='seconds'),
+              'directory': os.path.abspath(options.directory), 'views': list(views),
+              'images': len(rows), 'modes': modes, 'per_image': rows}
+    output = options.output or os.path.join(RESULTS_DIR, f"tta-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results in {output}")
+    print("=" * 60)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='TTA latency cost against accuracy gain on a labelled set')
+    parser.add_argument('directory', help='one sub-folder of images per class name')
+    parser.add_argument('--thresholds', default='40,50,60,70,80', help='auto-mode confidence thresholds in %%')
+    parser.add_argument('--views', help='comma-separated views (default: all)')
+    parser.add_argument('--limit', type=int, default=0, help='evaluate only the first N images')
+    parser.add_argument('--output', help='result file (default: ml_model/benchmarks/tta-<time>.json)')
+    evaluate(parser.parse_args(argv))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
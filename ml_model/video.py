@@ -0,0 +1,236 @@
+# video.py
+"""
+Pest scanning of short field videos and photo bursts
+
+Walking a crop row with the camera running gives hundreds of frames, most
+of them nearly the same. A scan samples the video at a fixed rate, drops
+frames that barely differ from the last one analyzed, runs the rest through
+batched inference (ml_model/pipeline.py) and reports per frame and per pest
+over time:
+
+    frames = video_frames('row7.mp4', sample_fps=2)     # or burst_frames(files)
+    report = ScanReport()
+    for record in scan(frames, predictor.predict_batch, predictor.IMG_SIZE, report):
+        ...                                         # {'t': 3.5, 'predicted_class': ...}
+    report.as_dict()                                # pests, first/last seen, segments
+
+Frames are decoded one at a time from the file (OpenCV grabs the frames it
+does not sample without converting them) and shrunk to the model's input
+size straight away, so memory does not grow with the video's length.
+Near-duplicates are found on a 32x32 grayscale thumbnail: a frame is kept
+when its mean absolute difference from the last kept frame reaches the
+threshold (0-255 scale).
+
+    MODEL_VIDEO_SAMPLE_FPS      frames analyzed per second of video (default 2)
+    MODEL_VIDEO_DIFF_THRESHOLD  mean pixel change that counts as a new frame (default 6)
+    MODEL_VIDEO_MAX_SECONDS     video seconds scanned at most (default 180)
+    MODEL_VIDEO_MIN_CONFIDENCE  % a frame needs to count as a sighting (default 50)
+    MODEL_VIDEO_SEGMENT_GAP     seconds between sightings still counted as one segment (default 2)
+    MODEL_VIDEO_MAX_MB          largest upload accepted, video or whole burst (default 200)
+    MODEL_VIDEO_MAX_BURST       photos per burst at most (default 60)
+    MODEL_VIDEO_MAX_SCANS       scans running at once per process (default 2); each holds
+                                a 32-slot tensor ring (~19 MB) and its threads
+"""
+import io
+import json
+import logging
+import os
+from collections import deque
+
+import numpy as np
+from PIL import Image
+
+from ml_model.pipeline import InferencePipeline
+from ml_model.tensor_ring import scale_into
+
+log = logging.getLogger(__name__)
+
+SAMPLE_FPS = float(os.getenv('MODEL_VIDEO_SAMPLE_FPS', '2'))
+DIFF_THRESHOLD = float(os.getenv('MODEL_VIDEO_DIFF_THRESHOLD', '6'))
+MAX_SECONDS = float(os.getenv('MODEL_VIDEO_MAX_SECONDS', '180'))
+MIN_CONFIDENCE = float(os.getenv('MODEL_VIDEO_MIN_CONFIDENCE', '50'))
+SEGMENT_GAP = float(os.getenv('MODEL_VIDEO_SEGMENT_GAP', '2'))
+MAX_UPLOAD_BYTES = int(float(os.getenv('MODEL_VIDEO_MAX_MB', '200')) * 1024 * 1024)
+MAX_BURST = int(os.getenv('MODEL_VIDEO_MAX_BURST', '60'))
+MAX_SCANS = int(os.getenv('MODEL_VIDEO_MAX_SCANS', '2'))
+SIGNATURE = 32
+
+
+class ScanError(Exception):
+    """A video or burst that cannot be scanned"""
+
+
+def video_frames(path, img_size=224, sample_fps=SAMPLE_FPS, max_seconds=MAX_SECONDS):
+    """
+    Open a video file and return a generator of (seconds, RGB uint8 img_size x img_size frame)
+    Raises ScanError here, before any frame is read, if the file cannot be opened
+    """
+    try:
+        import cv2
+    except ImportError:
+        raise ScanError('video scanning needs OpenCV (opencv-python-headless)')
+    capture = cv2.VideoCapture(path)
+    if not capture.isOpened():
+        capture.release()
+        raise ScanError('not a readable video file')
+    fps = capture.get(cv2.CAP_PROP_FPS)
+    if not fps or fps != fps or fps > 1000:
+        fps = 30.0
+    step = max(1, round(fps / sample_fps))
+
+    def frames():
+        index = 0
+        try:
+            while index / fps <= max_seconds:
+                if index % step:
+                    if not capture.grab():
+                        return
+                else:
+                    ok, frame = capture.read()
+                    if not ok:
+                        return
+                    small = cv2.resize(frame, (img_size, img_size), interpolation=cv2.INTER_AREA)
+                    yield round(index / fps, 3), cv2.cvtColor(small, cv2.COLOR_BGR2RGB)
+                index += 1
+        finally:
+            capture.release()
+
+    return frames()
+
+
+def burst_frames(streams, img_size=224, interval=1.0):
+    """
+    (seconds, RGB uint8 frame) for a burst of photos taken interval seconds apart
+    JPEGs are decoded at reduced size; a photo that fails to decode is skipped with a warning
+    """
+    for index, stream in enumerate(streams):
+        try:
+            img = Image.open(stream if hasattr(stream, 'read') else io.BytesIO(stream))
+            img.draft('RGB', (img_size, img_size))
+            pixels = np.asarray(img.convert('RGB').resize((img_size, img_size)))
+        except Exception as e:
+            log.warning("Skipping burst frame %s: %s", index, e)
+            continue
+        yield round(index * interval, 3), pixels
+
+
+class FrameDiff:
+    """Cheap near-duplicate filter on downscaled grayscale frames"""
+
+    def __init__(self, threshold=DIFF_THRESHOLD):
+        self.threshold = threshold
+        self._last = None
+
+    def changed(self, pixels):
+        """True (and remember the frame) when it differs enough from the last kept frame"""
+        signature = np.asarray(Image.fromarray(pixels).convert('L').resize((SIGNATURE, SIGNATURE)),
+                               dtype=np.int16)
+        if self._last is not None and np.abs(signature - self._last).mean() < self.threshold:
+            return False
+        self._last = signature
+        return True
+
+
+class ScanReport:
+    """Frame counts and per-pest sightings over the course of a scan"""
+
+    def __init__(self, min_confidence=MIN_CONFIDENCE, gap=SEGMENT_GAP):
+        self.min_confidence = min_confidence
+        self.gap = gap
+        self.sampled = 0
+        self.skipped = 0
+        self.analyzed = 0
+        self.failed = 0
+        self.duration = 0.0
+        self.error = None
+        self.pests = {}
+
+    def add(self, seconds, result):
+        """Count one analyzed frame; returns its record for the frame list"""
+        if not result.get('success'):
+            self.failed += 1
+            return {'t': seconds, 'success': False, 'error': result.get('error')}
+        self.analyzed += 1
+        name, confidence = result['predicted_class'], result['confidence']
+        if confidence >= self.min_confidence:
+            pest = self.pests.setdefault(name, {'frames': 0, 'max_confidence': 0.0, 'total_confidence': 0.0,
+                                                'first_seen': seconds, 'last_seen': seconds, 'segments': []})
+            pest['frames'] += 1
+            pest['max_confidence'] = max(pest['max_confidence'], confidence)
+            pest['total_confidence'] += confidence
+            if pest['segments'] and seconds - pest['segments'][-1][1] <= self.gap:
+                pest['segments'][-1][1] = seconds
+            else:
+                pest['segments'].append([seconds, seconds])
+            pest['last_seen'] = seconds
+        return {'t': seconds, 'success': True, 'predicted_class': name, 'confidence': confidence}
+
+    def as_dict(self):
+        pests = {}
+        for name, pest in sorted(self.pests.items(), key=lambda item: (item[1]['frames'], item[1]['max_confidence']),
+                                 reverse=True):
+            pests[name] = {key: value for key, value in pest.items() if key != 'total_confidence'}
+            pests[name]['mean_confidence'] = round(pest['total_confidence'] / pest['frames'], 2)
+        return {
+            'sampled': self.sampled,
+            'skipped': self.skipped,
+            'analyzed': self.analyzed,
+            'failed': self.failed,
+            'duration_s': round(self.duration, 3),
+            'dominant_pest': next(iter(pests), None),
+            'pests': pests,
+            'error': self.error,
+        }
+
+
+def scan(frames, predict_batch, img_size, report, diff_threshold=DIFF_THRESHOLD, max_batch=16):
+    """
+    Generator of per-frame records for the frames that pass the difference filter,
+    in order, updating report as it goes
+    Frames are pulled from `frames` only as tensor slots free up, so a slow
+    model holds the video back instead of letting frames pile up.
+    """
+    diff = FrameDiff(diff_threshold)
+    times = deque()
+
+    def kept():
+        for seconds, pixels in frames:
+            report.sampled += 1
+            report.duration = seconds
+            if not diff.changed(pixels):
+                report.skipped += 1
+                continue
+            times.append(seconds)
+            yield pixels
+
+    # Frames arrive already at the model's size; "decoding" is only the scaling
+    pipeline = InferencePipeline(predict_batch, img_size, decode_threads=1, max_batch=max_batch)
+    for result in pipeline.map(kept(), decode=scale_into):
+        yield report.add(times.popleft(), result)
+
+
+def stream_scan(records, scan_id, report, save=None):
+    """
+    Generator of response text: a JSON document with the per-frame records
+    as they are produced and the report at the end; save(report_dict) runs
+    once the scan is over
+    """
+    yield '{"scan_id": %s, "frames": [' % json.dumps(scan_id)
+    first = True
+    try:
+        for record in records:
+            yield ('' if first else ',') + json.dumps(record)
+            first = False
+    except ScanError as e:
+        # Headers are already sent, so the failure goes into the body
+        report.error = str(e)
+    except Exception as e:
+        log.exception("Scan %s failed: %s", scan_id, e)
+        report.error = str(e)
+    summary = report.as_dict()
+    if save is not None:
+        try:
+            save(summary)
+        except Exception as e:
+            log.exception("Could not save scan %s: %s", scan_id, e)
+    yield '], "report": %s}' % json.dumps(summary)
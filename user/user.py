@@ -2,13 +2,18 @@ import requests
 import hashlib
 import json
 import ast
+import logging
+import math
 import re
-from functools import wraps
-from flask import Flask, request, render_template, redirect, url_for, flash, session, jsonify, make_response
+from functools import wraps, partial
+from flask import Flask, request, render_template, redirect, url_for, flash, session, jsonify, make_response, Response, stream_with_context
 from flask_pymongo import PyMongo
 from flask_cors import CORS  
 from dotenv import load_dotenv
 import os
+import shutil
+import tempfile
+import threading
 import time
 from datetime import datetime, timedelta
 from bson.objectid import ObjectId
@@ -19,14 +24,52 @@ import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # NOW import local modules
+from user.utils.logs import setup_logging
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Structured logging: records go through a queue and are written by a background
+# thread. LOG_LEVEL / LOG_LEVELS ("user.app=DEBUG,ml_model=WARNING") / LOG_FORMAT
+# (json|text) / LOG_DEBUG_SAMPLE, see utils/logs.py.
+# Set up before the other modules (and the model) are imported so their
+# startup messages go through it.
+setup_logging()
+log = logging.getLogger('user.app')
+
 from user.utils.cloudinary_config import configure_cloudinary, upload_to_cloudinary, delete_from_cloudinary
-import google.generativeai as genai
 from user.languages import LANGUAGES
-from ml_model.predictor import predict_pest
+from user.utils.pests import get_pest_details
+from user.utils.pest_store import PestKnowledgeStore
+from user.utils.page_cache import PageCache, page_key, has_pending_flashes
+from user.utils.static_assets import StaticAssets
+from user.utils.image_variants import ImageVariants
+from user.utils import crop_engine
+from user.utils import crop_batch
+from user.utils.crop_grid import CropGrid, GRID_DIR as CROP_GRID_DIR
+from user.utils.llm_advice import CropAdvisor, default_model
+from user.utils.latency import LatencyTracker
+from user.utils.timing import RequestTiming, span
+from user.utils.metrics import Metrics, MongoCommandMetrics, SIZE_BUCKETS, registry as metrics_registry
+from user.utils.query_profiler import QueryProfiler
+from markupsafe import Markup
 import io
 
-# Load environment variables from .env file
-load_dotenv()
+# MODEL_SERVER points at a running `python -m ml_model.serving` pool: this
+# worker then only decodes images and never loads TensorFlow or the model
+if os.getenv('MODEL_SERVER'):
+    from ml_model.serving import predict_pest
+    # Tiled mode, video scans and test-time augmentation need the model in this process
+    predict_tiles = None
+    scan_frames = None
+    if os.getenv('MODEL_TTA', 'off').lower() != 'off':
+        log.warning("MODEL_TTA=%s has no effect with MODEL_SERVER: model processes only "
+                    "receive the 224px tensor, not the photo the TTA views are cut from",
+                    os.getenv('MODEL_TTA'))
+else:
+    from ml_model.predictor import predict_pest, predict_tiles, scan_frames
+from ml_model import video
+from werkzeug.exceptions import RequestEntityTooLarge
 
 app = Flask(__name__)
 CORS(app)
@@ -72,9 +115,101 @@ def clean_for_json(obj):
 
 # Use MongoDB Atlas connection from .env file
 app.config['MONGO_URI'] = os.getenv('MONGO_URI', 'mongodb://localhost:27017/pest')
-mongo = PyMongo(app)
+# Every MongoDB command is counted and timed for /metrics. MONGO_PROFILE=1 also
+# profiles them per endpoint and query shape for /admin/query-profile (slow,
+# collection scans, N+1); MONGO_SLOW_MS / MONGO_N_PLUS_ONE set the thresholds and
+# MONGO_PROFILE_EXPLAIN=1 adds explain() plan checks, an extra query per new shape.
+query_profiler = QueryProfiler(
+    client_getter=lambda: mongo.cx,
+    slow_ms=float(os.getenv('MONGO_SLOW_MS', '100')),
+    n_plus_one=int(os.getenv('MONGO_N_PLUS_ONE', '5')),
+    explain=os.getenv('MONGO_PROFILE_EXPLAIN', '0') == '1'
+) if os.getenv('MONGO_PROFILE', '0') == '1' else None
+mongo = PyMongo(app, event_listeners=[listener for listener in (MongoCommandMetrics(metrics_registry), query_profiler)
+                                      if listener is not None])
 db = mongo.db  # Alias for easier access
 
+# Resized copies of the bundled images (python -m user.utils.image_variants build)
+image_variants = ImageVariants(app.static_folder)
+
+# Cached view over pests.py, pest_library.py and the pests collection
+pest_store = PestKnowledgeStore(lambda: mongo.db, image_variants=image_variants)
+
+# Rendered pest library / detail pages, keyed by language, role and pest_store.version.
+# Set PAGE_CACHE_DIR to share rendered pages between workers on one host.
+page_cache = PageCache(
+    max_entries=int(os.getenv('PAGE_CACHE_SIZE', '256')),
+    disk_dir=os.getenv('PAGE_CACHE_DIR') or None
+)
+pest_store.add_listener(page_cache.clear)
+
+# Fingerprinted, precompressed static files (python -m user.utils.static_assets build)
+static_assets = StaticAssets(app)
+
+# Prometheus metrics at /metrics (request counts and latency per endpoint plus the
+# instruments below). METRICS_DIR adds up gunicorn workers on one host,
+# METRICS_TOKEN requires an Authorization: Bearer token.
+metrics = Metrics(
+    app,
+    registry=metrics_registry,
+    directory=os.getenv('METRICS_DIR') or None,
+    token=os.getenv('METRICS_TOKEN') or None
+)
+inference_batch_size = metrics_registry.histogram('inference_batch_size', 'Images per model call',
+                                                  buckets=SIZE_BUCKETS)
+inference_queue_depth = metrics_registry.gauge('inference_queue_depth',
+                                               'Predictions waiting for or running on the model')
+
+# Per-request stage timings recorded with span() (see /admin/api/timing/stats).
+# REQUEST_TIMING=0 turns them off, SERVER_TIMING_HEADER=1 adds a Server-Timing
+# header, REQUEST_TIMING_LOG=1 logs one structured record per timed request.
+request_timing = RequestTiming(
+    app,
+    registry=metrics_registry,
+    enabled=os.getenv('REQUEST_TIMING', '1') != '0',
+    header=os.getenv('SERVER_TIMING_HEADER') == '1',
+    log=os.getenv('REQUEST_TIMING_LOG') == '1'
+)
+
+# Precomputed crop advisor results for rounded inputs (python -m user.utils.crop_grid build)
+crop_grid = CropGrid.load(os.getenv('CROP_GRID_DIR', CROP_GRID_DIR))
+
+# Rolling p50/p95/p99 timings (crop page, Gemini call), see /admin/api/latency/stats
+latency = LatencyTracker(window=int(os.getenv('LATENCY_WINDOW', '1000')))
+
+# Gemini advice for the crop advisor: one client per process, answers cached by
+# bucketed inputs, concurrent identical prompts share one call. Calls run in the
+# background and the page polls for them until LLM_ADVICE_DEADLINE seconds.
+# LLM_ADVICE_FAKE=1 swaps in an offline fake model.
+crop_advisor = CropAdvisor(
+    lambda inputs: create_crop_prompt(inputs, 'english'),
+    model=default_model(),
+    db_getter=lambda: mongo.db,
+    ttl=int(os.getenv('LLM_ADVICE_TTL', str(24 * 3600))),
+    deadline=float(os.getenv('LLM_ADVICE_DEADLINE', '12')),
+    latency=latency
+)
+
+def cache_metrics():
+    """Hit/miss counts the caches already keep, read when /metrics is scraped"""
+    samples = []
+    def lookups(cache, hits, misses):
+        description = 'Cache lookups by result'
+        samples.append(('cache_requests_total', 'counter', description, {'cache': cache, 'result': 'hit'}, hits))
+        samples.append(('cache_requests_total', 'counter', description, {'cache': cache, 'result': 'miss'}, misses))
+    
+    stats = page_cache.stats()
+    lookups('page', stats['hits'] + stats['disk_hits'], stats['misses'])
+    stats = crop_advisor.stats()
+    lookups('llm_advice', stats['hits'] + stats['shared_hits'] + stats['coalesced'], stats['misses'])
+    samples.append(('llm_advice_in_flight', 'gauge', 'Gemini calls in progress', {}, stats['in_flight']))
+    if crop_grid is not None:
+        stats = crop_grid.stats()
+        lookups('crop_grid', stats['hits'], stats['misses'])
+    return samples
+
+metrics_registry.add_callback(cache_metrics)
+
 # Configure upload folder
 UPLOAD_FOLDER = 'static/uploads/'
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
@@ -178,11 +313,11 @@ def ensure_unique_username(base_username):
 
 def send_verification_email(email, token):
     """Send verification email (placeholder - implement with your email service)"""
-    print(f"[EMAIL SENT] Verification email to {email}")
-    print(f"[TOKEN] {token}")
+    log.info("Verification email sent to %s", email, extra={'email': email})
+    log.debug("Verification token: %s", token)
     # In production, use: sendgrid, smtp, or AWS SES
     verification_url = f"http://localhost:5000/verify/email/{token}"
-    print(f"[VERIFICATION URL] {verification_url}")
+    log.debug("Verification URL: %s", verification_url)
     return True
 
 @app.before_request
@@ -205,13 +340,11 @@ def before_request():
                     elif session.get('role') == 'admin':
                         session['language'] = lang.lower()
                 except Exception as e:
-                    print(f"Error updating language: {e}")
+                    log.exception("Error updating language: %s", e)
     
     # Debug for predict route
     if request.path == '/predict':
-        print(f"\n📥 Incoming request to /predict:")
-        print(f"   Method: {request.method}")
-        print(f"   Language: {session.get('language')}")
+        log.debug("Incoming request to /predict", extra={'language': session.get('language')})
 
 # ==================== AUTHENTICATION ROUTES ====================
 
@@ -251,11 +384,11 @@ def process_auth():
     password = request.form.get('password', '')
     action = request.form.get('action')  # 'signin' or 'join'
     
-    print(f"🔐 AUTH PROCESS: email={email}, action={action}")
+    log.info("AUTH PROCESS: email=%s, action=%s", email, action)
     
     # ============ ADMIN LOGIN CHECK ============
     if email == 'admin@gmail.com' and password == 'admin':
-        print("✅ ADMIN LOGIN DETECTED")
+        log.info("ADMIN LOGIN DETECTED")
         # Set admin session
         session['user_id'] = 'admin'
         session['email'] = 'admin@gmail.com'
@@ -280,7 +413,7 @@ def process_auth():
 
 def handle_join_now(email, password):
     """Handle new user registration with REAL email verification"""
-    print(f"🆕 JOIN NOW: {email}")
+    log.info("JOIN NOW: %s", email)
     
     try:
         # 1. Validate email format
@@ -340,7 +473,7 @@ def handle_join_now(email, password):
         # 9. Save to database
         result = db.users.insert_one(new_user)
         user_id = str(result.inserted_id)
-        print(f"✅ USER CREATED: {email} -> {user_id}")
+        log.info("USER CREATED: %s -> %s", email, user_id)
         
         # 10. Send verification email
         send_verification_email(email, verification_token)
@@ -358,13 +491,13 @@ def handle_join_now(email, password):
         return redirect(url_for('user_dashboard'))
         
     except Exception as e:
-        print(f"❌ REGISTRATION ERROR: {e}")
+        log.exception("REGISTRATION ERROR: %s", e)
         flash('Registration failed. Please try again.', 'danger')
         return redirect(url_for('login'))
 
 def handle_sign_in(email, password):
     """Handle existing user sign in"""
-    print(f"🔑 SIGN IN: {email}")
+    log.info("SIGN IN: %s", email)
     
     try:
         # 1. Find user
@@ -403,7 +536,7 @@ def handle_sign_in(email, password):
         session['auth_method'] = 'local'
         session['email_verified'] = user.get('email_verified', False)
         
-        print(f"✅ SIGN IN SUCCESS: {email}")
+        log.info("SIGN IN SUCCESS: %s", email)
         flash('Signed in successfully!', 'success')
         
         # 7. Redirect based on role
@@ -412,7 +545,7 @@ def handle_sign_in(email, password):
         return redirect(url_for('user_dashboard'))
         
     except Exception as e:
-        print(f"❌ SIGN IN ERROR: {e}")
+        log.exception("SIGN IN ERROR: %s", e)
         flash('Sign in failed. Please try again.', 'danger')
         return redirect(url_for('login'))
 
@@ -436,7 +569,7 @@ def google_auth_start():
         f"prompt=select_account"
     )
     
-    print(f"🔗 GOOGLE AUTH URL: {google_auth_url[:100]}...")
+    log.info("GOOGLE AUTH URL: %s...", google_auth_url[:100])
     return redirect(google_auth_url)
 
 @app.route('/auth/google/callback')
@@ -448,7 +581,7 @@ def google_auth_callback():
         flash('Google authentication failed', 'danger')
         return redirect(url_for('login'))
     
-    print(f"🔄 GOOGLE CALLBACK: code received")
+    log.info("GOOGLE CALLBACK: code received")
     
     try:
         # 1. Exchange code for tokens
@@ -478,14 +611,14 @@ def google_auth_callback():
         google_id = user_info['sub']
         profile_picture = user_info.get('picture', '')
         
-        print(f"👤 GOOGLE USER: {email} ({name})")
+        log.info("GOOGLE USER: %s (%s)", email, name)
         
         # 4. Check if user exists
         existing_user = db.users.find_one({'email': email})
         
         if existing_user:
             # ===== EXISTING USER - LOGIN =====
-            print(f"✅ EXISTING USER LOGIN: {email}")
+            log.info("EXISTING USER LOGIN: %s", email)
             
             if not existing_user.get('is_active', True):
                 flash('Account deactivated', 'danger')
@@ -513,7 +646,7 @@ def google_auth_callback():
             
         else:
             # ===== NEW USER - AUTO REGISTER =====
-            print(f"🆕 NEW USER REGISTRATION VIA GOOGLE: {email}")
+            log.info("NEW USER REGISTRATION VIA GOOGLE: %s", email)
             
             # Generate username
             if name:
@@ -561,7 +694,7 @@ def google_auth_callback():
         return redirect(url_for('user_dashboard'))
         
     except Exception as e:
-        print(f"❌ GOOGLE AUTH ERROR: {e}")
+        log.exception("GOOGLE AUTH ERROR: %s", e)
         flash('Google authentication failed. Try email login.', 'danger')
         return redirect(url_for('login'))
 
@@ -638,7 +771,7 @@ def verify_email(token):
         return redirect(url_for('user_dashboard'))
         
     except Exception as e:
-        print(f"❌ VERIFICATION ERROR: {e}")
+        log.exception("VERIFICATION ERROR: %s", e)
         flash('Verification failed', 'danger')
         return redirect(url_for('login'))
 
@@ -672,7 +805,7 @@ def resend_verification():
             flash('Email already verified', 'info')
             
     except Exception as e:
-        print(f"❌ RESEND ERROR: {e}")
+        log.exception("RESEND ERROR: %s", e)
         flash('Failed to resend verification', 'danger')
     
     return redirect(url_for('user_dashboard'))
@@ -736,7 +869,7 @@ def change_language(lang):
                         {'$set': {'language': lang}}
                     )
                 except Exception as e:
-                    print(f"Error updating language: {e}")
+                    log.exception("Error updating language: %s", e)
             elif session.get('role') == 'admin':
                 # For admin, just update session
                 session['language'] = lang
@@ -816,8 +949,7 @@ def officer():
 
 @app.route('/predict', methods=['GET', 'POST'])
 def make_prediction():
-    print("=" * 60)
-    print("DEBUG: /predict route called")
+    log.debug("predict route called")
     
     if request.method == 'GET':
         return redirect(url_for('predict_page'))
@@ -839,113 +971,123 @@ def make_prediction():
     # 1. Save file locally
     filename = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{file.filename}"
     filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-    file.save(filepath)
+    with span('save'):
+        file.save(filepath)
     
-    print(f"DEBUG: File saved locally: {filename}")
+    log.debug("File saved locally: %s", filename)
 
     # 2. Upload to Cloudinary
-    print("DEBUG: Uploading to Cloudinary...")
-    cloudinary_result = upload_to_cloudinary(filepath)
+    log.debug("Uploading to Cloudinary...")
+    with span('cloudinary'):
+        cloudinary_result = upload_to_cloudinary(filepath)
     
     cloudinary_url = ""
     public_id = ""
     if cloudinary_result['success']:
         cloudinary_url = cloudinary_result['url']
         public_id = cloudinary_result['public_id']
-        print(f"DEBUG: Uploaded to Cloudinary - URL: {cloudinary_url}")
+        log.debug("Uploaded to Cloudinary - URL: %s", cloudinary_url)
     else:
-        print(f"DEBUG: Cloudinary upload failed: {cloudinary_result.get('error')}")
+        log.warning("Cloudinary upload failed: %s", cloudinary_result.get('error'))
 
     # ========== REPLACED FASTAPI WITH LOCAL MODEL ==========
-    # Import local model predictor
-    from ml_model.predictor import predict_pest
-    
     predicted_class_name = "Unknown"
     confidence_value = 0
     all_predictions = {}
+    prediction_result = {}
     
     try:
-        print("DEBUG: Running local model prediction...")
+        log.debug("Running local model prediction...")
         
         # Read the file bytes for prediction
-        with open(filepath, 'rb') as f:
-            image_bytes = f.read()
-        
-        # Call local model
-        prediction_result = predict_pest(image_bytes)
+        with span('read'):
+            with open(filepath, 'rb') as f:
+                image_bytes = f.read()
+        
+        # Call local model (times its own decode and inference stages);
+        # mode=tiles classifies overlapping tiles of large photos (ml_model/tiling.py)
+        tiled = request.form.get('mode') == 'tiles' and predict_tiles is not None
+        with inference_queue_depth.track():
+            if tiled:
+                prediction_result = predict_tiles(image_bytes, span=span)
+            else:
+                prediction_result = predict_pest(image_bytes, span=span)
+        inference_batch_size.observe(1)
         
         if prediction_result['success']:
             predicted_class_name = prediction_result['predicted_class']
             confidence_value = prediction_result['confidence']
             all_predictions = prediction_result['all_predictions']
             
-            print(f"DEBUG: Got prediction: '{predicted_class_name}' ({confidence_value}%)")
+            log.debug("Got prediction: '%s' (%s%%)", predicted_class_name, confidence_value,
+                      extra={'pest': predicted_class_name, 'confidence': confidence_value})
             flash('Pest detection successful!', 'success')
         else:
-            print(f"DEBUG: Model error: {prediction_result.get('error')}")
+            log.warning("Model error: %s", prediction_result.get('error'))
             flash('Prediction failed!', 'danger')
             predicted_class_name = "Error"
             
     except Exception as e:
-        print(f"DEBUG: Exception: {str(e)}")
+        log.exception("Prediction failed: %s", e)
         flash(f'Prediction error: {str(e)}', 'danger')
         predicted_class_name = "Error"
     # ========================================================
 
     # 4. Get pest details - Always use English for detection results
     try:
-        from utils.pests import get_pest_details
-        pest_details = get_pest_details(predicted_class_name, 'english')
-        print(f"DEBUG: Got pest details")
+        with span('pest_details'):
+            pest_details = get_pest_details(predicted_class_name, 'english')
+        log.debug("Got pest details")
     except Exception as e:
-        print(f"DEBUG: Error getting pest details: {e}")
+        log.warning("Error getting pest details: %s", e)
         pest_details = create_fallback_pest_details(predicted_class_name, confidence_value, 'english')
     
     # 5. Store pest details in pests collection if not already there
     if predicted_class_name not in ["Unknown", "Error", "Server Error", "Connection Error", "Timeout Error"]:
-        try:
-            # Check if pest already exists in pests collection
-            existing_pest = mongo.db.pests.find_one({'name': predicted_class_name})
+        with span('pest_upsert'):
+            try:
+                # Check if pest already exists in pests collection
+                existing_pest = mongo.db.pests.find_one({'name': predicted_class_name})
             
-            if not existing_pest:
-                # Create new pest entry in pests collection with complete details
-                new_pest = {
-                    'name': predicted_class_name,
-                    'scientific_name': pest_details.get('scientific_name', ''),
-                    'description': pest_details.get('description', f'Detected as {predicted_class_name}'),
-                    'harmful_effects': pest_details.get('harmful_effects', []),
-                    'organic_solutions': pest_details.get('organic_solutions', []),
-                    'chemical_pesticides': pest_details.get('chemical_pesticides', []),
-                    'prevention_methods': pest_details.get('prevention_methods', []),
-                    'severity': pest_details.get('severity', 'medium'),
-                    'image': pest_details.get('image', ''),
-                    'language': 'english',
-                    'category': 'detected',
-                    'created_at': datetime.now(),
-                    'added_by': session.get('username', 'user'),
-                    'detection_count': 1,
-                    'last_detected': datetime.now(),
-                    'updated_at': datetime.now()
-                }
+                if not existing_pest:
+                    # Create new pest entry in pests collection with complete details
+                    new_pest = {
+                        'name': predicted_class_name,
+                        'scientific_name': pest_details.get('scientific_name', ''),
+                        'description': pest_details.get('description', f'Detected as {predicted_class_name}'),
+                        'harmful_effects': pest_details.get('harmful_effects', []),
+                        'organic_solutions': pest_details.get('organic_solutions', []),
+                        'chemical_pesticides': pest_details.get('chemical_pesticides', []),
+                        'prevention_methods': pest_details.get('prevention_methods', []),
+                        'severity': pest_details.get('severity', 'medium'),
+                        'image': pest_details.get('image', ''),
+                        'language': 'english',
+                        'category': 'detected',
+                        'created_at': datetime.now(),
+                        'added_by': session.get('username', 'user'),
+                        'detection_count': 1,
+                        'last_detected': datetime.now(),
+                        'updated_at': datetime.now()
+                    }
                 
-                mongo.db.pests.insert_one(new_pest)
-                print(f"✅ Added new pest '{predicted_class_name}' to pests collection")
-            else:
-                # Update detection count and timestamp
-                mongo.db.pests.update_one(
-                    {'_id': existing_pest['_id']},
-                    {
-                        '$inc': {'detection_count': 1},
-                        '$set': {
-                            'last_detected': datetime.now(),
-                            'updated_at': datetime.now()
+                    mongo.db.pests.insert_one(new_pest)
+                    log.info("Added new pest '%s' to pests collection", predicted_class_name)
+                else:
+                    # Update detection count and timestamp
+                    mongo.db.pests.update_one(
+                        {'_id': existing_pest['_id']},
+                        {
+                            '$inc': {'detection_count': 1},
+                            '$set': {
+                                'last_detected': datetime.now(),
+                                'updated_at': datetime.now()
+                            }
                         }
-                    }
-                )
-                print(f"✅ Updated detection count for '{predicted_class_name}'")
+                    )
+                    log.debug("Updated detection count for '%s'", predicted_class_name)
                 
-        except Exception as e:
-            print(f"❌ Error storing pest in collection: {e}")
+            except Exception as e:
+                log.exception("Error storing pest in collection: %s", e)
 
     # 6. Save to user_uploads database
     upload_record = {
@@ -963,27 +1105,149 @@ def make_prediction():
         'cloudinary_public_id': public_id,
         'pest_details': pest_details  # Store pest details in the upload record
     }
+    if prediction_result.get('detections') is not None:
+        upload_record['detections'] = prediction_result['detections']
+        upload_record['tile_summary'] = prediction_result['summary']
     
-    result = mongo.db.user_uploads.insert_one(upload_record)
+    with span('db_insert'):
+        result = mongo.db.user_uploads.insert_one(upload_record)
     upload_id = str(result.inserted_id)
     
-    print(f"DEBUG: Saved to database with ID: {upload_id}")
+    log.debug("Saved to database with ID: %s", upload_id)
 
     # 7. Render result - Result page will handle its own language
     image_url = cloudinary_url if cloudinary_url else f"/static/uploads/{filename}"
     
-    print(f"DEBUG: Using image URL: {image_url}")
-    
-    return render_template('result.html',
-                         pest=pest_details,
-                         confidence=f"{confidence_value:.1f}%",
-                         all_predictions=all_predictions,
-                         predicted_class=predicted_class_name,
-                         title='Pest Detection Result',
-                         image_url=image_url,
-                         current_lang='english',  # Default language for result page
-                         upload_id=upload_id,
-                         now=datetime.now())
+    log.debug("Using image URL: %s", image_url)
+    
+    with span('render'):
+        return render_template('result.html',
+                             pest=pest_details,
+                             confidence=f"{confidence_value:.1f}%",
+                             all_predictions=all_predictions,
+                             predicted_class=predicted_class_name,
+                             title='Pest Detection Result',
+                             image_url=image_url,
+                             current_lang='english',  # Default language for result page
+                             upload_id=upload_id,
+                             detections=upload_record.get('detections'),
+                             tile_summary=upload_record.get('tile_summary'),
+                             now=datetime.now())
+
+# Each scan holds its own tensor ring and threads (ml_model/video.py)
+scan_slots = threading.BoundedSemaphore(video.MAX_SCANS)
+
+@app.route('/predict/scan', methods=['POST'])
+@login_required
+def scan_video():
+    """
+    Pest scan of a short video (`file`) or a burst of photos (`files`), see
+    ml_model/video.py. ?fps= sets the sampling rate, ?diff= the near-duplicate
+    threshold and ?interval= the seconds between burst photos. Streams JSON:
+    one record per analyzed frame, then the report of pests over time.
+    Uploads over MODEL_VIDEO_MAX_MB or MODEL_VIDEO_MAX_BURST photos get 413;
+    past MODEL_VIDEO_MAX_SCANS running scans the request gets 503.
+    """
+    if scan_frames is None:
+        return jsonify({'success': False, 'error': 'Scanning needs the model in this process'}), 503
+    if not scan_slots.acquire(blocking=False):
+        return jsonify({'success': False, 'error': 'Too many scans running, try again shortly'}), 503
+    response = None
+    try:
+        response = _start_scan()
+        return response
+    finally:
+        if isinstance(response, Response) and response.is_streamed:
+            # Runs once the body is done, or the client went away
+            response.call_on_close(scan_slots.release)
+        else:
+            scan_slots.release()
+
+def _start_scan():
+    try:
+        sample_fps = float(request.args.get('fps', video.SAMPLE_FPS))
+        diff_threshold = float(request.args.get('diff', video.DIFF_THRESHOLD))
+        interval = float(request.args.get('interval', 1 / sample_fps))
+        # nan passes the comparisons below and is not valid JSON in the report
+        if not all(math.isfinite(value) for value in (sample_fps, diff_threshold, interval)):
+            raise ValueError
+        if sample_fps <= 0 or diff_threshold < 0 or interval < 0:
+            raise ValueError
+    except (ValueError, ZeroDivisionError):
+        return jsonify({'success': False, 'error': 'fps must be positive, diff and interval non-negative numbers'}), 400
+
+    too_large = jsonify({'success': False, 'error': f'Upload is larger than {video.MAX_UPLOAD_BYTES // 2 ** 20} MB'}), 413
+    if request.content_length is not None and request.content_length > video.MAX_UPLOAD_BYTES:
+        return too_large
+    # Also stops chunked uploads without a Content-Length while the form is parsed
+    request.max_content_length = video.MAX_UPLOAD_BYTES
+    try:
+        upload = request.files.get('file')
+        burst = [f for f in request.files.getlist('files') if f.filename]
+    except RequestEntityTooLarge:
+        return too_large
+    if (upload is None or upload.filename == '') and not burst:
+        return jsonify({'success': False, 'error': 'Send a video as file or photos as files'}), 400
+    if len(burst) > video.MAX_BURST:
+        return jsonify({'success': False, 'error': f'A burst can have at most {video.MAX_BURST} photos'}), 413
+
+    # Spool the upload so the response can outlive the request's own file handles
+    video_path = None
+    spooled = []
+    if burst:
+        for f in burst:
+            spooled.append(tempfile.SpooledTemporaryFile(max_size=1024 * 1024))
+            shutil.copyfileobj(f.stream, spooled[-1], 1024 * 1024)
+            spooled[-1].seek(0)
+        frames = video.burst_frames(spooled, interval=interval)
+    else:
+        # OpenCV reads from a path; copy to disk in chunks instead of into memory
+        fd, video_path = tempfile.mkstemp(suffix=os.path.splitext(secure_filename(upload.filename))[1])
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                shutil.copyfileobj(upload.stream, f, 1024 * 1024)
+            frames = video.video_frames(video_path, sample_fps=sample_fps)
+        except video.ScanError as e:
+            os.unlink(video_path)
+            return jsonify({'success': False, 'error': str(e)}), 400
+        except Exception:
+            os.unlink(video_path)
+            raise
+
+    user_id = session['user_id']
+    username = session.get('username', 'Unknown')
+    scan_id = str(ObjectId())
+    source = 'burst' if burst else 'video'
+    report = video.ScanReport()
+
+    def save(summary):
+        mongo.db.video_scans.insert_one({
+            'scan_id': scan_id,
+            'user_id': user_id,
+            'username': username,
+            'source': source,
+            'filename': upload.filename if upload is not None and not burst else None,
+            'sample_fps': sample_fps,
+            'report': summary,
+            'created_at': datetime.now(),
+        })
+
+    def body():
+        with inference_queue_depth.track():
+            yield from video.stream_scan(scan_frames(frames, report, diff_threshold=diff_threshold),
+                                         scan_id, report, save)
+
+    def cleanup():
+        for f in spooled:
+            f.close()
+        if video_path:
+            os.unlink(video_path)
+
+    log.info("%s scan %s started by %s", source.capitalize(), scan_id, username)
+    response = Response(stream_with_context(body()), mimetype='application/json')
+    response.headers['X-Scan-Id'] = scan_id
+    response.call_on_close(cleanup)
+    return response
 
 def create_fallback_pest_details(pest_name, confidence, language):
     """Create fallback pest details if the main function fails"""
@@ -1057,10 +1321,9 @@ def result_with_language(upload_id, lang):
         return redirect(url_for('user_dashboard'))
 
     try:
-        from utils.pests import get_pest_details
         pest_details = get_pest_details(upload_record['pest_detected'], lang)
     except Exception as e:
-        print(f"Error: {e}")
+        log.exception("Error: %s", e)
         pest_details = create_fallback_pest_details(upload_record['pest_detected'], upload_record['confidence'], lang)
     
     # Use Cloudinary URL if available, otherwise local
@@ -1073,6 +1336,8 @@ def result_with_language(upload_id, lang):
                          image_url=image_url,
                          current_lang=lang,
                          upload_id=upload_id,
+                         detections=upload_record.get('detections'),
+                         tile_summary=upload_record.get('tile_summary'),
                          now=upload_record['uploaded_at'])
 
 @app.route('/delete_upload/<upload_id>', methods=['DELETE'])
@@ -1099,23 +1364,23 @@ def delete_upload(upload_id):
             try:
                 delete_result = delete_from_cloudinary(cloudinary_public_id)
                 if delete_result['success']:
-                    print(f"✅ Deleted from Cloudinary: {cloudinary_public_id}")
+                    log.info("Deleted from Cloudinary: %s", cloudinary_public_id)
                 else:
-                    print(f"⚠️  Cloudinary delete failed: {delete_result.get('error')}")
+                    log.warning("Cloudinary delete failed: %s", delete_result.get('error'))
             except Exception as e:
-                print(f"⚠️  Error deleting from Cloudinary: {e}")
+                log.warning("Error deleting from Cloudinary: %s", e)
         
         # Delete from database
         result = mongo.db.user_uploads.delete_one({'_id': upload_obj_id})
         
         if result.deleted_count > 0:
-            print(f"✅ Deleted upload {upload_id} from database")
+            log.info("Deleted upload %s from database", upload_id)
             return jsonify({'success': True, 'message': 'Upload deleted successfully'})
         else:
             return jsonify({'success': False, 'error': 'Failed to delete from database'}), 500
             
     except Exception as e:
-        print(f"❌ Error deleting upload {upload_id}: {e}")
+        log.exception("Error deleting upload %s: %s", upload_id, e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
@@ -1125,27 +1390,8 @@ def delete_upload(upload_id):
 
 def get_potential_pests(temperature, humidity, soil_type, rainfall):
     """Get potential pests based on environmental conditions"""
-    pests = []
-    
-    if float(temperature) > 30:
-        pests.append(("Aphid", "high"))
-        pests.append(("Whitefly", "high"))
-    elif float(temperature) < 15:
-        pests.append(("Mite", "medium"))
-    
-    if float(humidity) > 70:
-        pests.append(("Fungal diseases", "high"))
-        pests.append(("Bacterial blight", "medium"))
-    
-    if soil_type.lower() in ["clay", "clay loam"]:
-        pests.append(("Root rot", "medium"))
-        pests.append(("Nematodes", "low"))
-    
-    if float(rainfall) > 200:
-        pests.append(("Water mold", "high"))
-        pests.append(("Leaf spot", "medium"))
-    
-    return pests[:5]  # Return top 5
+    # Rules live in utils/crop_engine.py (PEST_STAGES)
+    return crop_engine.potential_pests(temperature, humidity, soil_type, rainfall)  # Top 5
 
 def parse_ai_response(ai_response, language):
     """Parse Gemini AI response for crop recommendations"""
@@ -1173,11 +1419,22 @@ def parse_ai_response(ai_response, language):
         return parsed_data if parsed_data else None
         
     except Exception as e:
-        print(f"Error parsing AI response: {e}")
+        log.exception("Error parsing AI response: %s", e)
+        return None
+
+def lookup_crop_grid(form_data):
+    """Precomputed crop engine results when every input is on the grid, else None"""
+    if crop_grid is None:
+        return None
+    try:
+        conditions = {key: float(form_data.get(field) or default)
+                      for field, (key, default) in crop_engine.PROFILE_FIELDS.items()}
+    except ValueError:
         return None
+    return crop_grid.lookup(conditions, form_data.get('soil_type', ''))
 
-def create_dynamic_recommendation(form_data, language):
-    """Create dynamic crop recommendation based on inputs"""
+def create_dynamic_recommendation(form_data, language, precomputed=None):
+    """Create dynamic crop recommendation based on inputs (precomputed: lookup_crop_grid result)"""
     try:
         # Extract and convert form data
         temperature = float(form_data.get('temperature', 25))
@@ -1192,59 +1449,16 @@ def create_dynamic_recommendation(form_data, language):
         ph_level = float(form_data.get('ph_level', 6.5))
         rainfall = float(form_data.get('rainfall', 100))
         
-        # Determine optimal crops based on conditions
-        recommended_crops = []
-        suitable_conditions = []
-        
-        # Temperature-based recommendations
-        if 20 <= temperature <= 30:
-            recommended_crops.extend(['Rice', 'Wheat', 'Corn', 'Tomato', 'Cabbage'])
-            suitable_conditions.append('Ideal temperature range')
-        elif temperature > 30:
-            recommended_crops.extend(['Cotton', 'Sugarcane', 'Millet', 'Sorghum'])
-            suitable_conditions.append('Heat-tolerant crops')
+        if precomputed is not None:
+            unique_crops = precomputed['recommended_crops']
+            suitable_conditions = precomputed['suitable_conditions']
+            potential_pests = precomputed['potential_pests']
         else:
-            recommended_crops.extend(['Potato', 'Carrot', 'Spinach', 'Lettuce'])
-            suitable_conditions.append('Cool weather crops')
-        
-        # Soil type adjustments
-        if soil_type.lower() in ['sandy', 'sandy loam']:
-            recommended_crops = [crop for crop in recommended_crops if crop not in ['Rice', 'Cabbage']]
-            recommended_crops.extend(['Groundnut', 'Watermelon', 'Pumpkin'])
-            suitable_conditions.append('Sandy soil suitable crops')
-        elif soil_type.lower() in ['clay', 'clay loam']:
-            recommended_crops = [crop for crop in recommended_crops if crop not in ['Carrot', 'Potato']]
-            recommended_crops.extend(['Rice', 'Sugarcane', 'Wheat'])
-            suitable_conditions.append('Clay soil suitable crops')
-        
-        # Rainfall adjustments
-        if rainfall > 150:
-            recommended_crops = [crop for crop in recommended_crops if crop not in ['Millet', 'Sorghum']]
-            recommended_crops.extend(['Rice', 'Jute', 'Sugarcane'])
-            suitable_conditions.append('High rainfall suitable crops')
-        elif rainfall < 50:
-            recommended_crops = [crop for crop in recommended_crops if crop not in ['Rice', 'Sugarcane']]
-            recommended_crops.extend(['Millet', 'Sorghum', 'Barley'])
-            suitable_conditions.append('Low rainfall suitable crops')
-        
-        # pH level adjustments
-        if ph_level < 6.0:
-            recommended_crops = [crop for crop in recommended_crops if crop not in ['Cabbage', 'Spinach']]
-            recommended_crops.extend(['Potato', 'Tomato', 'Rice'])
-            suitable_conditions.append('Acidic soil suitable crops')
-        elif ph_level > 7.5:
-            recommended_crops = [crop for crop in recommended_crops if crop not in ['Potato', 'Tomato']]
-            recommended_crops.extend(['Cabbage', 'Spinach', 'Wheat'])
-            suitable_conditions.append('Alkaline soil suitable crops')
-        
-        # Get unique crops
-        unique_crops = []
-        for crop in recommended_crops:
-            if crop not in unique_crops:
-                unique_crops.append(crop)
-        
-        # Get potential pests
-        potential_pests = get_potential_pests(temperature, humidity, soil_type, rainfall)
+            # Crop rules (temperature, soil, rainfall, pH) live in utils/crop_engine.py
+            unique_crops, suitable_conditions = crop_engine.recommend_crops(temperature, soil_type, rainfall, ph_level)
+            
+            # Get potential pests
+            potential_pests = get_potential_pests(temperature, humidity, soil_type, rainfall)
         
         # Create recommendation object
         recommendation = {
@@ -1306,7 +1520,7 @@ RECOMMENDED PRACTICES:
         return recommendation
         
     except Exception as e:
-        print(f"Error creating dynamic recommendation: {e}")
+        log.exception("Error creating dynamic recommendation: %s", e)
         # Return fallback recommendation
         return {
             'recommended_crops': ['Rice', 'Wheat', 'Vegetables'],
@@ -1315,8 +1529,8 @@ RECOMMENDED PRACTICES:
             'full_report': 'Please check your inputs and try again.'
         }
 
-def generate_dynamic_chart_data(conditions, form_data, language):
-    """Generate dynamic chart data based on actual conditions"""
+def generate_dynamic_chart_data(conditions, form_data, language, precomputed=None):
+    """Generate dynamic chart data based on actual conditions (precomputed: lookup_crop_grid result)"""
     
     # Extract values
     temp = conditions['temperature']
@@ -1327,97 +1541,25 @@ def generate_dynamic_chart_data(conditions, form_data, language):
     phosphorous = conditions['phosphorous']
     potassium = conditions['potassium']
     
-    # Calculate scores for different crop types
-    cereal_score = min(100, max(20,
-        (min(temp, 30) / 30 * 30) +
-        (min(humidity, 80) / 80 * 20) +
-        (min(rainfall, 200) / 200 * 30) +
-        (min(nitrogen, 100) / 100 * 20)
-    ))
-    
-    vegetable_score = min(100, max(20,
-        (min(temp, 28) / 28 * 25) +
-        (min(humidity, 85) / 85 * 25) +
-        (min(rainfall, 150) / 150 * 20) +
-        (abs(ph - 6.5) <= 1.5) * 30  # Bonus for ideal pH
-    ))
-    
-    fruit_score = min(100, max(20,
-        (min(temp, 32) / 32 * 20) +
-        (min(humidity, 70) / 70 * 20) +
-        (min(potassium, 80) / 80 * 30) +
-        (min(phosphorous, 60) / 60 * 30)
-    ))
-    
-    cash_crop_score = min(100, max(20,
-        (min(temp, 35) / 35 * 40) +
-        (min(rainfall, 250) / 250 * 30) +
-        (min(nitrogen, 120) / 120 * 15) +
-        (min(potassium, 100) / 100 * 15)
-    ))
-    
-    # Pest risk calculation - MORE ACCURATE
-    pest_risk_score = min(100, max(10,
-        (temp > 30) * 20 +  # Hot weather increases pest risk
-        (temp < 15) * 5 +   # Cold weather reduces some pests
-        (humidity > 75) * 25 +  # High humidity favors pests
-        (humidity < 40) * 5 +   # Low humidity reduces some pests
-        (rainfall > 180) * 30 +  # Heavy rainfall increases fungal diseases
-        (rainfall < 30) * 10 +   # Drought increases some pests
-        (ph < 5.5 or ph > 8.0) * 25  # Extreme pH favors certain pests
-    ))
-    
-    # Soil health score
-    soil_health = min(100, max(30,
-        (min(nitrogen, 100) / 100 * 25) +
-        (min(phosphorous, 80) / 80 * 25) +
-        (min(potassium, 90) / 90 * 25) +
-        (abs(ph - 6.5) <= 1.0) * 25
-    ))
-    
-    # Generate specific pest types based on conditions
-    pest_types = []
-    pest_risks = []
-    
-    if temp > 30:
-        pest_types.extend(['Whitefly', 'Aphid', 'Mites'])
-        pest_risks.extend([40, 35, 25])
-    elif temp < 15:
-        pest_types.extend(['Slugs', 'Snails', 'Fungal diseases'])
-        pest_risks.extend([20, 15, 30])
+    # Crop-type scores, pest risk, soil health, pest chart and soil mix from utils/crop_engine.py
+    if precomputed is not None:
+        engine = precomputed['chart']
     else:
-        pest_types.extend(['Caterpillar', 'Beetle', 'Leaf miner'])
-        pest_risks.extend([25, 20, 15])
-    
-    if humidity > 75:
-        pest_types.extend(['Fungal diseases', 'Bacterial blight'])
-        pest_risks.extend([40, 25])
-    
-    if rainfall > 180:
-        pest_types.extend(['Water mold', 'Root rot'])
-        pest_risks.extend([35, 30])
+        engine = crop_engine.chart_scores(conditions, form_data.get('soil_type', ''))
+    cereal_score = engine['scores']['cereal']
+    vegetable_score = engine['scores']['vegetable']
+    fruit_score = engine['scores']['fruit']
+    cash_crop_score = engine['scores']['cash_crop']
+    pest_risk_score = engine['scores']['pest_risk']
+    soil_health = engine['scores']['soil_health']
     
     # Take top 4 pests
-    pest_types = pest_types[:4]
-    pest_risks = pest_risks[:4]
-    
-    # Crop suitability scores for specific crops - DYNAMIC BASED ON ACTUAL SCORES
-    # We'll calculate this later based on the actual recommendation
+    pest_types = engine['pest_types']
+    pest_risks = engine['pest_risks']
     
     # Soil type distribution
-    soil_labels = ['Loamy', 'Clayey', 'Sandy', 'Silty', 'Other']
-    soil_distribution = [25, 25, 20, 15, 15]  # Default distribution
-    
-    # Adjust based on actual soil type
-    soil_type = form_data.get('soil_type', '').lower()
-    if 'clay' in soil_type:
-        soil_distribution = [20, 40, 10, 15, 15]
-    elif 'sandy' in soil_type:
-        soil_distribution = [15, 10, 50, 10, 15]
-    elif 'loam' in soil_type:
-        soil_distribution = [40, 20, 15, 15, 10]
-    elif 'silt' in soil_type:
-        soil_distribution = [15, 15, 15, 45, 10]
+    soil_labels = list(crop_engine.SOIL_LABELS)
+    soil_distribution = engine['soil_distribution']
     
     return {
         'suitability_chart': {
@@ -1500,6 +1642,31 @@ Format your response clearly with bullet points or numbered lists. Be practical
     
     return prompt
 
+def apply_ai_advice(recommendation, ai_response):
+    """Merge Gemini text into a recommendation dict; False if there is nothing usable"""
+    if not ai_response or len(ai_response) <= 10:
+        return False
+    # Parse AI response to get actual recommendations
+    parsed_rec = parse_ai_response(ai_response, 'english')
+    if parsed_rec:
+        # Update recommendation with AI insights
+        recommendation.update(parsed_rec)
+        recommendation['ai_recommendation'] = ai_response[:500] + "..." if len(ai_response) > 500 else ai_response
+        recommendation['full_report'] = ai_response
+    return True
+
+def save_ai_advice(recommendation_id, future):
+    """Add advice that arrived after the page was rendered to the saved recommendation"""
+    try:
+        advice = {}
+        if not apply_ai_advice(advice, future.result()) or not advice:
+            return
+        update = {f'structured_recommendation.{field}': value for field, value in clean_for_json(advice).items()}
+        update['recommendation'] = advice['ai_recommendation']
+        mongo.db.crop_recommendations.update_one({'_id': recommendation_id}, {'$set': update})
+    except Exception as e:
+        log.exception("Error saving AI advice: %s", e)
+
 # ==================== CROP RECOMMENDATION ROUTE ====================
 
 @app.route('/crop_recommendation', methods=['GET', 'POST'])
@@ -1512,6 +1679,8 @@ def crop_recommendation():
     # Initialize variables
     recommendation = None
     chart_data = None
+    ai_advice = None
+    started = time.perf_counter()
     
     if request.method == 'POST':
         try:
@@ -1542,61 +1711,37 @@ def crop_recommendation():
                                      recommendation=None,
                                      chart_data=None)
             
-            # Configure Gemini API
-            api_key = os.getenv('GEMINI_API_KEY')
-            
-            # Use dynamic recommendation instead of mock
-            recommendation = create_dynamic_recommendation(request.form, 'english')
-            ai_response = None
-            
-            if api_key:
-                try:
-                    # Initialize Gemini API
-                    genai.configure(api_key=api_key)
-                    
-                    # Use correct model - try gemini-pro instead of gemini-1.5-pro
-                    try:
-                        model = genai.GenerativeModel('gemini-pro')
-                    except:
-                        # Fallback to any available model
-                        model = genai.GenerativeModel('models/gemini-pro')
-                    
-                    # Create prompt in English with specific instructions
-                    prompt = create_crop_prompt({
-                        'temperature': temperature,
-                        'weather': weather,
-                        'humidity': humidity,
-                        'location': location,
-                        'soil_type': soil_type,
-                        'nutrition': nutrition,
-                        'phosphorous': phosphorous,
-                        'nitrogen': nitrogen,
-                        'potassium': potassium,
-                        'ph_level': ph_level,
-                        'rainfall': rainfall
-                    }, 'english')
-                    
-                    # Generate response from Gemini
-                    response = model.generate_content(prompt)
-                    ai_response = response.text
-                    
-                    if ai_response and len(ai_response) > 10:
-                        # Parse AI response to get actual recommendations
-                        parsed_rec = parse_ai_response(ai_response, 'english')
-                        if parsed_rec:
-                            # Update recommendation with AI insights
-                            recommendation.update(parsed_rec)
-                            recommendation['ai_recommendation'] = ai_response[:500] + "..." if len(ai_response) > 500 else ai_response
-                            recommendation['full_report'] = ai_response
-                
-                except Exception as api_error:
-                    print(f"Gemini API Error: {str(api_error)}")
-                    # Keep using dynamic recommendation if API fails
-            
-            # If no AI response, use dynamic recommendation
-            if not ai_response or len(ai_response) < 10:
-                recommendation['ai_recommendation'] = recommendation['major_suggestion']
-                recommendation['full_report'] = recommendation['full_report']
+            # Rule-based recommendation renders straight away; rounded inputs come from the grid
+            precomputed = lookup_crop_grid(request.form)
+            recommendation = create_dynamic_recommendation(request.form, 'english', precomputed)
+            recommendation['ai_recommendation'] = recommendation['major_suggestion']
+
+            # Gemini advice runs in the background (cached / coalesced, see utils/llm_advice.py).
+            # A cache hit is merged now; otherwise the page polls for it.
+            advice_future = None
+            if crop_advisor.enabled:
+                advice_key, advice_future = crop_advisor.submit({
+                    'temperature': temperature,
+                    'weather': weather,
+                    'humidity': humidity,
+                    'location': location,
+                    'soil_type': soil_type,
+                    'nutrition': nutrition,
+                    'phosphorous': phosphorous,
+                    'nitrogen': nitrogen,
+                    'potassium': potassium,
+                    'ph_level': ph_level,
+                    'rainfall': rainfall
+                })
+                if advice_future.done():
+                    ai_response = advice_future.result()
+                    apply_ai_advice(recommendation, ai_response)
+                    ai_advice = {'status': 'ready' if ai_response else 'failed', 'text': ai_response}
+                    advice_future = None
+                else:
+                    ai_advice = {'status': 'pending',
+                                 'url': url_for('crop_recommendation_advice', key=advice_key),
+                                 'deadline_ms': int(crop_advisor.deadline * 1000)}
             
             # Generate dynamic chart data based on actual inputs
             conditions = {
@@ -1610,7 +1755,7 @@ def crop_recommendation():
             }
             
             # Generate NEW chart data with dynamic content
-            chart_data = generate_dynamic_chart_data(conditions, request.form, 'english')
+            chart_data = generate_dynamic_chart_data(conditions, request.form, 'english', precomputed)
             # Clean the data for JSON serialization
             chart_data = clean_for_json(chart_data)
             recommendation = clean_for_json(recommendation)
@@ -1636,7 +1781,9 @@ def crop_recommendation():
                     'created_at': datetime.now()
                 }
                 
-                mongo.db.crop_recommendations.insert_one(recommendation_data)
+                result = mongo.db.crop_recommendations.insert_one(recommendation_data)
+                if advice_future is not None:
+                    advice_future.add_done_callback(partial(save_ai_advice, result.inserted_id))
             
             flash(lang_data.get('crop_success', 'Crop recommendation generated successfully!'), 'success')
             
@@ -1644,15 +1791,18 @@ def crop_recommendation():
             recommendation = clean_for_json(recommendation)
             chart_data = clean_for_json(chart_data)
             
-            return render_template('crop_recommendation.html',
+            page = render_template('crop_recommendation.html',
                                  title=page_title,
                                  recommendation=recommendation,
                                  chart_data=chart_data,
+                                 ai_advice=ai_advice,
                                  form_data=request.form,
                                  lang=lang_data)
+            latency.observe('crop_page', (time.perf_counter() - started) * 1000)
+            return page
             
         except Exception as e:
-            print(f"Error in crop_recommendation: {str(e)}")
+            log.exception("Error in crop_recommendation: %s", e)
             error_msg = f"{lang_data.get('generate_error', 'Error generating recommendation: ')}{str(e)}"
             flash(error_msg, 'danger')
             
@@ -1676,6 +1826,70 @@ def crop_recommendation():
                          form_data=None,
                          recommendation=None,
                          chart_data=None)
+
+@app.route('/crop_recommendation/advice/<key>')
+def crop_recommendation_advice(key):
+    """Polled by the crop page until the Gemini advice is ready, failed or past its deadline"""
+    if not crop_advisor.enabled or not re.fullmatch(r'[0-9a-f]{64}', key):
+        return jsonify({'success': False, 'status': 'failed'}), 404
+    
+    status, ai_response = crop_advisor.status(key)
+    if status == 'ready' and (not ai_response or len(ai_response) <= 10):
+        status = 'failed'
+    return jsonify({
+        'success': True,
+        'status': status,
+        'advice': ai_response if status == 'ready' else None
+    })
+
+@app.route('/crop_recommendation/batch', methods=['POST'])
+@login_required
+def crop_recommendation_batch():
+    """
+    Recommendations for a CSV of field profiles (see utils/crop_batch.py).
+    Send the CSV as the request body (Content-Type: text/csv) or as a `file`
+    upload; ?format=json returns JSON instead of CSV.
+    """
+    output_format = request.args.get('format', 'csv').lower()
+    if output_format not in ('csv', 'json'):
+        return jsonify({'success': False, 'error': 'format must be csv or json'}), 400
+    
+    # Spool the upload so the response can outlive the request's own file handles;
+    # the size cap also stops chunked bodies without a Content-Length
+    request.max_content_length = crop_batch.MAX_UPLOAD_BYTES
+    try:
+        upload = request.files.get('file')
+        stream = crop_batch.spool(upload.stream if upload else request.stream)
+    except RequestEntityTooLarge:
+        return jsonify({'success': False,
+                        'error': f'Upload is larger than {crop_batch.MAX_UPLOAD_BYTES // 2 ** 20} MB'}), 413
+    try:
+        rows = crop_batch.read_rows(stream)
+    except (crop_batch.BatchError, UnicodeDecodeError) as e:
+        stream.close()
+        return jsonify({'success': False, 'error': str(e)}), 400
+    
+    user_id = session['user_id']
+    username = session.get('username', 'Guest')
+    batch_id = crop_batch.new_batch_id()
+    
+    def save_chunk(results, batch_id):
+        documents = crop_batch.recommendation_documents(results, user_id, username, batch_id)
+        if documents:
+            # One round trip per chunk instead of one insert_one per field
+            mongo.db.crop_recommendations.insert_many(documents, ordered=False)
+        return len(documents)
+    
+    log.info("Batch crop recommendation %s started by %s", batch_id, username)
+    body = crop_batch.stream_batch(rows, output_format, batch_id, save_chunk)
+    mimetype = 'text/csv' if output_format == 'csv' else 'application/json'
+    response = Response(stream_with_context(body), mimetype=mimetype)
+    response.call_on_close(stream.close)
+    response.headers['X-Batch-Id'] = batch_id
+    if output_format == 'csv':
+        response.headers['Content-Disposition'] = f'attachment; filename=crop_recommendations_{batch_id}.csv'
+    return response
+
 # ==================== ADMIN ROUTES ====================
 
 @app.route('/admin/dashboard')
@@ -1814,7 +2028,7 @@ def admin_queries():
                              title='Admin - Query Management')
         
     except Exception as e:
-        print(f"Error loading admin queries: {e}")
+        log.exception("Error loading admin queries: %s", e)
         flash('Error loading queries', 'danger')
         return redirect(url_for('admin_dashboard'))
 
@@ -1870,7 +2084,7 @@ def admin_pest_management():
                              lang=lang_data)
                              
     except Exception as e:
-        print(f"Error in pest_management: {str(e)}")
+        log.exception("Error in pest_management: %s", e)
         flash('Error loading pest management page', 'danger')
         return redirect(url_for('admin_dashboard'))
 
@@ -1900,7 +2114,7 @@ def get_pest_details_api(pest_id):
         return jsonify({'success': True, 'pest': pest})
         
     except Exception as e:
-        print(f"Error getting pest details: {str(e)}")
+        log.exception("Error getting pest details: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/admin/api/pests/add', methods=['POST'])
@@ -1945,6 +2159,7 @@ def add_pest_api():
         
         # Insert into database
         result = mongo.db.pests.insert_one(new_pest)
+        pest_store.invalidate()
         
         return jsonify({
             'success': True,
@@ -1953,7 +2168,7 @@ def add_pest_api():
         })
         
     except Exception as e:
-        print(f"Error adding pest: {e}")
+        log.exception("Error adding pest: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/admin/api/pests/<pest_id>/update', methods=['PUT'])
@@ -1996,6 +2211,7 @@ def update_pest_api(pest_id):
             {'_id': ObjectId(pest_id)},
             {'$set': update_data}
         )
+        pest_store.invalidate()
         
         return jsonify({
             'success': True,
@@ -2003,7 +2219,7 @@ def update_pest_api(pest_id):
         })
         
     except Exception as e:
-        print(f"Error updating pest: {e}")
+        log.exception("Error updating pest: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/admin/api/pests/<pest_id>/delete', methods=['DELETE'])
@@ -2023,6 +2239,7 @@ def delete_pest_api(pest_id):
         
         # Delete pest from database
         result = mongo.db.pests.delete_one({'_id': ObjectId(pest_id)})
+        pest_store.invalidate()
         
         if result.deleted_count > 0:
             # Also delete any uploads with this pest name
@@ -2036,7 +2253,7 @@ def delete_pest_api(pest_id):
             return jsonify({'success': False, 'error': 'Failed to delete pest'}), 500
             
     except Exception as e:
-        print(f"Error deleting pest: {e}")
+        log.exception("Error deleting pest: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 # ==================== NEW API ENDPOINTS FOR IMAGES ====================
@@ -2138,7 +2355,7 @@ def get_pest_images_api(pest_id):
                                 'title': 'Reference Image'
                             })
             except Exception as e:
-                print(f"Error loading hardcoded images: {e}")
+                log.exception("Error loading hardcoded images: %s", e)
         
         return jsonify({
             'success': True,
@@ -2148,7 +2365,7 @@ def get_pest_images_api(pest_id):
         })
         
     except Exception as e:
-        print(f"Error getting pest images: {str(e)}")
+        log.exception("Error getting pest images: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/admin/api/detected-images')
@@ -2199,7 +2416,7 @@ def get_detected_images_api():
         })
         
     except Exception as e:
-        print(f"Error getting detected images: {str(e)}")
+        log.exception("Error getting detected images: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/admin/api/pests/<pest_id>/update-image', methods=['PUT'])
@@ -2236,7 +2453,7 @@ def update_pest_image_api(pest_id):
                     if upload_result.get('success'):
                         update_data['image_url'] = upload_result.get('url')
                         update_data['cloudinary_public_id'] = upload_result.get('public_id')
-                        print(f"✅ Image uploaded to Cloudinary: {update_data['image_url']}")
+                        log.info("Image uploaded to Cloudinary: %s", update_data['image_url'])
                     else:
                         # Save locally as fallback
                         static_filename = f"pest_{datetime.now().strftime('%Y%m%d%H%M%S')}_{filename}"
@@ -2246,14 +2463,14 @@ def update_pest_image_api(pest_id):
                         file.seek(0)  # Reset file pointer
                         file.save(static_path)
                         update_data['image_url'] = f"/static/uploads/pests/{static_filename}"
-                        print(f"⚠️ Cloudinary upload failed. Saved locally: {update_data['image_url']}")
+                        log.warning("Cloudinary upload failed. Saved locally: %s", update_data['image_url'])
                     
                     # Clean up temp file
                     if os.path.exists(temp_path):
                         os.remove(temp_path)
                         
                 except Exception as upload_error:
-                    print(f"⚠️ Error uploading image: {upload_error}")
+                    log.warning("Error uploading image: %s", upload_error)
                     return jsonify({'success': False, 'error': 'Error uploading image'}), 500
         
         # Handle direct URL
@@ -2266,6 +2483,7 @@ def update_pest_image_api(pest_id):
             {'_id': ObjectId(pest_id)},
             {'$set': update_data}
         )
+        pest_store.invalidate()
         
         return jsonify({
             'success': True,
@@ -2274,7 +2492,7 @@ def update_pest_image_api(pest_id):
         })
         
     except Exception as e:
-        print(f"Error updating pest image: {e}")
+        log.exception("Error updating pest image: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/admin/api/pests/<pest_id>/detected-images')
@@ -2343,7 +2561,7 @@ def get_detected_images_for_pest(pest_id):
         })
         
     except Exception as e:
-        print(f"Error getting detected images: {str(e)}")
+        log.exception("Error getting detected images: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/admin/api/pests/<pest_id>/update-detected-image')
@@ -2376,6 +2594,7 @@ def update_pest_with_detected_image(pest_id):
             {'_id': ObjectId(pest_id)},
             {'$set': update_data}
         )
+        pest_store.invalidate()
         
         return jsonify({
             'success': True,
@@ -2384,7 +2603,7 @@ def update_pest_with_detected_image(pest_id):
         })
         
     except Exception as e:
-        print(f"Error updating pest with detected image: {str(e)}")
+        log.exception("Error updating pest with detected image: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500       
 
 @app.route('/migrate-pests')
@@ -2415,7 +2634,6 @@ def migrate_pests():
             
             if not existing_pest:
                 try:
-                    from utils.pests import get_pest_details
                     pest_details = get_pest_details(pest_name, 'english')
                 except:
                     pest_details = create_fallback_pest_details(pest_name, 0, 'english')
@@ -2458,7 +2676,7 @@ def migrate_pests():
                 
                 mongo.db.pests.insert_one(new_pest)
                 migrated += 1
-                print(f"✅ Migrated: {pest_name} ({count} detections)")
+                log.info("Migrated: %s (%s detections)", pest_name, count)
             else:
                 # Update existing pest with detection count
                 current_count = existing_pest.get('detection_count', 0)
@@ -2475,8 +2693,9 @@ def migrate_pests():
                     }
                 )
                 updated += 1
-                print(f"✅ Updated: {pest_name} (count: {new_count})")
+                log.info("Updated: %s (count: %s)", pest_name, new_count)
         
+        pest_store.invalidate()
         return f"Migration complete! {migrated} new pests added, {updated} existing pests updated."
         
     except Exception as e:
@@ -2494,7 +2713,7 @@ def cleanup_pests():
         result = mongo.db.pests.delete_many({
             'name': {'$in': ['Unknown', 'Error', 'Server Error', 'Connection Error', 'Timeout Error']}
         })
-        print(f"Deleted {result.deleted_count} error entries")
+        log.info("Deleted %s error entries", result.deleted_count)
         
         pests = list(mongo.db.pests.find())
         cleaned = 0
@@ -2553,8 +2772,9 @@ def cleanup_pests():
                     {'$set': update_data}
                 )
                 cleaned += 1
-                print(f"✅ Cleaned: {pest.get('name', 'Unknown')}")
+                log.info("Cleaned: %s", pest.get('name', 'Unknown'))
         
+        pest_store.invalidate()
         return f"Cleanup complete! {cleaned} pests cleaned up."
         
     except Exception as e:
@@ -2568,115 +2788,41 @@ def pest_library():
     try:
         current_lang = session.get('language', 'english').lower()
         lang_data = LANGUAGES.get(current_lang, LANGUAGES['english'])
+        is_admin = session.get('role') == 'admin'
         
-        # Get predefined pests
-        try:
-            from utils.pest_library import get_all_pests
-            predefined_pests = get_all_pests(current_lang)
-            
-            for pest in predefined_pests:
-                pest['pest_type'] = 'predefined'
-                pest['is_new'] = False
-                if pest.get('image'):
-                    # Check if it's a URL or a local path
-                    if pest['image'].startswith(('http://', 'https://', '//')):
-                        pest['image_url'] = pest['image']
-                    else:
-                        pest['image_url'] = f"/static/images/pests/{pest['image']}"
-                else:
-                    pest['image_url'] = "/static/images/pests/default.jpg"
-                pest['id'] = pest['name']
-                
-                # Format severity
-                severity = str(pest.get('severity', 'Medium')).lower()
-                if 'very' in severity:
-                    pest['severity'] = 'very_high'
-                elif 'high' in severity:
-                    pest['severity'] = 'high'
-                elif 'medium' in severity:
-                    pest['severity'] = 'medium'
-                else:
-                    pest['severity'] = 'low'
-        
-        except Exception as e:
-            print(f"Error loading predefined pests: {e}")
-            predefined_pests = []
-        
-        # Get admin-added pests
-        admin_pests = list(mongo.db.pests.find({
-            'name': {'$nin': ['Unknown', 'Error', 'Server Error', 'Connection Error', 'Timeout Error']},
-            'category': 'admin_added'
-        }).sort('created_at', -1))
-        
-        for pest in admin_pests:
-            pest['pest_type'] = 'custom'
-            pest['id'] = str(pest['_id'])
-            
-            # Check if new
-            created_date = pest.get('created_at')
-            if created_date:
-                if isinstance(created_date, str):
-                    try:
-                        created_date = datetime.fromisoformat(created_date.replace('Z', '+00:00'))
-                    except:
-                        created_date = datetime.now()
-                days_old = (datetime.now() - created_date).days
-                pest['is_new'] = (days_old <= 5)
+        def render_page():
+            # Predefined and admin-added pests, merged and normalized by the store
+            library = pest_store.library_view(current_lang)
             
-            # Handle image - FIXED: Always ensure image_url exists
-            if 'image_url' not in pest or not pest['image_url']:
-                if 'image' in pest and pest['image']:
-                    pest['image_url'] = pest['image']
-                elif 'cloudinary_url' in pest and pest['cloudinary_url']:
-                    pest['image_url'] = pest['cloudinary_url']
-                else:
-                    pest['image_url'] = "/static/images/pests/default.jpg"
+            # The card grid is most of the render and only depends on is_admin, so it is
+            # reused even when the page around it can't be cached
+            grid_key = page_key('pest_library_grid', current_lang, is_admin, pest_store.version)
+            pest_grid = Markup(page_cache.fragment(
+                grid_key,
+                lambda: render_template('pest_library_grid.html', pests=library['pests'], is_admin=is_admin)
+            ))
             
-            # Ensure image_url is a valid URL
-            if not pest['image_url'].startswith(('http://', 'https://', '/')):
-                pest['image_url'] = "/static/images/pests/default.jpg"
-            
-            # Format severity
-            severity = str(pest.get('severity', 'medium')).lower()
-            if 'very' in severity:
-                pest['severity'] = 'very_high'
-            elif 'high' in severity:
-                pest['severity'] = 'high'
-            elif 'medium' in severity:
-                pest['severity'] = 'medium'
-            else:
-                pest['severity'] = 'low'
-        
-        # Combine all pests
-        all_pests = list(admin_pests) + predefined_pests
-        
-        # Calculate stats
-        total_pests = len(all_pests)
-        predefined_pests_count = len(predefined_pests)
-        custom_pests_count = len(admin_pests)
-        new_pests_count = sum(1 for pest in admin_pests if pest.get('is_new', False))
-        
-        high_severity_count = 0
-        for pest in all_pests:
-            severity = str(pest.get('severity', '')).lower()
-            if severity in ['high', 'very_high', 'very high']:
-                high_severity_count += 1
+            return render_template('pest_library.html',
+                                 title='Pest Library',
+                                 pests=library['pests'],
+                                 pest_grid=pest_grid,
+                                 total_pests=library['total_pests'],
+                                 high_severity_count=library['high_severity_count'],
+                                 new_pests_count=library['new_pests_count'],
+                                 predefined_pests_count=library['predefined_pests_count'],
+                                 custom_pests_count=library['custom_pests_count'],
+                                 is_admin=is_admin,
+                                 lang=lang_data)
         
-        is_admin = session.get('role') == 'admin'
+        # Pending flash messages end up in the page, so don't share it
+        if has_pending_flashes():
+            return render_page()
         
-        return render_template('pest_library.html',
-                             title='Pest Library',
-                             pests=all_pests,
-                             total_pests=total_pests,
-                             high_severity_count=high_severity_count,
-                             new_pests_count=new_pests_count,
-                             predefined_pests_count=predefined_pests_count,
-                             custom_pests_count=custom_pests_count,
-                             is_admin=is_admin,
-                             lang=lang_data)
+        key = page_key('pest_library', current_lang, session.get('role'), pest_store.version)
+        return page_cache.respond(key, render_page, pest_store.updated_at)
                              
     except Exception as e:
-        print(f"Error loading pest library: {e}")
+        log.exception("Error loading pest library: %s", e)
         
         # Return empty data
         is_admin = session.get('role') == 'admin'
@@ -2698,107 +2844,29 @@ def view_pest_details(pest_id):
         current_lang = session.get('language', 'english').lower()
         lang_data = LANGUAGES.get(current_lang, LANGUAGES['english'])
         
-        pest_data = None
-        pest_type = None
-        
-        print(f"🔄 DEBUG: Looking for pest with ID/Name: {pest_id}")
-        
-        # Check if it's a predefined pest (by name)
-        try:
-            from utils.pest_library import get_pest_by_name
-            predefined_pest = get_pest_by_name(pest_id, current_lang)
-            if predefined_pest:
-                print(f"✅ Found predefined pest: {pest_id}")
-                pest_data = predefined_pest
-                pest_type = 'predefined'
-                pest_data['id'] = pest_id
-                pest_data['_id'] = pest_id  # Add _id for consistency
-                
-                # Handle image URL
-                if pest_data.get('image'):
-                    if pest_data['image'].startswith(('http://', 'https://', '//')):
-                        pest_data['image_url'] = pest_data['image']
-                    else:
-                        pest_data['image_url'] = f"/static/images/pests/{pest_data['image']}"
-                else:
-                    pest_data['image_url'] = "/static/images/pests/default.jpg"
-        except Exception as e:
-            print(f"❌ Error checking predefined pest: {e}")
+        # Library pests by name, then Mongo pests by ObjectId or name
+        pest_data, pest_type = pest_store.get_pest(pest_id, current_lang)
         
-        # If not predefined, check database (admin-added pest)
         if not pest_data:
-            print(f"🔍 Not a predefined pest, checking database...")
-            try:
-                # Try to find by ObjectId first
-                try:
-                    db_pest = mongo.db.pests.find_one({'_id': ObjectId(pest_id)})
-                    if db_pest:
-                        print(f"✅ Found pest by ObjectId: {pest_id}")
-                except:
-                    # If not ObjectId, try by name
-                    db_pest = mongo.db.pests.find_one({'name': pest_id})
-                    if db_pest:
-                        print(f"✅ Found pest by name: {pest_id}")
-                
-                if db_pest:
-                    pest_data = db_pest
-                    pest_type = 'custom'
-                    pest_data['_id'] = str(pest_data.get('_id'))
-                    pest_data['id'] = pest_data['_id']
-                    
-                    # Ensure image_url exists
-                    if 'image_url' not in pest_data or not pest_data['image_url']:
-                        if 'image' in pest_data and pest_data['image']:
-                            pest_data['image_url'] = pest_data['image']
-                        else:
-                            pest_data['image_url'] = "/static/images/pests/default.jpg"
-                    
-                    # Ensure it's a valid URL
-                    if not pest_data['image_url'].startswith(('http://', 'https://', '/')):
-                        pest_data['image_url'] = "/static/images/pests/default.jpg"
-                else:
-                    print(f"❌ Pest not found in database: {pest_id}")
-            except Exception as e:
-                print(f"❌ Error checking database pest: {e}")
-        
-        if not pest_data:
-            print(f"❌ Pest not found anywhere: {pest_id}")
+            log.warning("Pest not found anywhere: %s", pest_id)
             flash('Pest not found!', 'danger')
             return redirect(url_for('pest_library'))
         
-        print(f"✅ Successfully loaded pest: {pest_data.get('name')}")
-        
-        # Format lists if they're strings
-        def format_list_field(field):
-            if field in pest_data and isinstance(pest_data[field], str):
-                lines = [line.strip() for line in pest_data[field].split('\n') if line.strip()]
-                pest_data[field] = lines
-            elif field not in pest_data:
-                pest_data[field] = []
-        
-        # Format all list fields
-        for field in ['harmful_effects', 'organic_solutions', 'chemical_pesticides', 'prevention_methods']:
-            format_list_field(field)
-        
-        # Format multilingual list fields if they exist
-        multilingual_fields = [
-            'hindi_harmful_effects', 'hindi_organic_solutions', 'hindi_chemical_pesticides', 'hindi_prevention_methods',
-            'bengali_harmful_effects', 'bengali_organic_solutions', 'bengali_chemical_pesticides', 'bengali_prevention_methods'
-        ]
-        
-        for field in multilingual_fields:
-            if field in pest_data and isinstance(pest_data[field], str):
-                lines = [line.strip() for line in pest_data[field].split('\n') if line.strip()]
-                pest_data[field] = lines
-        
-        return render_template('pest_details.html',
-                             title=f'{pest_data.get("name", "Pest Details")}',
-                             pest=pest_data,
-                             pest_type=pest_type,
-                             lang=lang_data)
+        def render_page():
+            return render_template('pest_details.html',
+                                 title=f'{pest_data.get("name", "Pest Details")}',
+                                 pest=pest_data,
+                                 pest_type=pest_type,
+                                 lang=lang_data)
+        
+        if has_pending_flashes():
+            return render_page()
+        
+        key = page_key('pest_details', pest_id, current_lang, session.get('role'), pest_store.version)
+        return page_cache.respond(key, render_page, pest_store.updated_at)
                              
     except Exception as e:
-        print(f"❌ Error viewing pest details: {e}")
+        log.exception("Error viewing pest details: %s", e)
         flash('Error loading pest details', 'danger')
         return redirect(url_for('pest_library'))
 # ==================== ADMIN PEST MANAGEMENT ROUTES ====================
@@ -2861,7 +2929,7 @@ def admin_add_pest():
                         if upload_result.get('success'):
                             image_url = upload_result.get('url', '')
                             cloudinary_public_id = upload_result.get('public_id')
-                            print(f"✅ Image uploaded to Cloudinary: {image_url}")
+                            log.info("Image uploaded to Cloudinary: %s", image_url)
                             flash('Image uploaded to Cloudinary successfully!', 'success')
                         else:
                             # Save locally as fallback
@@ -2872,7 +2940,7 @@ def admin_add_pest():
                             file.seek(0)  # Reset file pointer
                             file.save(static_path)
                             image_url = f"/static/uploads/pests/{static_filename}"
-                            print(f"⚠️ Cloudinary upload failed. Saved locally: {image_url}")
+                            log.warning("Cloudinary upload failed. Saved locally: %s", image_url)
                             flash('Image saved locally (Cloudinary upload failed)', 'warning')
                         
                         # Clean up temp file
@@ -2880,7 +2948,7 @@ def admin_add_pest():
                             os.remove(temp_path)
                             
                     except Exception as upload_error:
-                        print(f"⚠️ Error handling image upload: {upload_error}")
+                        log.warning("Error handling image upload: %s", upload_error)
                         flash('Error uploading image. Using default image instead.', 'danger')
                 elif file and file.filename != '':
                     flash('Invalid file type. Please use PNG, JPG, JPEG, GIF, or WEBP.', 'danger')
@@ -2890,12 +2958,12 @@ def admin_add_pest():
                 direct_image_url = request.form.get('image', '').strip()
                 if direct_image_url and (direct_image_url.startswith('http') or direct_image_url.startswith('https')):
                     image_url = direct_image_url
-                    print(f"✅ Using direct image URL: {image_url}")
+                    log.info("Using direct image URL: %s", image_url)
             
             # Priority 3: Use default image if no image provided
             if not image_url:
                 image_url = "/static/images/pests/default.jpg"
-                print("ℹ️  Using default pest image")
+                log.info("Using default pest image")
                 flash('No image provided. Using default pest image.', 'info')
             
             # Create pest document with all necessary fields
@@ -2924,12 +2992,13 @@ def admin_add_pest():
             
             # Save to database
             result = mongo.db.pests.insert_one(new_pest)
+            pest_store.invalidate()
             
             flash(f'Pest "{name}" added successfully!', 'success')
             return redirect(url_for('admin_add_pest'))
             
         except Exception as e:
-            print(f"Error adding pest: {str(e)}")
+            log.exception("Error adding pest: %s", e)
             flash(f'Error adding pest: {str(e)}', 'danger')
             return redirect(url_for('admin_add_pest'))
     
@@ -2956,7 +3025,7 @@ def admin_add_pest():
                     pest['formatted_date'] = 'Unknown date'
                     
     except Exception as e:
-        print(f"Error loading pests: {e}")
+        log.exception("Error loading pests: %s", e)
         pests = []
     
     return render_template('admin_add_pest.html', 
@@ -3019,7 +3088,7 @@ def admin_edit_pest(pest_id):
                 # If user provided a new direct URL, use it
                 if image_url and (image_url.startswith('http') or image_url.startswith('https')):
                     current_image = image_url
-                    print(f"✅ Using new direct image URL: {current_image}")
+                    log.info("Using new direct image URL: %s", current_image)
                     # Clear Cloudinary ID when using direct URL
                     current_public_id = None
                 
@@ -3040,15 +3109,15 @@ def admin_edit_pest(pest_id):
                             if upload_result.get('success'):
                                 current_image = upload_result.get('url', current_image)
                                 new_public_id = upload_result.get('public_id')
-                                print(f"✅ New image uploaded to Cloudinary: {current_image}")
+                                log.info("New image uploaded to Cloudinary: %s", current_image)
                                 
                                 # Delete old Cloudinary image if exists
                                 if current_public_id:
                                     try:
                                         delete_from_cloudinary(current_public_id)
-                                        print(f"✅ Deleted old Cloudinary image: {current_public_id}")
+                                        log.info("Deleted old Cloudinary image: %s", current_public_id)
                                     except Exception as delete_error:
-                                        print(f"⚠️ Could not delete old Cloudinary image: {delete_error}")
+                                        log.warning("Could not delete old Cloudinary image: %s", delete_error)
                                 
                                 flash('Image updated on Cloudinary successfully!', 'success')
                             else:
@@ -3061,7 +3130,7 @@ def admin_edit_pest(pest_id):
                                 file.save(static_path)
                                 current_image = f"/static/uploads/pests/{static_filename}"
                                 new_public_id = None
-                                print(f"⚠️ Cloudinary upload failed. Saved locally: {current_image}")
+                                log.warning("Cloudinary upload failed. Saved locally: %s", current_image)
                                 flash('Image saved locally (Cloudinary upload failed)', 'warning')
                             
                             # Clean up temp file
@@ -3069,7 +3138,7 @@ def admin_edit_pest(pest_id):
                                 os.remove(temp_path)
                                 
                         except Exception as upload_error:
-                            print(f"⚠️ Error uploading image: {upload_error}")
+                            log.warning("Error uploading image: %s", upload_error)
                             flash('Error uploading image. Keeping existing image.', 'warning')
                 
                 # Update pest document
@@ -3094,12 +3163,13 @@ def admin_edit_pest(pest_id):
                     {'_id': ObjectId(pest_id)},
                     {'$set': update_data}
                 )
+                pest_store.invalidate()
                 
                 flash(f'Pest "{name}" updated successfully!', 'success')
                 return redirect(url_for('admin_pest_management'))
                 
             except Exception as e:
-                print(f"Error updating pest: {str(e)}")
+                log.exception("Error updating pest: %s", e)
                 flash(f'Error updating pest: {str(e)}', 'danger')
         
         # Convert lists to strings for textarea display
@@ -3117,7 +3187,7 @@ def admin_edit_pest(pest_id):
                              pest=pest,
                              lang=lang_data)
     except Exception as e:
-        print(f"Error in edit_pest: {str(e)}")
+        log.exception("Error in edit_pest: %s", e)
         flash('Pest not found or cannot be edited!', 'danger')
         return redirect(url_for('admin_pest_management'))
 
@@ -3142,17 +3212,18 @@ def delete_pest(pest_id):
             try:
                 delete_result = delete_from_cloudinary(cloudinary_public_id)
                 if delete_result:
-                    print(f"✅ Deleted from Cloudinary: {cloudinary_public_id}")
+                    log.info("Deleted from Cloudinary: %s", cloudinary_public_id)
                 else:
-                    print(f"⚠️  Cloudinary delete failed for: {cloudinary_public_id}")
+                    log.warning("Cloudinary delete failed for: %s", cloudinary_public_id)
             except Exception as e:
-                print(f"⚠️  Error deleting from Cloudinary: {e}")
+                log.warning("Error deleting from Cloudinary: %s", e)
         
         # Delete all uploads with this pest name from users
         uploads_deleted = mongo.db.user_uploads.delete_many({'pest_detected': pest_name})
         
         # Delete the pest from database
         mongo.db.pests.delete_one({'_id': ObjectId(pest_id)})
+        pest_store.invalidate()
         
         return jsonify({
             'success': True,
@@ -3161,7 +3232,7 @@ def delete_pest(pest_id):
         })
         
     except Exception as e:
-        print(f"Error deleting pest: {str(e)}")
+        log.exception("Error deleting pest: %s", e)
         return jsonify({'success': False, 'error': str(e)})
 
 @app.route('/admin/user_management')
@@ -3254,7 +3325,7 @@ def add_user_api():
         })
         
     except Exception as e:
-        print(f"Error adding user: {e}")
+        log.exception("Error adding user: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/admin/api/users/<user_id>/toggle', methods=['POST'])
@@ -3283,7 +3354,7 @@ def toggle_user_status_api(user_id):
         })
         
     except Exception as e:
-        print(f"Error toggling user status: {e}")
+        log.exception("Error toggling user status: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/admin/api/users/<user_id>/delete', methods=['DELETE'])
@@ -3327,9 +3398,90 @@ def delete_user_api(user_id):
         })
         
     except Exception as e:
-        print(f"Error deleting user: {e}")
+        log.exception("Error deleting user: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@app.route('/admin/api/page-cache/stats')
+@login_required
+def admin_page_cache_stats():
+    """Hit rate and render time saved by the pest page cache"""
+    if session.get('role') != 'admin':
+        return jsonify({'success': False, 'error': 'Unauthorized'}), 403
+    
+    return jsonify({'success': True, 'stats': page_cache.stats()})
+
+@app.route('/admin/api/llm-advice/stats')
+@login_required
+def admin_llm_advice_stats():
+    """Cache hits, coalesced calls and model time for crop advice"""
+    if session.get('role') != 'admin':
+        return jsonify({'success': False, 'error': 'Unauthorized'}), 403
+    
+    return jsonify({'success': True, 'stats': crop_advisor.stats()})
+
+@app.route('/admin/api/latency/stats')
+@login_required
+def admin_latency_stats():
+    """p50/p95/p99 of the crop page and of the Gemini call, over recent requests"""
+    if session.get('role') != 'admin':
+        return jsonify({'success': False, 'error': 'Unauthorized'}), 403
+    
+    return jsonify({'success': True, 'stats': latency.stats()})
+
+@app.route('/admin/api/timing/stats')
+@login_required
+def admin_timing_stats():
+    """Histogram of request stage timings (request_stage_seconds)"""
+    if session.get('role') != 'admin':
+        return jsonify({'success': False, 'error': 'Unauthorized'}), 403
+    
+    return jsonify({'success': True, 'metrics': metrics_registry.snapshot()})
+
+@app.route('/admin/api/model/runtime')
+@login_required
+def admin_model_runtime():
+    """TensorFlow thread pools and CPU affinity of the worker serving this request, or of the model processes"""
+    if session.get('role') != 'admin':
+        return jsonify({'success': False, 'error': 'Unauthorized'}), 403
+
+    if os.getenv('MODEL_SERVER'):
+        from ml_model.serving import default_client
+        try:
+            return jsonify({'success': True, 'server': default_client().stats()})
+        except (OSError, ValueError) as e:
+            return jsonify({'success': False, 'error': f'Model server unavailable: {e}'}), 503
+
+    from ml_model import runtime
+    return jsonify({'success': True, 'runtime': runtime.current(), 'planned': runtime.plan()})
+
+@app.route('/admin/query-profile')
+@login_required
+def admin_query_profile():
+    """Slowest / most repeated MongoDB queries per endpoint (this worker)"""
+    if session.get('role') != 'admin':
+        flash('Admin access required!', 'danger')
+        return redirect(url_for('login'))
+    
+    report = query_profiler.report(sort=request.args.get('sort', 'total_ms')) if query_profiler else None
+    return render_template('admin_query_profile.html', title='Admin - Query Profile', report=report)
+
+@app.route('/admin/api/query-profile', methods=['GET', 'DELETE'])
+@login_required
+def admin_query_profile_api():
+    """Query profile as JSON (save it for python -m user.utils.query_profiler); DELETE resets it"""
+    if session.get('role') != 'admin':
+        return jsonify({'success': False, 'error': 'Unauthorized'}), 403
+    if query_profiler is None:
+        return jsonify({'success': False, 'error': 'Query profiler is disabled (set MONGO_PROFILE=1)'}), 404
+    
+    if request.method == 'DELETE':
+        query_profiler.reset()
+        return jsonify({'success': True})
+    
+    report = query_profiler.report(sort=request.args.get('sort', 'total_ms'),
+                                   limit=request.args.get('limit', 50, type=int))
+    return jsonify({'success': True, 'report': report})
+
 @app.route('/admin/api/stats/overview')
 @login_required
 def admin_stats_overview():
@@ -3382,7 +3534,7 @@ def admin_stats_overview():
         })
         
     except Exception as e:
-        print(f"Error getting stats overview: {e}")
+        log.exception("Error getting stats overview: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/admin/api/query/<query_id>')
@@ -3412,7 +3564,7 @@ def get_query_details_api(query_id):
         return jsonify({'success': True, 'query': query_data})
         
     except Exception as e:
-        print(f"Error getting query details: {e}")
+        log.exception("Error getting query details: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/admin/api/query/<query_id>/respond', methods=['POST'])
@@ -3453,7 +3605,7 @@ def respond_to_query_api(query_id):
             return jsonify({'success': False, 'error': 'Query not found or already responded'}), 404
         
     except Exception as e:
-        print(f"Error responding to query: {e}")
+        log.exception("Error responding to query: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/admin/query/<query_id>/delete', methods=['DELETE'])
@@ -3468,13 +3620,13 @@ def admin_delete_query(query_id):
         result = mongo.db.user_query.delete_one({'_id': ObjectId(query_id)})
         
         if result.deleted_count > 0:
-            print(f"✅ Admin deleted query {query_id}")
+            log.info("Admin deleted query %s", query_id)
             return jsonify({'success': True, 'message': 'Query deleted successfully'})
         else:
             return jsonify({'success': False, 'error': 'Query not found'}), 404
             
     except Exception as e:
-        print(f"❌ Error deleting query {query_id}: {e}")
+        log.exception("Error deleting query %s: %s", query_id, e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/admin/api/users/<user_id>/details')
@@ -3529,7 +3681,7 @@ def get_user_details_api(user_id):
         })
         
     except Exception as e:
-        print(f"Error fetching user details: {e}")
+        log.exception("Error fetching user details: %s", e)
         return jsonify({'success': False, 'error': str(e)}), 500
 # ==================== USER QUERIES ROUTES ====================
 
@@ -3572,7 +3724,7 @@ def my_queries():
                              lang=lang_data)
                              
     except Exception as e:
-        print(f"Error loading queries: {e}")
+        log.exception("Error loading queries: %s", e)
         flash('Error loading your queries', 'danger')
         return redirect(url_for('user_dashboard'))
 
@@ -3672,7 +3824,7 @@ def submit_query():
         flash('Query submitted successfully! We will get back to you soon.', 'success')
         
     except Exception as e:
-        print(f"Error submitting query: {e}")
+        log.exception("Error submitting query: %s", e)
         flash('Error submitting query. Please try again.', 'danger')
     
     return redirect(url_for('my_queries'))
@@ -3697,13 +3849,13 @@ def delete_query(query_id):
         result = mongo.db.user_query.delete_one({'_id': ObjectId(query_id)})
         
         if result.deleted_count > 0:
-            print(f"✅ Deleted query {query_id}")
+            log.info("Deleted query %s", query_id)
             return jsonify({'success': True, 'message': 'Query deleted successfully'})
         else:
             return jsonify({'success': False, 'error': 'Failed to delete query'}), 500
             
     except Exception as e:
-        print(f"❌ Error deleting query {query_id}: {e}")
+        log.exception("Error deleting query %s: %s", query_id, e)
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/admin/uploads')
@@ -3747,7 +3899,7 @@ def admin_uploads():
                              title='Admin - Uploads Management')
                              
     except Exception as e:
-        print(f"Error loading uploads: {e}")
+        log.exception("Error loading uploads: %s", e)
         flash('Error loading uploads', 'danger')
         return redirect(url_for('admin_dashboard'))
 
@@ -3920,7 +4072,7 @@ def admin_analytics_page():
                              datetime=datetime)
         
     except Exception as e:
-        print(f"Error in analytics: {e}")
+        log.exception("Error in analytics: %s", e)
         import traceback
         traceback.print_exc()
         
@@ -0,0 +1,131 @@
+# utils/catalogs.py
+"""
+Lazily loaded per-language data catalogs
+
+UI translations and pest texts live in user/data/<catalog>/<language>.json.
+Each language file is read the first time it is needed, so a worker that
+only serves English never holds the Hindi and Bengali copies. Keys and short
+values are interned so repeated labels share one string object.
+"""
+import json
+import os
+import sys
+import threading
+from collections.abc import Mapping
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+# Longer strings are descriptions that never repeat; interning them buys nothing
+INTERN_MAX_LENGTH = 64
+
+
+def _intern(value):
+    if isinstance(value, str) and len(value) <= INTERN_MAX_LENGTH:
+        return sys.intern(value)
+    if isinstance(value, list):
+        return [_intern(item) for item in value]
+    return value
+
+
+def _interned_object(pairs):
+    return {sys.intern(key): _intern(value) for key, value in pairs}
+
+
+def load_json(path):
+    """Read a catalog file, interning keys and short strings"""
+    with open(path, encoding='utf-8') as f:
+        return json.load(f, object_pairs_hook=_interned_object)
+
+
+class LanguageCatalog(Mapping):
+    """
+    Mapping of language -> data dict, loaded on first access.
+    Languages are listed in <directory>/index.json.
+    """
+
+    def __init__(self, name):
+        self.directory = os.path.join(DATA_DIR, name)
+        with open(os.path.join(self.directory, 'index.json'), encoding='utf-8') as f:
+            self._index = json.load(f)
+        self._languages = tuple(self._index['languages'])
+        self._loaded = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, language):
+        data = self._loaded.get(language)
+        if data is not None:
+            return data
+        if language not in self._languages:
+            raise KeyError(language)
+        with self._lock:
+            data = self._loaded.get(language)
+            if data is None:
+                data = load_json(os.path.join(self.directory, f'{language}.json'))
+                self._loaded[language] = data
+        return data
+
+    def __iter__(self):
+        return iter(self._languages)
+
+    def __len__(self):
+        return len(self._languages)
+
+    def __contains__(self, language):
+        return language in self._languages
+
+    def loaded_languages(self):
+        """Languages that have been read from disk so far"""
+        return list(self._loaded)
+
+
+class _PestLanguages(Mapping):
+    """language -> record view of a single pest inside a PestCatalog"""
+
+    __slots__ = ('_catalog', '_name', '_languages')
+
+    def __init__(self, catalog, name, languages):
+        self._catalog = catalog
+        self._name = name
+        self._languages = languages
+
+    def __getitem__(self, language):
+        if language not in self._languages:
+            raise KeyError(language)
+        return self._catalog.languages[language][self._name]
+
+    def __iter__(self):
+        return iter(self._languages)
+
+    def __len__(self):
+        return len(self._languages)
+
+    def __contains__(self, language):
+        return language in self._languages
+
+
+class PestCatalog(Mapping):
+    """
+    Mapping of pest name -> {language: record}, shaped like the old
+    pest_group_data / PEST_LIBRARY_DATA literals. Pest names and the
+    languages each pest has come from index.json; the texts are loaded
+    one language file at a time.
+    """
+
+    def __init__(self, name):
+        self.languages = LanguageCatalog(name)
+        self._entries = {
+            pest_name: _PestLanguages(self, pest_name, tuple(languages))
+            for pest_name, languages in self.languages._index['pests'].items()
+        }
+
+    def __getitem__(self, pest_name):
+        return self._entries[pest_name]
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, pest_name):
+        return pest_name in self._entries
@@ -1,11 +1,20 @@
 import cloudinary
 import cloudinary.uploader
 import cloudinary.api
+import logging
 from dotenv import load_dotenv
 import os
+import time
+
+from .metrics import registry
+
+log = logging.getLogger(__name__)
 
 load_dotenv()
 
+cloudinary_latency = registry.histogram('cloudinary_request_duration_seconds', 'Cloudinary API call latency',
+                                        labels=('operation', 'outcome'))
+
 def configure_cloudinary():
     """Configure Cloudinary with credentials from .env"""
     cloudinary.config(
@@ -14,7 +23,7 @@ def configure_cloudinary():
         api_secret=os.getenv('CLOUDINARY_API_SECRET'),
         secure=True
     )
-    print("✅ Cloudinary configured successfully")
+    log.info("Cloudinary configured successfully")
 
 def upload_to_cloudinary(file_path, folder=None):
     """
@@ -27,6 +36,7 @@ def upload_to_cloudinary(file_path, folder=None):
     Returns:
         dict: Upload result with URL and public_id
     """
+    started = time.perf_counter()
     try:
         # Get folder from .env or use default
         upload_folder = folder or os.getenv('CLOUDINARY_UPLOAD_FOLDER', 'pest_detection')
@@ -36,6 +46,7 @@ def upload_to_cloudinary(file_path, folder=None):
             folder=upload_folder,
             resource_type="auto"  # auto-detect image/video
         )
+        cloudinary_latency.observe(time.perf_counter() - started, 'upload', 'ok')
         
         return {
             'success': True,
@@ -48,7 +59,8 @@ def upload_to_cloudinary(file_path, folder=None):
         }
         
     except Exception as e:
-        print(f"Cloudinary upload error: {str(e)}")
+        cloudinary_latency.observe(time.perf_counter() - started, 'upload', 'error')
+        log.exception("Cloudinary upload error: %s", e)
         return {
             'success': False,
             'error': str(e)
@@ -56,9 +68,12 @@ def upload_to_cloudinary(file_path, folder=None):
 
 def delete_from_cloudinary(public_id):
     """Delete file from Cloudinary"""
+    started = time.perf_counter()
     try:
         result = cloudinary.uploader.destroy(public_id)
+        cloudinary_latency.observe(time.perf_counter() - started, 'delete', 'ok')
         return result.get('result') == 'ok'
     except Exception as e:
-        print(f"Cloudinary delete error: {str(e)}")
+        cloudinary_latency.observe(time.perf_counter() - started, 'delete', 'error')
+        log.exception("Cloudinary delete error: %s", e)
         return False
\ No newline at end of file
@@ -0,0 +1,241 @@
+# utils/crop_batch.py
+"""
+Batch crop recommendations from a CSV of field profiles
+
+The upload is first spooled to a temporary file (in memory up to
+SPOOL_MAX_MEMORY, on disk beyond). Then rows are read back as a stream,
+scored CHUNK_SIZE at a time with utils/crop_engine.py, saved with one
+insert_many per chunk and written out as CSV or JSON. Only one chunk is held
+in memory, whatever the size of the file.
+
+Spooling first matters: most clients send the whole body before they read
+the response, so answering while the body is still arriving can stall
+both ends once the socket buffers fill.
+
+Expected columns (header row, any order, extra columns are ignored):
+field_id, temperature, humidity, rainfall, ph_level, soil_type, nitrogen,
+phosphorous, potassium, plus optional location, weather, nutrition.
+"""
+import csv
+import io
+import json
+import math
+import os
+import shutil
+import tempfile
+import uuid
+from datetime import datetime
+
+from . import crop_engine
+
+CHUNK_SIZE = 500
+MAX_ROWS = 100000
+SPOOL_MAX_MEMORY = 1024 * 1024
+# Largest upload spooled at all (MAX_ROWS is only checked while the output streams)
+MAX_UPLOAD_BYTES = int(float(os.getenv('CROP_BATCH_MAX_MB', '32')) * 1024 * 1024)
+
+NUMERIC_COLUMNS = list(crop_engine.PROFILE_FIELDS)
+SCORE_NAMES = [name for name, _, _, _ in crop_engine.SCORE_TABLE]
+
+CSV_COLUMNS = (['row', 'field_id', 'status', 'error', 'recommended_crops', 'suitable_conditions', 'potential_pests']
+               + [f'{name}_score' for name in SCORE_NAMES])
+
+
+class BatchError(ValueError):
+    """The upload can't be processed at all (bad header, too many rows)"""
+
+
+def spool(stream):
+    """Copy an incoming body to a temporary file and rewind it"""
+    spooled = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_MEMORY)
+    shutil.copyfileobj(stream, spooled, 64 * 1024)
+    spooled.seek(0)
+    return spooled
+
+
+def read_rows(stream, encoding='utf-8-sig'):
+    """
+    Check the header, then return an iterator of dict rows that reads the
+    binary CSV stream as it goes.
+    """
+    text = io.TextIOWrapper(stream, encoding=encoding, newline='')
+    reader = csv.DictReader(text)
+    if not reader.fieldnames:
+        raise BatchError("CSV file is empty")
+    header = {name.strip().lower() for name in reader.fieldnames if name}
+    missing = {'temperature', 'soil_type'} - header
+    if missing:
+        raise BatchError(f"CSV is missing required columns: {', '.join(sorted(missing))}")
+    return ({(key or '').strip().lower(): (value or '').strip() for key, value in row.items() if key}
+            for row in reader)
+
+
+def chunked(rows, size=CHUNK_SIZE, max_rows=MAX_ROWS):
+    chunk = []
+    for count, row in enumerate(rows, start=1):
+        if count > max_rows:
+            raise BatchError(f"CSV has more than {max_rows} rows")
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _validate(row):
+    """Numeric fields must parse to finite numbers; empty ones take the crop advisor defaults"""
+    for column in NUMERIC_COLUMNS:
+        value = row.get(column, '')
+        if value:
+            try:
+                number = float(value)
+            except ValueError:
+                return f"{column} is not a number: {value!r}"
+            if not math.isfinite(number):
+                return f"{column} is not a finite number: {value!r}"
+    if not row.get('temperature'):
+        return "temperature is required"
+    if not row.get('soil_type'):
+        return "soil_type is required"
+    return None
+
+
+def score_chunk(rows, first_row):
+    """Score one chunk; returns a result dict per row (errors included)"""
+    results = []
+    valid_rows, valid_results = [], []
+    for offset, row in enumerate(rows):
+        result = {'row': first_row + offset, 'field_id': row.get('field_id') or str(first_row + offset),
+                  'input': row, 'error': _validate(row)}
+        results.append(result)
+        if result['error'] is None:
+            valid_rows.append(row)
+            valid_results.append(result)
+
+    if valid_rows:
+        profiles = crop_engine.profile_arrays(valid_rows)
+        scored = crop_engine.evaluate(profiles)
+        for i, result in enumerate(valid_results):
+            result.update(crop_engine.result_row(scored, i))
+            result['scores'] = {name: round(score, 2) for name, score in result['scores'].items()}
+            result['profile'] = {key: float(profiles[key][i]) for key, _ in crop_engine.PROFILE_FIELDS.values()}
+    return results
+
+
+def recommendation_documents(results, user_id, username, batch_id):
+    """crop_recommendations documents for the rows that scored"""
+    now = datetime.now()
+    documents = []
+    for result in results:
+        if result['error']:
+            continue
+        row, profile = result['input'], result['profile']
+        crops = result['recommended_crops']
+        documents.append({
+            'user_id': user_id,
+            'username': username,
+            'batch_id': batch_id,
+            'field_id': result['field_id'],
+            'temperature': profile['temperature'],
+            'weather': row.get('weather', ''),
+            'humidity': profile['humidity'],
+            'location': row.get('location', ''),
+            'soil_type': row.get('soil_type', ''),
+            'nutrition': row.get('nutrition', ''),
+            'phosphorous': profile['phosphorous'],
+            'nitrogen': profile['nitrogen'],
+            'potassium': profile['potassium'],
+            'ph_level': profile['ph'],
+            'rainfall': profile['rainfall'],
+            'recommendation': (f"Based on your conditions (Temp: {profile['temperature']}°C, "
+                               f"Rainfall: {profile['rainfall']}mm, Soil: {row.get('soil_type', '')}), "
+                               f"we recommend focusing on {', '.join(crops[:3])}."),
+            'structured_recommendation': {
+                'recommended_crops': crops,
+                'suitable_conditions': result['suitable_conditions'],
+                'potential_pests': [list(pest) for pest in result['potential_pests']],
+                'scores': result['scores'],
+            },
+            'language': 'english',
+            'source': 'batch',
+            'created_at': now
+        })
+    return documents
+
+
+def _csv_line(values):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue()
+
+
+def _csv_record(result):
+    if result['error']:
+        return [result['row'], result['field_id'], 'error', result['error'], '', '', ''] + [''] * len(SCORE_NAMES)
+    return ([result['row'], result['field_id'], 'ok', '',
+             '; '.join(result['recommended_crops']),
+             '; '.join(result['suitable_conditions']),
+             '; '.join(f"{name} ({risk})" for name, risk in result['potential_pests'])]
+            + [result['scores'][name] for name in SCORE_NAMES])
+
+
+def _json_record(result):
+    record = {'row': result['row'], 'field_id': result['field_id']}
+    if result['error']:
+        record.update(status='error', error=result['error'])
+    else:
+        record.update(status='ok',
+                      recommended_crops=result['recommended_crops'],
+                      suitable_conditions=result['suitable_conditions'],
+                      potential_pests=[list(pest) for pest in result['potential_pests']],
+                      scores=result['scores'])
+    return record
+
+
+def new_batch_id():
+    return uuid.uuid4().hex
+
+
+def stream_batch(rows, output_format, batch_id, save_chunk=None):
+    """
+    Generator of response text: score rows chunk by chunk, pass each chunk's
+    results to save_chunk(results, batch_id) and emit CSV or a JSON document.
+    """
+    totals = {'rows': 0, 'scored': 0, 'errors': 0, 'saved': 0}
+
+    if output_format == 'csv':
+        yield _csv_line(CSV_COLUMNS)
+    else:
+        yield '{"batch_id": %s, "results": [' % json.dumps(batch_id)
+
+    first = True
+    next_row = 1
+    try:
+        for chunk in chunked(rows):
+            results = score_chunk(chunk, next_row)
+            next_row += len(chunk)
+            totals['rows'] += len(results)
+            errors = sum(1 for result in results if result['error'])
+            totals['errors'] += errors
+            totals['scored'] += len(results) - errors
+            if save_chunk is not None:
+                totals['saved'] += save_chunk(results, batch_id)
+
+            if output_format == 'csv':
+                yield ''.join(_csv_line(_csv_record(result)) for result in results)
+            else:
+                parts = []
+                for result in results:
+                    parts.append(('' if first else ',') + json.dumps(_json_record(result), ensure_ascii=False))
+                    first = False
+                yield ''.join(parts)
+    except (BatchError, UnicodeDecodeError, csv.Error) as e:
+        # Headers are already sent, so the failure goes into the body
+        error = str(e) if isinstance(e, BatchError) else f"Could not read CSV after row {next_row - 1}: {e}"
+        totals['error'] = error
+        if output_format == 'csv':
+            yield _csv_line([next_row, '', 'error', error] + [''] * (len(CSV_COLUMNS) - 4))
+
+    if output_format != 'csv':
+        yield '], "summary": %s}' % json.dumps(totals)
@@ -0,0 +1,416 @@
+# utils/crop_engine.py
+"""
+Table-driven crop scoring engine
+
+The crop advisor rules (recommended crops, likely pests, chart scores) used to
+be if/elif chains in user.py. They now live in the tables below and are
+evaluated with NumPy for any number of field profiles at once, so a whole
+district can be scored in one call. Single requests go through the same code
+with a batch of one.
+
+Inputs are dicts of equal-length arrays (see profile_arrays):
+temperature, humidity, rainfall, ph, nitrogen, phosphorous, potassium
+(floats) and soil_type (lowercased strings).
+"""
+from functools import lru_cache
+
+import numpy as np
+
+# ---------- rule tables ----------
+#
+# Conditions: ('between', lo, hi) inclusive, ('above', x), ('below', x),
+# ('near', centre, tolerance), ('outside', lo, hi), ('one_of', *values),
+# ('contains', text) and ('otherwise',). Within a stage the first matching
+# rule wins, like an if/elif chain.
+
+# Each stage may drop crops from the list built so far, then appends its own.
+# Recommended crops are the unique crops of the final list, in list order.
+CROP_STAGES = [
+    ('temperature', [
+        (('between', 20, 30), (), ('Rice', 'Wheat', 'Corn', 'Tomato', 'Cabbage'), 'Ideal temperature range'),
+        (('above', 30), (), ('Cotton', 'Sugarcane', 'Millet', 'Sorghum'), 'Heat-tolerant crops'),
+        (('otherwise',), (), ('Potato', 'Carrot', 'Spinach', 'Lettuce'), 'Cool weather crops'),
+    ]),
+    ('soil_type', [
+        (('one_of', 'sandy', 'sandy loam'), ('Rice', 'Cabbage'), ('Groundnut', 'Watermelon', 'Pumpkin'),
+         'Sandy soil suitable crops'),
+        (('one_of', 'clay', 'clay loam'), ('Carrot', 'Potato'), ('Rice', 'Sugarcane', 'Wheat'),
+         'Clay soil suitable crops'),
+    ]),
+    ('rainfall', [
+        (('above', 150), ('Millet', 'Sorghum'), ('Rice', 'Jute', 'Sugarcane'), 'High rainfall suitable crops'),
+        (('below', 50), ('Rice', 'Sugarcane'), ('Millet', 'Sorghum', 'Barley'), 'Low rainfall suitable crops'),
+    ]),
+    ('ph', [
+        (('below', 6.0), ('Cabbage', 'Spinach'), ('Potato', 'Tomato', 'Rice'), 'Acidic soil suitable crops'),
+        (('above', 7.5), ('Potato', 'Tomato'), ('Cabbage', 'Spinach', 'Wheat'), 'Alkaline soil suitable crops'),
+    ]),
+]
+MAX_CROPS = 5
+MAX_CONDITIONS = 3
+
+# Pests to watch for on the recommendation report: (name, risk)
+PEST_STAGES = [
+    ('temperature', [
+        (('above', 30), (('Aphid', 'high'), ('Whitefly', 'high'))),
+        (('below', 15), (('Mite', 'medium'),)),
+    ]),
+    ('humidity', [
+        (('above', 70), (('Fungal diseases', 'high'), ('Bacterial blight', 'medium'))),
+    ]),
+    ('soil_type', [
+        (('one_of', 'clay', 'clay loam'), (('Root rot', 'medium'), ('Nematodes', 'low'))),
+    ]),
+    ('rainfall', [
+        (('above', 200), (('Water mold', 'high'), ('Leaf spot', 'medium'))),
+    ]),
+]
+MAX_PESTS = 5
+
+# Pest chart bars: (name, risk %)
+CHART_PEST_STAGES = [
+    ('temperature', [
+        (('above', 30), (('Whitefly', 40), ('Aphid', 35), ('Mites', 25))),
+        (('below', 15), (('Slugs', 20), ('Snails', 15), ('Fungal diseases', 30))),
+        (('otherwise',), (('Caterpillar', 25), ('Beetle', 20), ('Leaf miner', 15))),
+    ]),
+    ('humidity', [
+        (('above', 75), (('Fungal diseases', 40), ('Bacterial blight', 25))),
+    ]),
+    ('rainfall', [
+        (('above', 180), (('Water mold', 35), ('Root rot', 30))),
+    ]),
+]
+MAX_CHART_PESTS = 4
+
+# score = clip(sum(min(value, cap) / cap * weight) + bonus points, low, high)
+SCORE_TABLE = [
+    ('cereal', [('temperature', 30, 30), ('humidity', 80, 20), ('rainfall', 200, 30), ('nitrogen', 100, 20)],
+     [], (20, 100)),
+    ('vegetable', [('temperature', 28, 25), ('humidity', 85, 25), ('rainfall', 150, 20)],
+     [('ph', ('near', 6.5, 1.5), 30)], (20, 100)),
+    ('fruit', [('temperature', 32, 20), ('humidity', 70, 20), ('potassium', 80, 30), ('phosphorous', 60, 30)],
+     [], (20, 100)),
+    ('cash_crop', [('temperature', 35, 40), ('rainfall', 250, 30), ('nitrogen', 120, 15), ('potassium', 100, 15)],
+     [], (20, 100)),
+    ('pest_risk', [],
+     [('temperature', ('above', 30), 20), ('temperature', ('below', 15), 5),
+      ('humidity', ('above', 75), 25), ('humidity', ('below', 40), 5),
+      ('rainfall', ('above', 180), 30), ('rainfall', ('below', 30), 10),
+      ('ph', ('outside', 5.5, 8.0), 25)], (10, 100)),
+    ('soil_health', [('nitrogen', 100, 25), ('phosphorous', 80, 25), ('potassium', 90, 25)],
+     [('ph', ('near', 6.5, 1.0), 25)], (30, 100)),
+]
+
+SOIL_LABELS = ['Loamy', 'Clayey', 'Sandy', 'Silty', 'Other']
+SOIL_DISTRIBUTION_STAGE = ('soil_type', [
+    (('contains', 'clay'), (20, 40, 10, 15, 15)),
+    (('contains', 'sandy'), (15, 10, 50, 10, 15)),
+    (('contains', 'loam'), (40, 20, 15, 15, 10)),
+    (('contains', 'silt'), (15, 15, 15, 45, 10)),
+    (('otherwise',), (25, 25, 20, 15, 15)),
+])
+
+# Form field -> (profile key, default)
+PROFILE_FIELDS = {
+    'temperature': ('temperature', 25.0),
+    'humidity': ('humidity', 60.0),
+    'rainfall': ('rainfall', 100.0),
+    'ph_level': ('ph', 6.5),
+    'nitrogen': ('nitrogen', 80.0),
+    'phosphorous': ('phosphorous', 40.0),
+    'potassium': ('potassium', 60.0),
+}
+DEFAULT_SOIL_TYPE = 'loam'
+
+
+# ---------- compiled tables ----------
+
+CROPS = tuple(dict.fromkeys(crop for _, rules in CROP_STAGES for rule in rules for crop in rule[1] + rule[2]))
+_CROP_INDEX = {crop: i for i, crop in enumerate(CROPS)}
+
+
+def _compile_crop_tables():
+    """Position of every crop each rule appends, and the crops it removes"""
+    options = max(len(rules) for _, rules in CROP_STAGES) + 1
+    width = max(len(rule[2]) for _, rules in CROP_STAGES for rule in rules)
+    add_pos = np.full((len(CROP_STAGES), options, len(CROPS)), np.inf)
+    removes = np.zeros((len(CROP_STAGES), options, len(CROPS)), dtype=bool)
+    for s, (_, rules) in enumerate(CROP_STAGES):
+        for o, (_, removed, added, _) in enumerate(rules):
+            for crop in removed:
+                removes[s, o, _CROP_INDEX[crop]] = True
+            for j, crop in enumerate(added):
+                # Later stages sit after earlier ones in the list
+                add_pos[s, o, _CROP_INDEX[crop]] = min(add_pos[s, o, _CROP_INDEX[crop]], s * width + j)
+    return add_pos, removes
+
+
+_CROP_ADD_POS, _CROP_REMOVES = _compile_crop_tables()
+
+
+class _SlotTable:
+    """
+    Flattened (stage, rule, item) list for rules that only append.
+    The emitted list for a profile is every slot whose rule fired, in order.
+    """
+
+    def __init__(self, stages, items_of):
+        self.stages = stages
+        self.items = []
+        slot_stage, slot_rule = [], []
+        for s, (_, rules) in enumerate(stages):
+            for r, rule in enumerate(rules):
+                for item in items_of(rule):
+                    slot_stage.append(s)
+                    slot_rule.append(r)
+                    self.items.append(item)
+        self.slot_stage = np.array(slot_stage, dtype=np.intp)
+        self.slot_rule = np.array(slot_rule, dtype=np.intp)
+        self.item_ids = np.arange(len(self.items))
+
+    def select(self, choices, limit):
+        """(n, limit) slot indices, -1 where the list is shorter"""
+        active = choices[:, self.slot_stage] == self.slot_rule
+        rank = np.cumsum(active, axis=1)
+        keep = active & (rank <= limit)
+        out = np.full((choices.shape[0], limit), -1, dtype=np.intp)
+        rows, cols = np.nonzero(keep)
+        out[rows, rank[rows, cols] - 1] = self.item_ids[cols]
+        return out
+
+    def decode(self, row):
+        return [self.items[i] for i in row if i >= 0]
+
+
+_CONDITION_SLOTS = _SlotTable(CROP_STAGES, lambda rule: (rule[3],))
+_PEST_SLOTS = _SlotTable(PEST_STAGES, lambda rule: rule[1])
+_CHART_PEST_SLOTS = _SlotTable(CHART_PEST_STAGES, lambda rule: rule[1])
+_SOIL_DISTRIBUTIONS = np.array([rule[1] for rule in SOIL_DISTRIBUTION_STAGE[1]])
+
+
+# ---------- evaluation ----------
+
+def _condition(spec, values):
+    """Boolean mask of numeric values matching a condition"""
+    kind = spec[0]
+    if kind == 'between':
+        return (values >= spec[1]) & (values <= spec[2])
+    if kind == 'above':
+        return values > spec[1]
+    if kind == 'below':
+        return values < spec[1]
+    if kind == 'near':
+        return np.abs(values - spec[1]) <= spec[2]
+    if kind == 'outside':
+        return (values < spec[1]) | (values > spec[2])
+    if kind == 'otherwise':
+        return np.ones(values.shape, dtype=bool)
+    raise ValueError(f"Unknown condition {kind}")
+
+
+def _text_matches(spec, text):
+    kind = spec[0]
+    if kind == 'one_of':
+        return text in spec[1:]
+    if kind == 'contains':
+        return spec[1] in text
+    if kind == 'otherwise':
+        return True
+    raise ValueError(f"Unknown condition {kind}")
+
+
+# (id(rules), text) -> rule index; there are only a handful of soil names
+_TEXT_CHOICES = {}
+
+
+def _text_choice(rules, text):
+    key = (id(rules), text)
+    choice = _TEXT_CHOICES.get(key)
+    if choice is None:
+        choice = next((r for r, rule in enumerate(rules) if _text_matches(rule[0], text)), len(rules))
+        _TEXT_CHOICES[key] = choice
+    return choice
+
+
+def _stage_choices(stages, profiles, n):
+    """(n, stages) index of the first matching rule per stage; len(rules) if none matched"""
+    choices = np.empty((n, len(stages)), dtype=np.intp)
+    for s, (variable, rules) in enumerate(stages):
+        values = profiles[variable]
+        if variable == 'soil_type':
+            # Match each distinct soil name once, then broadcast
+            if n == 1:
+                choices[0, s] = _text_choice(rules, str(values[0]))
+                continue
+            names, inverse = np.unique(values, return_inverse=True)
+            lookup = np.array([_text_choice(rules, name) for name in names.tolist()], dtype=np.intp)
+            choices[:, s] = lookup[inverse]
+            continue
+        choice = np.full(n, len(rules), dtype=np.intp)
+        for r in range(len(rules) - 1, -1, -1):
+            choice[_condition(rules[r][0], values)] = r
+        choices[:, s] = choice
+    return choices
+
+
+def _rank_crops(choices, limit):
+    """(n, limit) crop indices in recommendation order, -1 padded"""
+    stages = np.arange(len(CROP_STAGES))
+    positions = _CROP_ADD_POS[stages, choices]     # (n, stages, crops)
+    removed = _CROP_REMOVES[stages, choices]
+    # An appended crop survives unless a later stage removes it
+    removed_later = np.zeros_like(removed)
+    removed_later[:, :-1] = np.logical_or.accumulate(removed[:, :0:-1], axis=1)[:, ::-1]
+    first = np.where(removed_later, np.inf, positions).min(axis=1)
+    order = np.argsort(first, axis=1, kind='stable')[:, :limit]
+    return np.where(np.isfinite(np.take_along_axis(first, order, axis=1)), order, -1)
+
+
+def _scores(profiles):
+    scores = {}
+    for name, terms, bonuses, (low, high) in SCORE_TABLE:
+        total = np.zeros(len(profiles['temperature']))
+        for variable, cap, weight in terms:
+            total = total + np.minimum(profiles[variable], cap) / cap * weight
+        for variable, spec, points in bonuses:
+            total = total + _condition(spec, profiles[variable]) * points
+        # fmax/fmin keep the old min(high, max(low, x)) result for NaN inputs
+        scores[name] = np.fmin(high, np.fmax(low, total))
+    return scores
+
+
+def evaluate(profiles):
+    """
+    Score every profile at once. Returns arrays indexed by profile:
+    crops (n, 5), conditions (n, 3), pests (n, 5), chart_pests (n, 4) and
+    soil_distribution (n,) as table indices (-1 padded), plus scores{name: (n,)}.
+    """
+    n = len(profiles['temperature'])
+    crop_choices = _stage_choices(CROP_STAGES, profiles, n)
+    return {
+        'crops': _rank_crops(crop_choices, MAX_CROPS),
+        'conditions': _CONDITION_SLOTS.select(crop_choices, MAX_CONDITIONS),
+        'pests': _PEST_SLOTS.select(_stage_choices(PEST_STAGES, profiles, n), MAX_PESTS),
+        'chart_pests': _CHART_PEST_SLOTS.select(_stage_choices(CHART_PEST_STAGES, profiles, n), MAX_CHART_PESTS),
+        'soil_distribution': _stage_choices([SOIL_DISTRIBUTION_STAGE], profiles, n)[:, 0],
+        'scores': _scores(profiles),
+    }
+
+
+def profile_arrays(records):
+    """
+    Turn form-style dicts into engine input. Missing or empty numbers take
+    the crop advisor defaults; soil_type is lowercased.
+    """
+    def value(record, field, default):
+        raw = record.get(field)
+        return default if raw is None or raw == '' else raw
+
+    profiles = {}
+    for field, (key, default) in PROFILE_FIELDS.items():
+        profiles[key] = np.array([float(value(record, field, default)) for record in records], dtype=float)
+    profiles['soil_type'] = np.array([str(value(record, 'soil_type', DEFAULT_SOIL_TYPE)).lower() for record in records])
+    return profiles
+
+
+def _single(**values):
+    profile = {key: np.array([float(values.get(key, default))]) for key, default in PROFILE_FIELDS.values()}
+    profile['soil_type'] = np.array([values.get('soil_type', DEFAULT_SOIL_TYPE).lower()])
+    return profile
+
+
+# ---------- single-profile helpers used by the crop advisor ----------
+
+@lru_cache(maxsize=None)
+def _crops_for_choices(choices):
+    """Decoded crops and condition labels; depend only on which rule fired per stage"""
+    choices = np.array([choices], dtype=np.intp)
+    crops = [CROPS[i] for i in _rank_crops(choices, MAX_CROPS)[0] if i >= 0]
+    return tuple(crops), tuple(_CONDITION_SLOTS.decode(_CONDITION_SLOTS.select(choices, MAX_CONDITIONS)[0]))
+
+
+@lru_cache(maxsize=None)
+def _slots_for_choices(table, choices, limit):
+    return tuple(table.decode(table.select(np.array([choices], dtype=np.intp), limit)[0]))
+
+
+def recommend_crops(temperature, soil_type, rainfall, ph):
+    """(top crops, top suitable-condition labels) for one field"""
+    profile = _single(temperature=temperature, soil_type=soil_type, rainfall=rainfall, ph=ph)
+    crops, conditions = _crops_for_choices(tuple(_stage_choices(CROP_STAGES, profile, 1)[0].tolist()))
+    return list(crops), list(conditions)
+
+
+def potential_pests(temperature, humidity, soil_type, rainfall):
+    """[(pest, risk)] to watch for, at most five"""
+    profile = _single(temperature=temperature, humidity=humidity, soil_type=soil_type, rainfall=rainfall)
+    choices = tuple(_stage_choices(PEST_STAGES, profile, 1)[0].tolist())
+    return list(_slots_for_choices(_PEST_SLOTS, choices, MAX_PESTS))
+
+
+def chart_scores(conditions, soil_type):
+    """Suitability/risk scores, pest chart and soil distribution for one field"""
+    profile = _single(soil_type=soil_type, **conditions)
+    choices = tuple(_stage_choices(CHART_PEST_STAGES, profile, 1)[0].tolist())
+    chart_pests = _slots_for_choices(_CHART_PEST_SLOTS, choices, MAX_CHART_PESTS)
+    soil = _text_choice(SOIL_DISTRIBUTION_STAGE[1], str(profile['soil_type'][0]))
+    return {
+        'scores': {name: float(values[0]) for name, values in _scores(profile).items()},
+        'pest_types': [name for name, _ in chart_pests],
+        'pest_risks': [risk for _, risk in chart_pests],
+        'soil_distribution': list(SOIL_DISTRIBUTION_STAGE[1][soil][1]),
+    }
+
+
+def result_row(result, i):
+    """Plain-Python view of profile i in an evaluate() result"""
+    return {
+        'recommended_crops': [CROPS[c] for c in result['crops'][i] if c >= 0],
+        'suitable_conditions': _CONDITION_SLOTS.decode(result['conditions'][i]),
+        'potential_pests': _PEST_SLOTS.decode(result['pests'][i]),
+        'scores': {name: float(values[i]) for name, values in result['scores'].items()},
+    }
+
+
+def evaluate_records(records):
+    """Batch scoring for district-level planning: one plain dict per record"""
+    result = evaluate(profile_arrays(records))
+    return [result_row(result, i) for i in range(len(records))]
+
+
+# Batch benchmark
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(0)
+    n = 10000
+    soils = np.array(['sandy', 'sandy loam', 'clay', 'clay loam', 'loam', 'silt'])
+    profiles = {
+        'temperature': rng.uniform(5, 45, n),
+        'humidity': rng.uniform(20, 100, n),
+        'rainfall': rng.uniform(0, 350, n),
+        'ph': rng.uniform(4, 9, n),
+        'nitrogen': rng.uniform(0, 150, n),
+        'phosphorous': rng.uniform(0, 100, n),
+        'potassium': rng.uniform(0, 150, n),
+        'soil_type': soils[rng.integers(0, len(soils), n)],
+    }
+
+    print("Crop engine benchmark:")
+    print("=" * 50)
+    started = time.perf_counter()
+    result = evaluate(profiles)
+    elapsed = time.perf_counter() - started
+    print(f"1. evaluate() on {n} profiles: {elapsed * 1000:.1f} ms ({n / elapsed:,.0f} profiles/s)")
+
+    started = time.perf_counter()
+    for i in range(1000):
+        recommend_crops(25, 'clay', 120, 6.2)
+        potential_pests(25, 60, 'clay', 120)
+    elapsed = time.perf_counter() - started
+    print(f"2. single-field helpers: {elapsed * 1000:.1f} us per recommendation")
+
+    top = [CROPS[c] for c in result['crops'][0] if c >= 0]
+    print(f"3. first profile: {top}, scores: "
+          f"{ {name: round(float(values[0]), 1) for name, values in result['scores'].items()} }")
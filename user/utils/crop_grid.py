@@ -0,0 +1,333 @@
+# utils/crop_grid.py
+"""
+Precomputed lookup grid for the crop advisor
+
+Farmers type rounded numbers (27.5°C, 120 mm, pH 6.5, N 80), so the crop
+engine keeps evaluating the same inputs. Every rule in utils/crop_engine.py
+depends on one variable at a time, so the grid is factorized: one small
+table per variable instead of a full product.
+  <var>.choices.npy  which rule fires in each stage that tests the variable
+  <var>.terms.npy    each score term contributed by the variable
+  meta.json          axes, column layout and the decoded outputs (crop
+                     lists, pest lists) for every combination of rule choices
+Tables are memory-mapped, so all workers on a host share one copy.
+
+lookup(conditions, soil_type) returns exactly what crop_engine's single-field
+helpers return, or None when a value is not on the grid (more decimals than
+the axis step, or out of range). Callers then compute as before.
+
+    python -m user.utils.crop_grid build
+    python -m user.utils.crop_grid bench
+"""
+import hashlib
+import itertools
+import json
+import logging
+import os
+import sys
+
+import numpy as np
+
+from . import crop_engine
+
+log = logging.getLogger(__name__)
+
+GRID_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'crop_grid')
+META_NAME = 'meta.json'
+
+# Profile key -> (low, high, step, decimals). Values must sit exactly on the axis.
+AXES = {
+    'temperature': (-20.0, 60.0, 0.1, 1),
+    'humidity': (0.0, 100.0, 0.1, 1),
+    'rainfall': (0.0, 1000.0, 0.1, 1),
+    'ph': (0.0, 14.0, 0.01, 2),
+    'nitrogen': (0.0, 500.0, 0.1, 1),
+    'phosphorous': (0.0, 500.0, 0.1, 1),
+    'potassium': (0.0, 500.0, 0.1, 1),
+}
+
+# Stage groups whose rule choices are looked up
+GROUPS = {
+    'crops': crop_engine.CROP_STAGES,
+    'pests': crop_engine.PEST_STAGES,
+    'chart_pests': crop_engine.CHART_PEST_STAGES,
+}
+
+
+def rules_fingerprint():
+    """Changes whenever the engine's rule tables change, so a stale grid is ignored"""
+    tables = (crop_engine.CROP_STAGES, crop_engine.PEST_STAGES, crop_engine.CHART_PEST_STAGES,
+              crop_engine.SCORE_TABLE, crop_engine.SOIL_DISTRIBUTION_STAGE, crop_engine.MAX_CROPS,
+              crop_engine.MAX_CONDITIONS, crop_engine.MAX_PESTS, crop_engine.MAX_CHART_PESTS, AXES)
+    return hashlib.sha256(repr(tables).encode('utf-8')).hexdigest()[:16]
+
+
+def axis_values(variable):
+    low, high, step, decimals = AXES[variable]
+    size = int(round((high - low) / step)) + 1
+    # Rounding gives the same float as parsing the decimal string, so exact matches work
+    return np.round(low + np.arange(size) * step, decimals)
+
+
+def _score_columns():
+    """Per variable, the ordered (score, term) columns it contributes to"""
+    columns = {variable: [] for variable in AXES}
+    order = []
+    for name, terms, bonuses, _ in crop_engine.SCORE_TABLE:
+        for variable, cap, weight in terms:
+            order.append((name, variable, len(columns[variable])))
+            columns[variable].append(('term', cap, weight))
+        for variable, spec, points in bonuses:
+            order.append((name, variable, len(columns[variable])))
+            columns[variable].append(('bonus', spec, points))
+    return columns, order
+
+
+def build(grid_dir=GRID_DIR):
+    """Write the per-variable tables and meta.json; returns the meta dict"""
+    os.makedirs(grid_dir, exist_ok=True)
+    columns, order = _score_columns()
+
+    # (group, stage) pairs per variable; soil stages are resolved at lookup time
+    choice_columns = {variable: [] for variable in AXES}
+    for group, stages in GROUPS.items():
+        for s, (variable, _) in enumerate(stages):
+            if variable in AXES:
+                choice_columns[variable].append([group, s])
+
+    for variable in AXES:
+        values = axis_values(variable)
+        terms = np.zeros((len(values), len(columns[variable])))
+        for c, column in enumerate(columns[variable]):
+            if column[0] == 'term':
+                _, cap, weight = column
+                terms[:, c] = np.minimum(values, cap) / cap * weight
+            else:
+                _, spec, points = column
+                terms[:, c] = crop_engine._condition(spec, values) * points
+        choices = np.zeros((len(values), len(choice_columns[variable])), dtype=np.int8)
+        for c, (group, s) in enumerate(choice_columns[variable]):
+            stage = GROUPS[group][s]
+            choices[:, c] = crop_engine._stage_choices([stage], {variable: values}, len(values))[:, 0]
+        np.save(os.path.join(grid_dir, f'{variable}.terms.npy'), terms)
+        np.save(os.path.join(grid_dir, f'{variable}.choices.npy'), choices)
+
+    # Decoded outputs for every combination of rule choices (a few dozen per group)
+    combos = {}
+    for group, stages in GROUPS.items():
+        radices = [len(rules) + 1 for _, rules in stages]
+        outputs = []
+        for choice in itertools.product(*[range(r) for r in radices]):
+            if group == 'crops':
+                crops, conditions = crop_engine._crops_for_choices(choice)
+                outputs.append([list(crops), list(conditions)])
+            elif group == 'pests':
+                outputs.append([list(p) for p in crop_engine._slots_for_choices(
+                    crop_engine._PEST_SLOTS, choice, crop_engine.MAX_PESTS)])
+            else:
+                outputs.append([list(p) for p in crop_engine._slots_for_choices(
+                    crop_engine._CHART_PEST_SLOTS, choice, crop_engine.MAX_CHART_PESTS)])
+        combos[group] = {'radices': radices, 'outputs': outputs}
+
+    meta = {
+        'fingerprint': rules_fingerprint(),
+        'axes': {variable: list(spec) for variable, spec in AXES.items()},
+        'score_order': order,
+        'score_bounds': {name: list(bounds) for name, _, _, bounds in crop_engine.SCORE_TABLE},
+        'choice_columns': choice_columns,
+        'combos': combos,
+    }
+    with open(os.path.join(grid_dir, META_NAME), 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+    return meta
+
+
+class CropGrid:
+    """Memory-mapped grid; load() returns None if it is missing or stale"""
+
+    def __init__(self, grid_dir, meta):
+        self.grid_dir = grid_dir
+        self.meta = meta
+        self.axes = {variable: tuple(spec) for variable, spec in meta['axes'].items()}
+        self.values = {variable: axis_values(variable).tolist() for variable in self.axes}
+        # Plain ndarray views over the maps: indexing np.memmap itself is several times slower
+        self.terms = {v: np.asarray(np.load(os.path.join(grid_dir, f'{v}.terms.npy'), mmap_mode='r'))
+                      for v in self.axes}
+        self.choices = {v: np.asarray(np.load(os.path.join(grid_dir, f'{v}.choices.npy'), mmap_mode='r'))
+                        for v in self.axes}
+        self.score_order = [tuple(item) for item in meta['score_order']]
+        self.score_bounds = meta['score_bounds']
+        self.hits = 0
+        self.misses = 0
+
+        # Where each group's stage choice comes from: (variable, column) or the soil rules
+        self._stage_sources = {}
+        for group, stages in GROUPS.items():
+            sources = []
+            for s, (variable, rules) in enumerate(stages):
+                if variable in self.axes:
+                    sources.append((variable, meta['choice_columns'][variable].index([group, s])))
+                else:
+                    sources.append((None, rules))
+            self._stage_sources[group] = sources
+        self._combos = {group: (combo['radices'], combo['outputs']) for group, combo in meta['combos'].items()}
+
+    @classmethod
+    def load(cls, grid_dir=GRID_DIR):
+        try:
+            with open(os.path.join(grid_dir, META_NAME), encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta.get('fingerprint') != rules_fingerprint():
+            log.warning("Crop grid is stale (rules changed) - rebuild with python -m user.utils.crop_grid build")
+            return None
+        try:
+            grid = cls(grid_dir, meta)
+        except (OSError, ValueError, KeyError) as e:
+            log.warning("Crop grid could not be loaded: %s", e)
+            return None
+        log.info("Crop grid loaded from %s", grid_dir)
+        return grid
+
+    def _index(self, variable, value):
+        low, _, step, _ = self.axes[variable]
+        try:
+            i = int(round((value - low) / step))
+        except (TypeError, ValueError, OverflowError):
+            return None
+        values = self.values[variable]
+        if not 0 <= i < len(values) or values[i] != value:
+            return None
+        return i
+
+    def _group(self, group, rows, soil_type):
+        radices, outputs = self._combos[group]
+        flat = 0
+        for (variable, source), radix in zip(self._stage_sources[group], radices):
+            if variable is None:
+                choice = crop_engine._text_choice(source, soil_type)
+            else:
+                choice = rows[variable][source]
+            flat = flat * radix + choice
+        return outputs[flat]
+
+    def lookup(self, conditions, soil_type):
+        """
+        Engine results for one field, or None if off-grid. conditions uses
+        profile keys (temperature, humidity, rainfall, ph, nitrogen,
+        phosphorous, potassium) like crop_engine.chart_scores.
+        """
+        indices = {}
+        for variable in self.axes:
+            i = self._index(variable, conditions[variable])
+            if i is None:
+                self.misses += 1
+                return None
+            indices[variable] = i
+        self.hits += 1
+
+        soil_type = str(soil_type).lower()
+        choice_rows = {v: self.choices[v][i].tolist() for v, i in indices.items()}
+        term_rows = {v: self.terms[v][i].tolist() for v, i in indices.items()}
+
+        # Same additions in the same order as crop_engine._scores, so results match exactly
+        totals = {name: 0.0 for name in self.score_bounds}
+        for name, variable, column in self.score_order:
+            totals[name] = totals[name] + term_rows[variable][column]
+        scores = {name: float(min(high, max(low, totals[name])))
+                  for name, (low, high) in self.score_bounds.items()}
+
+        crops, conditions_text = self._group('crops', choice_rows, soil_type)
+        pests = self._group('pests', choice_rows, soil_type)
+        chart_pests = self._group('chart_pests', choice_rows, soil_type)
+        soil = crop_engine._text_choice(crop_engine.SOIL_DISTRIBUTION_STAGE[1], soil_type)
+        return {
+            'recommended_crops': list(crops),
+            'suitable_conditions': list(conditions_text),
+            'potential_pests': [tuple(pest) for pest in pests],
+            'chart': {
+                'scores': scores,
+                'pest_types': [name for name, _ in chart_pests],
+                'pest_risks': [risk for _, risk in chart_pests],
+                'soil_distribution': list(crop_engine.SOIL_DISTRIBUTION_STAGE[1][soil][1]),
+            },
+        }
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0}
+
+
+def compute(conditions, soil_type):
+    """The same result without the grid, straight from crop_engine"""
+    crops, conditions_text = crop_engine.recommend_crops(conditions['temperature'], soil_type,
+                                                         conditions['rainfall'], conditions['ph'])
+    return {
+        'recommended_crops': crops,
+        'suitable_conditions': conditions_text,
+        'potential_pests': crop_engine.potential_pests(conditions['temperature'], conditions['humidity'],
+                                                       soil_type, conditions['rainfall']),
+        'chart': crop_engine.chart_scores(conditions, soil_type),
+    }
+
+
+def _sample_conditions(rng, n):
+    """Rounded inputs like the ones farmers type"""
+    soils = ['Clay', 'Sandy', 'Loamy', 'Silt', 'Peaty', 'Chalky', 'Rocky', 'clay loam', 'sandy loam']
+    samples = []
+    for _ in range(n):
+        samples.append(({
+            'temperature': float(rng.integers(5, 45)) + float(rng.choice([0, 0.5])),
+            'humidity': float(rng.integers(20, 100)),
+            'rainfall': float(rng.integers(0, 40) * 10),
+            'ph': round(float(rng.uniform(4, 9)), 1),
+            'nitrogen': float(rng.integers(0, 30) * 5),
+            'phosphorous': float(rng.integers(0, 20) * 5),
+            'potassium': float(rng.integers(0, 30) * 5),
+        }, soils[int(rng.integers(0, len(soils)))]))
+    return samples
+
+
+def benchmark(n=20000):
+    import time
+
+    grid = CropGrid.load()
+    if grid is None:
+        raise SystemExit("No crop grid - run the build step first")
+    samples = _sample_conditions(np.random.default_rng(0), n)
+
+    mismatches = sum(1 for conditions, soil in samples if grid.lookup(conditions, soil) != compute(conditions, soil))
+
+    started = time.perf_counter()
+    for conditions, soil in samples:
+        compute(conditions, soil)
+    computed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for conditions, soil in samples:
+        grid.lookup(conditions, soil)
+    looked_up = time.perf_counter() - started
+
+    return {
+        'samples': n,
+        'mismatches': mismatches,
+        'compute_per_second': round(n / computed),
+        'lookup_per_second': round(n / looked_up),
+        'compute_us': round(computed / n * 1e6, 1),
+        'lookup_us': round(looked_up / n * 1e6, 1),
+    }
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else 'build'
+    if command == 'build':
+        meta = build()
+        size = sum(os.path.getsize(os.path.join(GRID_DIR, name)) for name in os.listdir(GRID_DIR))
+        print(f"✅ Crop grid written to {GRID_DIR} ({size / 1024:.0f} KiB, fingerprint {meta['fingerprint']})")
+    elif command == 'bench':
+        print(json.dumps(benchmark(), indent=2))
+    else:
+        print("Usage: python -m user.utils.crop_grid [build|bench]")
+        sys.exit(1)
@@ -0,0 +1,277 @@
+# utils/image_variants.py
+"""
+Responsive width variants for the bundled images
+
+The pest cards show images at ~400 CSS px but used to download originals of
+up to 1920 px. This module keeps resized WebP and JPEG copies of every image
+under user/static/images in user/static/variants/, with their dimensions in
+variants/manifest.json, and builds the srcset attributes the templates use.
+
+Generate them offline before deploying:
+    python -m user.utils.image_variants build
+Anything missing (a new image, a changed file) is queued for a background
+thread the first time a page asks for it with wait=False; the page uses the
+original image until the variants exist, and add_listener() callbacks run
+once they do.
+"""
+import hashlib
+import json
+import logging
+import os
+import queue
+import sys
+import tempfile
+import threading
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+log = logging.getLogger(__name__)
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'static')
+VARIANTS_DIRNAME = 'variants'
+MANIFEST_NAME = 'manifest.json'
+
+# Only bundled reference images get variants; uploads stay as they are
+SOURCE_PREFIX = 'images/'
+SOURCE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp'}
+
+WIDTHS = (320, 480, 640, 960, 1280)
+FORMATS = (('webp', 'WEBP', {'quality': 80, 'method': 4}),
+           ('jpg', 'JPEG', {'quality': 82, 'optimize': True, 'progressive': True}))
+
+# sizes attributes matching the card grid and the detail page layout
+CARD_SIZES = '(max-width: 768px) 100vw, 400px'
+DETAIL_SIZES = '(max-width: 1200px) 100vw, 1200px'
+
+
+def _source_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:10]
+
+
+class ImageVariants:
+    """Manifest of resized images plus on-demand generation"""
+
+    def __init__(self, static_dir=STATIC_DIR, widths=WIDTHS):
+        self.static_dir = static_dir
+        self.widths = widths
+        self.variants_dir = os.path.join(static_dir, VARIANTS_DIRNAME)
+        self.manifest_path = os.path.join(self.variants_dir, MANIFEST_NAME)
+        self._lock = threading.Lock()
+        self._images = self._load_manifest()
+        # source path -> mtime the manifest entry was checked against
+        self._checked = {}
+        self._listeners = []
+        self._pending = set()
+        self._queue = None
+        self._queue_lock = threading.Lock()
+
+    def add_listener(self, callback):
+        """Call callback() after variants were generated in the background"""
+        self._listeners.append(callback)
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, encoding='utf-8') as f:
+                return json.load(f).get('images', {})
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self):
+        os.makedirs(self.variants_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.variants_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'widths': list(self.widths), 'images': self._images}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    # ---------- generation ----------
+
+    def _generate(self, relative, source, digest):
+        """Resize one source image into every width/format that is smaller than it"""
+        with Image.open(source) as image:
+            image.load()
+            width, height = image.size
+            if image.mode not in ('RGB', 'L'):
+                image = image.convert('RGB')
+
+            root = os.path.splitext(relative)[0]
+            variants = []
+            for target_width in self.widths:
+                if target_width >= width:
+                    break
+                target_height = round(height * target_width / width)
+                resized = image.resize((target_width, target_height), Image.LANCZOS)
+                for ext, pil_format, options in FORMATS:
+                    variant_path = f"{VARIANTS_DIRNAME}/{root}.{digest}.w{target_width}.{ext}"
+                    target = os.path.join(self.static_dir, *variant_path.split('/'))
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    resized.save(target, pil_format, **options)
+                    variants.append({
+                        'path': variant_path,
+                        'format': ext,
+                        'width': target_width,
+                        'height': target_height,
+                        'bytes': os.path.getsize(target)
+                    })
+
+            # Full-size WebP so browsers that take WebP never fall back to the original
+            variant_path = f"{VARIANTS_DIRNAME}/{root}.{digest}.w{width}.webp"
+            target = os.path.join(self.static_dir, *variant_path.split('/'))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            image.save(target, 'WEBP', **FORMATS[0][2])
+            variants.append({'path': variant_path, 'format': 'webp', 'width': width,
+                             'height': height, 'bytes': os.path.getsize(target)})
+
+        return {
+            'hash': digest,
+            'width': width,
+            'height': height,
+            'bytes': os.path.getsize(source),
+            'variants': variants
+        }
+
+    def ensure(self, relative, wait=True):
+        """
+        Manifest entry for a static image, generating variants if they are missing or stale
+        With wait=False missing variants are queued for the background thread and None is returned
+        """
+        if not relative.startswith(SOURCE_PREFIX) or os.path.splitext(relative)[1].lower() not in SOURCE_EXTENSIONS:
+            return None
+        source = os.path.join(self.static_dir, *relative.split('/'))
+        try:
+            mtime = os.path.getmtime(source)
+        except OSError:
+            return None
+
+        entry = self._images.get(relative)
+        if entry is not None and self._checked.get(relative) == mtime:
+            return entry
+
+        digest = _source_hash(source)
+        if entry is not None and entry['hash'] == digest and self._variants_exist(entry):
+            self._checked[relative] = mtime
+            return entry
+        if Image is None:
+            return None
+        if not wait:
+            self._generate_later(relative)
+            return None
+
+        # One generation at a time; another thread may have just built this one
+        with self._lock:
+            entry = self._images.get(relative)
+            if entry is None or entry['hash'] != digest or not self._variants_exist(entry):
+                try:
+                    entry = self._generate(relative, source, digest)
+                except (OSError, ValueError) as e:
+                    log.warning("Could not build image variants for %s: %s", relative, e)
+                    return None
+                self._images[relative] = entry
+                self._save_manifest()
+            self._checked[relative] = mtime
+        return entry
+
+    def _generate_later(self, relative):
+        with self._queue_lock:
+            if relative in self._pending:
+                return
+            self._pending.add(relative)
+            if self._queue is None:
+                self._queue = queue.Queue()
+                threading.Thread(target=self._generate_loop, name='image-variants', daemon=True).start()
+        self._queue.put(relative)
+
+    def _generate_loop(self):
+        built = False
+        while True:
+            relative = self._queue.get()
+            try:
+                built = self.ensure(relative) is not None or built
+            except Exception as e:
+                log.warning("Could not build image variants for %s: %s", relative, e)
+            finally:
+                with self._queue_lock:
+                    self._pending.discard(relative)
+            # Tell listeners once per batch of queued images, not once per image
+            if built and self._queue.empty():
+                built = False
+                for callback in self._listeners:
+                    try:
+                        callback()
+                    except Exception as e:
+                        log.warning("Image variants listener failed: %s", e)
+
+    def _variants_exist(self, entry):
+        return all(os.path.exists(os.path.join(self.static_dir, *variant['path'].split('/')))
+                   for variant in entry['variants'])
+
+    def build_all(self):
+        """Generate variants for every bundled image"""
+        source_root = os.path.join(self.static_dir, SOURCE_PREFIX)
+        for root, dirs, names in os.walk(source_root):
+            dirs.sort()
+            for name in sorted(names):
+                relative = os.path.relpath(os.path.join(root, name), self.static_dir).replace(os.sep, '/')
+                self.ensure(relative)
+        return self._images
+
+    # ---------- markup ----------
+
+    def responsive(self, image_url, sizes=CARD_SIZES, wait=True):
+        """
+        srcset data for a /static/images/... URL, or None for anything else
+        (and, with wait=False, while its variants are still being generated).
+        Returns dict(width, height, sizes, srcset, webp_srcset).
+        """
+        if not image_url or not image_url.startswith('/static/'):
+            return None
+        entry = self.ensure(image_url[len('/static/'):], wait=wait)
+        if not entry:
+            return None
+
+        def srcset(fmt):
+            return ', '.join(f"/static/{variant['path']} {variant['width']}w"
+                             for variant in entry['variants'] if variant['format'] == fmt)
+
+        # The original is the largest JPEG candidate
+        jpeg_srcset = srcset('jpg')
+        original = f"{image_url} {entry['width']}w"
+        return {
+            'width': entry['width'],
+            'height': entry['height'],
+            'sizes': sizes,
+            'srcset': f"{jpeg_srcset}, {original}" if jpeg_srcset else original,
+            'webp_srcset': srcset('webp')
+        }
+
+    def report(self, display_width=400, device_pixel_ratio=2):
+        """Bytes a card-sized image costs with and without variants"""
+        needed = display_width * device_pixel_ratio
+        before = after = 0
+        for entry in self._images.values():
+            before += entry['bytes']
+            webp = sorted((v for v in entry['variants'] if v['format'] == 'webp'), key=lambda v: v['width'])
+            chosen = next((v for v in webp if v['width'] >= needed), webp[-1] if webp else None)
+            after += chosen['bytes'] if chosen else entry['bytes']
+        return {'images': len(self._images), 'display_width': display_width, 'dpr': device_pixel_ratio,
+                'original_bytes': before, 'variant_bytes': after}
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else 'build'
+    variants = ImageVariants()
+    if command == 'build':
+        if Image is None:
+            print("❌ Pillow is required to build image variants")
+            sys.exit(1)
+        images = variants.build_all()
+        count = sum(len(entry['variants']) for entry in images.values())
+        print(f"✅ {count} variants for {len(images)} images in {variants.variants_dir}")
+    elif command != 'report':
+        print("Usage: python -m user.utils.image_variants [build|report]")
+        sys.exit(1)
+    for dpr in (1, 2):
+        print(json.dumps(variants.report(device_pixel_ratio=dpr)))
@@ -0,0 +1,164 @@
+# utils/knowledge_base.py
+"""
+Precompiled lookup index over pest_group_data
+
+map_pest_name and get_pest_details used to rebuild the variations table and
+lowercase every key on each call. The index below is built once at import
+from the pest names alone (no language file is read for it) and the name
+resolver is memoized, so repeated lookups are O(1).
+"""
+from functools import lru_cache
+
+from .pests import pest_group_data, PEST_NAME_VARIATIONS
+from .pestid import DEFAULT_LANGUAGE
+
+# Canonical names in pest_group_data order (order decides partial-match ties)
+CANONICAL_NAMES = tuple(pest_group_data.keys())
+
+# Position of every canonical name, used to break partial-match ties
+_NAME_ORDER = {name: i for i, name in enumerate(CANONICAL_NAMES)}
+
+# Lowercased canonical name -> canonical name (first one wins, like the old scan)
+_LOWER_INDEX = {}
+for _name in CANONICAL_NAMES:
+    _LOWER_INDEX.setdefault(_name.lower(), _name)
+
+# Lowercased canonical names paired with their canonical form
+_LOWER_NAMES = tuple((name.lower(), name) for name in CANONICAL_NAMES)
+
+# Every lowercase substring of a canonical name -> earliest canonical name
+# containing it. Covers the "pest_name in key" half of the partial match.
+_SUBSTRING_INDEX = {}
+for _lower, _name in _LOWER_NAMES:
+    for _start in range(len(_lower)):
+        for _end in range(_start + 1, len(_lower) + 1):
+            _SUBSTRING_INDEX.setdefault(_lower[_start:_end], _name)
+_SUBSTRING_INDEX[''] = CANONICAL_NAMES[0] if CANONICAL_NAMES else None
+
+del _name, _lower, _start, _end
+
+
+@lru_cache(maxsize=1024)
+def resolve_pest_name(pest_name):
+    """
+    Map a pest name to its canonical pest_group_data key.
+    Same precedence as the original map_pest_name: exact, case-insensitive,
+    known variation, then partial match. Returns the input if nothing matches.
+    """
+    # 1. Exact match
+    if pest_name in _NAME_ORDER:
+        return pest_name
+
+    lowered = pest_name.lower()
+
+    # 2. Case-insensitive match
+    if lowered in _LOWER_INDEX:
+        return _LOWER_INDEX[lowered]
+
+    # 3. Known variations (case-sensitive, as before)
+    if pest_name in PEST_NAME_VARIATIONS:
+        return PEST_NAME_VARIATIONS[pest_name]
+
+    # 4. Partial match - earliest key where either name contains the other
+    best = _SUBSTRING_INDEX.get(lowered)
+    limit = _NAME_ORDER[best] if best else len(CANONICAL_NAMES)
+    for lower_key, name in _LOWER_NAMES[:limit]:
+        if lower_key in lowered:
+            return name
+    if best:
+        return best
+
+    # 5. No match
+    return pest_name
+
+
+def lookup_pest_details(pest_name, language='english'):
+    """
+    Get pest details for an exact (whitespace-trimmed) pest name.
+    Unknown names get a fresh fallback record.
+    """
+    pest_name = pest_name.strip()
+    if pest_name in _NAME_ORDER:
+        # Only the requested language file is read from disk. Membership test first:
+        # Mapping.get() on a missing language raises and catches a KeyError
+        languages = pest_group_data[pest_name]
+        language = language.lower()
+        if language in languages:
+            return languages[language]
+        return languages.get(DEFAULT_LANGUAGE)
+
+    return {
+        'name': pest_name,
+        'description': f'No detailed information found for "{pest_name}". Please check the class mapping.',
+        'harmful_effects': ['Data unavailable'],
+        'organic_solutions': ['Consult local extension office'],
+        'chemical_pesticides': ['N/A'],
+        'prevention_methods': ['Regular monitoring']
+    }
+
+
+def cache_info():
+    """Hit/miss counters for the memoized name resolver"""
+    return resolve_pest_name.cache_info()._asdict()
+
+
+# Benchmark and equivalence check; exits 1 when the index and the legacy matcher disagree
+if __name__ == "__main__":
+    import sys
+    import timeit
+
+    def legacy_map_pest_name(pest_name):
+        """The scan-based matcher this module replaces"""
+        if pest_name in pest_group_data:
+            return pest_name
+        for key in pest_group_data.keys():
+            if pest_name.lower() == key.lower():
+                return key
+        if pest_name in PEST_NAME_VARIATIONS:
+            return PEST_NAME_VARIATIONS[pest_name]
+        for key in pest_group_data.keys():
+            if pest_name.lower() in key.lower() or key.lower() in pest_name.lower():
+                return key
+        return pest_name
+
+    probes = list(CANONICAL_NAMES) + list(PEST_NAME_VARIATIONS)
+    probes += [name.upper() for name in CANONICAL_NAMES]
+    probes += [name.lower() for name in PEST_NAME_VARIATIONS]
+    probes += ["corn", "Bees", "worm", "Potato", "Large Western Corn Rootworms swarm",
+               "aphid", "", "Unknown", "Error", "Fruit", "stink", "Canker on citrus"]
+
+    print("Knowledge base index check:")
+    print("=" * 50)
+    name_mismatches = [p for p in probes if resolve_pest_name(p) != legacy_map_pest_name(p)]
+    print(f"1. Probed {len(probes)} names, mismatches: {name_mismatches or 'none'}")
+
+    runs = 2000
+    legacy = timeit.timeit(lambda: [legacy_map_pest_name(p) for p in probes], number=runs)
+    indexed = timeit.timeit(lambda: [resolve_pest_name(p) for p in probes], number=runs)
+    per_call = runs * len(probes)
+    print(f"2. map_pest_name  legacy: {legacy / per_call * 1e6:.2f} us/call")
+    print(f"   map_pest_name indexed: {indexed / per_call * 1e6:.2f} us/call")
+
+    def legacy_get_pest_details(pest_name, language):
+        """Nested dict walk used by get_pest_details before the index"""
+        pest_name = pest_name.strip()
+        language = language.lower()
+        if pest_name in pest_group_data:
+            pest_data = pest_group_data[pest_name]
+            if language in pest_data:
+                return pest_data[language]
+            return pest_data.get('english')
+        return None
+
+    lookups = [(name, lang) for name in CANONICAL_NAMES for lang in ('english', 'Hindi', 'bangla', 'tamil')]
+    detail_mismatches = [pair for pair in lookups
+                         if lookup_pest_details(*pair) is not legacy_get_pest_details(*pair)]
+    print(f"3. Probed {len(lookups)} detail lookups, mismatches: {detail_mismatches or 'none'}")
+    legacy = timeit.timeit(lambda: [legacy_get_pest_details(*pair) for pair in lookups], number=runs)
+    indexed = timeit.timeit(lambda: [lookup_pest_details(*pair) for pair in lookups], number=runs)
+    per_call = runs * len(lookups)
+    print(f"   get_pest_details  legacy: {legacy / per_call * 1e6:.2f} us/call")
+    print(f"   get_pest_details indexed: {indexed / per_call * 1e6:.2f} us/call")
+    print(f"4. Resolver cache: {cache_info()}")
+    if name_mismatches or detail_mismatches:
+        sys.exit(1)
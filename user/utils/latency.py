@@ -0,0 +1,80 @@
+# utils/latency.py
+"""
+Rolling latency percentiles per operation
+
+    latency.observe('crop_page', 42.0)          # milliseconds
+    with latency.timer('llm_call'):
+        ...
+    latency.stats()  # {'crop_page': {'count': .., 'p50': .., 'p95': .., 'p99': .., 'max': ..}, ...}
+
+Each name keeps its last `window` samples, so percentiles follow recent
+traffic rather than the whole process lifetime.
+"""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from ml_model.check_model import percentile
+
+
+class LatencyTracker:
+    """Thread-safe rolling window of timings per name"""
+
+    def __init__(self, window=1000):
+        self.window = window
+        self._samples = {}
+        self._totals = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name, milliseconds):
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.window)
+                self._totals[name] = 0
+            samples.append(milliseconds)
+            self._totals[name] += 1
+
+    @contextmanager
+    def timer(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, (time.perf_counter() - started) * 1000)
+
+    def summary(self, name):
+        with self._lock:
+            values = sorted(self._samples.get(name, ()))
+            total = self._totals.get(name, 0)
+        return {
+            'count': total,
+            'window': len(values),
+            'p50': round(percentile(values, 0.50), 1),
+            'p95': round(percentile(values, 0.95), 1),
+            'p99': round(percentile(values, 0.99), 1),
+            'max': round(values[-1], 1) if values else 0.0,
+        }
+
+    def stats(self):
+        with self._lock:
+            names = sorted(self._samples)
+        return {name: self.summary(name) for name in names}
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+            self._totals.clear()
+
+
+if __name__ == "__main__":
+    import random
+
+    tracker = LatencyTracker(window=500)
+    for _ in range(2000):
+        tracker.observe('page', random.expovariate(1 / 20.0))
+    with tracker.timer('sleep'):
+        time.sleep(0.05)
+    for name, summary in tracker.stats().items():
+        print(f"{name}: {summary}")
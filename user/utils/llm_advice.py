@@ -0,0 +1,353 @@
+# utils/llm_advice.py
+"""
+Cached, deduplicated Gemini advice for the crop advisor
+
+- Inputs are normalized and bucketed (temperature to 2°C, humidity to 5%, ...)
+  and the prompt is built from the bucketed values, so near-identical
+  requests share one cached answer that is actually valid for all of them.
+- Answers are cached in memory (LRU with TTL) and in the Mongo
+  `llm_advice_cache` collection so other workers reuse them.
+- Concurrent requests for the same key wait for a single in-flight call.
+- The Gemini client is configured once per process and every call has a timeout.
+- Calls run on a small thread pool, so the crop page renders the rule-based
+  recommendation straight away and polls status(key) for the advice.
+
+Set LLM_ADVICE_FAKE=1 to use FakeAdviceModel (offline, deterministic).
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from datetime import datetime, timedelta
+
+log = logging.getLogger(__name__)
+
+# Field -> bucket size. Values are rounded to the nearest multiple.
+NUMERIC_BUCKETS = {
+    'temperature': 2.0,
+    'humidity': 5.0,
+    'rainfall': 10.0,
+    'ph_level': 0.2,
+    'nitrogen': 10.0,
+    'phosphorous': 10.0,
+    'potassium': 10.0,
+}
+TEXT_FIELDS = ['weather', 'location', 'soil_type', 'nutrition']
+
+DEFAULT_TTL = 24 * 3600
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_DEADLINE = 12.0
+CACHE_COLLECTION = 'llm_advice_cache'
+
+
+def _bucket(value, size):
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return ''
+    if number != number:  # NaN
+        return ''
+    bucketed = round(number / size) * size
+    # Trim float noise: 6.4000000001 -> 6.4, 28.0 -> 28
+    text = f"{bucketed:.2f}".rstrip('0').rstrip('.')
+    return '0' if text == '-0' else text
+
+
+def normalize_inputs(form_data):
+    """Bucketed numbers and cleaned-up text: the part of a request the advice depends on"""
+    normalized = {field: _bucket(form_data.get(field), size) for field, size in NUMERIC_BUCKETS.items()}
+    for field in TEXT_FIELDS:
+        normalized[field] = ' '.join(str(form_data.get(field) or '').lower().split())
+    return normalized
+
+
+def cache_key(normalized, model_name):
+    payload = json.dumps(normalized, sort_keys=True)
+    return hashlib.sha256(f"{model_name}|{payload}".encode('utf-8')).hexdigest()
+
+
+# ---------- models ----------
+
+class GeminiModel:
+    """One configured Gemini client per process"""
+
+    def __init__(self, api_key, model_name='gemini-pro', timeout=DEFAULT_TIMEOUT):
+        self.api_key = api_key
+        self.name = model_name
+        self.timeout = timeout
+        self._model = None
+        self._lock = threading.Lock()
+
+    def _client(self):
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    import google.generativeai as genai
+                    genai.configure(api_key=self.api_key)
+                    self._model = genai.GenerativeModel(self.name)
+                    log.info("Gemini model ready: %s", self.name)
+        return self._model
+
+    def generate(self, prompt):
+        response = self._client().generate_content(prompt, request_options={'timeout': self.timeout})
+        return response.text
+
+
+class FakeAdviceModel:
+    """Offline stand-in that answers in the same shape as Gemini"""
+
+    name = 'fake-advice'
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def generate(self, prompt):
+        with self._lock:
+            self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        digest = hashlib.sha256(prompt.encode('utf-8')).hexdigest()[:8]
+        crops = ['Rice', 'Wheat', 'Maize', 'Millet', 'Tomato', 'Potato', 'Cotton']
+        start = int(digest, 16) % len(crops)
+        picks = [crops[(start + i) % len(crops)] for i in range(3)]
+        return (f"Recommended crops: {', '.join(picks)}\n"
+                f"1. Growing conditions: keep soil moisture steady and test pH before sowing.\n"
+                f"2. Potential challenges: watch for aphids and fungal disease after rain.\n"
+                f"3. Suggestion: rotate crops each season and use drip irrigation. (ref {digest})")
+
+
+def default_model():
+    """Fake model when LLM_ADVICE_FAKE is set, Gemini when a key exists, otherwise None"""
+    if os.getenv('LLM_ADVICE_FAKE', '').lower() in ('1', 'true', 'yes'):
+        return FakeAdviceModel(delay=float(os.getenv('LLM_ADVICE_FAKE_DELAY', '0')))
+    api_key = os.getenv('GEMINI_API_KEY')
+    if not api_key:
+        return None
+    return GeminiModel(api_key,
+                       model_name=os.getenv('GEMINI_MODEL', 'gemini-pro'),
+                       timeout=float(os.getenv('GEMINI_TIMEOUT', DEFAULT_TIMEOUT)))
+
+
+# ---------- advisor ----------
+
+class CropAdvisor:
+    """
+    Advice is fetched on a small thread pool:
+      submit(form_data) -> (key, future)   start (or join) the call, never blocks
+      advise(form_data, wait_timeout)      submit and wait
+      status(key) -> (state, text)         'ready' | 'pending' | 'timeout' | 'failed'
+    prompt_builder(normalized_inputs) builds the prompt (create_crop_prompt).
+    A call still running `deadline` seconds after it started reports 'timeout';
+    it keeps running and its answer is cached for the next request.
+    """
+
+    def __init__(self, prompt_builder, model=None, db_getter=None, ttl=DEFAULT_TTL, max_entries=1024,
+                 deadline=DEFAULT_DEADLINE, workers=4, latency=None):
+        self.prompt_builder = prompt_builder
+        self.model = model
+        self._db_getter = db_getter
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.deadline = deadline
+        self.workers = workers
+        self.latency = latency
+        self._executor = None
+        self._cache = OrderedDict()
+        self._inflight = {}
+        self._failed = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'shared_hits': 0, 'misses': 0, 'coalesced': 0, 'errors': 0, 'model_ms': 0.0}
+
+    @property
+    def enabled(self):
+        return self.model is not None
+
+    def _pool(self):
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='llm-advice')
+        return self._executor
+
+    # ---------- cache tiers ----------
+
+    def _memory_get(self, key):
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        text, expires = entry
+        if expires < time.time():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return text
+
+    def _memory_put(self, key, text):
+        self._cache[key] = (text, time.time() + self.ttl)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    def _shared_get(self, key):
+        if self._db_getter is None:
+            return None
+        try:
+            doc = self._db_getter()[CACHE_COLLECTION].find_one({'_id': key})
+        except Exception as e:
+            log.warning("Advice cache read failed: %s", e)
+            return None
+        if not doc or doc.get('expires_at', datetime.min) < datetime.now():
+            return None
+        return doc.get('text')
+
+    def _shared_put(self, key, text, normalized):
+        if self._db_getter is None:
+            return
+        try:
+            now = datetime.now()
+            self._db_getter()[CACHE_COLLECTION].replace_one(
+                {'_id': key},
+                {'_id': key, 'text': text, 'inputs': normalized, 'model': self.model.name,
+                 'created_at': now, 'expires_at': now + timedelta(seconds=self.ttl)},
+                upsert=True
+            )
+        except Exception as e:
+            log.warning("Advice cache write failed: %s", e)
+
+    # ---------- lookup ----------
+
+    def submit(self, form_data):
+        """Start fetching advice for these inputs (or join the call in flight)"""
+        normalized = normalize_inputs(form_data)
+        key = cache_key(normalized, self.model.name)
+
+        with self._lock:
+            text = self._memory_get(key)
+            if text is not None:
+                self._stats['hits'] += 1
+                future = Future()
+                future.set_result(text)
+                return key, future
+            entry = self._inflight.get(key)
+            if entry is not None:
+                self._stats['coalesced'] += 1
+                return key, entry[0]
+            future = Future()
+            self._inflight[key] = (future, time.time())
+            self._failed.pop(key, None)
+
+        self._pool().submit(self._resolve, key, normalized, future)
+        return key, future
+
+    def advise(self, form_data, wait_timeout=None):
+        """Cached advice for these inputs; None if disabled, failed or not ready in wait_timeout"""
+        if self.model is None:
+            return None
+        _, future = self.submit(form_data)
+        try:
+            return future.result(timeout=wait_timeout)
+        except FutureTimeout:
+            return None
+
+    def status(self, key):
+        """Where the advice for a key stands, for the polling endpoint"""
+        with self._lock:
+            text = self._memory_get(key)
+            if text is not None:
+                return 'ready', text
+            entry = self._inflight.get(key)
+            if entry is not None:
+                return ('timeout' if time.time() - entry[1] > self.deadline else 'pending'), None
+            if key in self._failed:
+                return 'failed', None
+
+        # Another worker may have answered it
+        text = self._shared_get(key)
+        if text is not None:
+            with self._lock:
+                self._memory_put(key, text)
+            return 'ready', text
+        return 'pending', None
+
+    def _resolve(self, key, normalized, future):
+        text = None
+        try:
+            text = self._shared_get(key)
+            if text is not None:
+                with self._lock:
+                    self._stats['shared_hits'] += 1
+            else:
+                text = self._call_model(key, normalized)
+        finally:
+            with self._lock:
+                if text is not None:
+                    self._memory_put(key, text)
+                else:
+                    self._failed[key] = time.time()
+                    while len(self._failed) > self.max_entries:
+                        self._failed.popitem(last=False)
+                self._inflight.pop(key, None)
+            future.set_result(text)
+
+    def _call_model(self, key, normalized):
+        started = time.perf_counter()
+        try:
+            text = self.model.generate(self.prompt_builder(normalized))
+        except Exception as e:
+            log.exception("Gemini API Error: %s", e)
+            with self._lock:
+                self._stats['errors'] += 1
+            return None
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            with self._lock:
+                self._stats['misses'] += 1
+                self._stats['model_ms'] += elapsed
+            if self.latency is not None:
+                self.latency.observe('llm_call', elapsed)
+        if text:
+            self._shared_put(key, text, normalized)
+        return text
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._cache)
+            stats['in_flight'] = len(self._inflight)
+        lookups = stats['hits'] + stats['shared_hits'] + stats['misses'] + stats['coalesced']
+        stats['hit_rate'] = round((lookups - stats['misses']) / lookups, 4) if lookups else 0.0
+        stats['model_ms'] = round(stats['model_ms'], 1)
+        stats['model'] = self.model.name if self.model else None
+        return stats
+
+
+# Offline check: coalescing and bucketing with the fake model
+if __name__ == "__main__":
+    model = FakeAdviceModel(delay=0.2)
+    advisor = CropAdvisor(lambda inputs: json.dumps(inputs, sort_keys=True), model=model)
+    form = {'temperature': '27.6', 'humidity': '71', 'rainfall': '148', 'ph_level': '6.45',
+            'nitrogen': '82', 'phosphorous': '41', 'potassium': '58', 'soil_type': 'Clay ', 'weather': 'Sunny',
+            'location': 'Nadia', 'nutrition': 'balanced'}
+    similar = dict(form, temperature='28.3', rainfall='151', soil_type='clay')
+
+    print("Crop advisor cache check:")
+    print("=" * 50)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        answers = list(pool.map(lambda i: advisor.advise(form if i % 2 else similar), range(20)))
+    print(f"1. 20 concurrent near-identical requests: {model.calls} model call(s), "
+          f"{len(set(answers))} distinct answer(s), {time.perf_counter() - started:.2f}s")
+    started = time.perf_counter()
+    advisor.advise(form)
+    print(f"2. repeat request: {(time.perf_counter() - started) * 1e6:.0f} us, model calls still {model.calls}")
+    key, _ = advisor.submit(dict(form, temperature='35'))
+    print(f"3. new inputs, status right after submit: {advisor.status(key)[0]}")
+    time.sleep(0.3)
+    print(f"4. status after the call: {advisor.status(key)[0]}")
+    print(f"5. stats: {advisor.stats()}")
@@ -0,0 +1,216 @@
+# utils/logs.py
+"""
+Structured, leveled logging for the app
+
+setup_logging() sends every logger through a bounded queue: the request
+thread only appends the record, and a background listener thread formats and
+writes it. Modules log through the standard library:
+
+    log = logging.getLogger(__name__)
+    log.info("Pest added %s", name, extra={'pest': name})
+
+Configuration (environment):
+  LOG_LEVEL         root level (default INFO)
+  LOG_LEVELS        per-logger levels, e.g. "user.predict=DEBUG,ml_model=WARNING"
+  LOG_FORMAT        json (default) or text
+  LOG_DEBUG_SAMPLE  fraction of DEBUG records kept per message (default 1.0)
+  LOG_QUEUE_SIZE    records buffered before new ones are dropped (default 10000)
+
+A record can carry its own rate: log.debug(..., extra={'sample_rate': 0.01}).
+Inside a request, records carry request_id, method, path and endpoint.
+"""
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+import uuid
+
+# Attributes every LogRecord has; anything else came in through extra=
+_STANDARD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime', 'taskName'}
+
+_listener = None
+_setup_lock = threading.Lock()
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: ts, level, logger, msg, extra fields, exc"""
+
+    def format(self, record):
+        entry = {
+            'ts': time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(record.created)) + f'.{int(record.msecs):03d}Z',
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _STANDARD_ATTRS and key != 'sample_rate' and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class TextFormatter(logging.Formatter):
+    """Readable lines for local development"""
+
+    def __init__(self):
+        super().__init__('%(asctime)s %(levelname)-7s %(name)s: %(message)s')
+
+    def format(self, record):
+        line = super().format(record)
+        extras = {key: value for key, value in vars(record).items()
+                  if key not in _STANDARD_ATTRS and key != 'sample_rate' and not key.startswith('_')}
+        if extras:
+            line += ' ' + ' '.join(f'{key}={value}' for key, value in extras.items())
+        return line
+
+
+class RequestContextFilter(logging.Filter):
+    """Adds request_id / method / path / endpoint while a Flask request is active"""
+
+    def filter(self, record):
+        try:
+            from flask import g, has_request_context, request
+        except ImportError:
+            return True
+        if has_request_context():
+            request_id = g.get('request_id')
+            if request_id is None:
+                request_id = g.request_id = request.headers.get('X-Request-ID') or uuid.uuid4().hex[:16]
+            record.request_id = request_id
+            record.method = request.method
+            record.path = request.path
+            record.endpoint = request.endpoint
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps 1 in N DEBUG records per (logger, message template)"""
+
+    def __init__(self, debug_rate=1.0):
+        super().__init__()
+        self.debug_rate = debug_rate
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        rate = getattr(record, 'sample_rate', None)
+        if rate is None:
+            if record.levelno > logging.DEBUG:
+                return True
+            rate = self.debug_rate
+        if rate >= 1.0:
+            return True
+        if rate <= 0.0:
+            return False
+        every = max(1, round(1 / rate))
+        key = (record.name, record.msg)
+        with self._lock:
+            count = self._counts.get(key, 0)
+            self._counts[key] = count + 1
+        return count % every == 0
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops (and counts) records instead of blocking when the queue is full"""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # Resolve the message and traceback now (args may change later), keep extra fields
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        record.stack_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def _parse_levels(spec):
+    levels = {}
+    for item in (spec or '').split(','):
+        if '=' in item:
+            name, level = item.split('=', 1)
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def setup_logging(level=None, levels=None, fmt=None, debug_sample=None, queue_size=None, stream=None):
+    """Install the queue handler on the root logger (once per process); returns the listener"""
+    global _listener
+    with _setup_lock:
+        if _listener is not None:
+            return _listener
+
+        level = (level or os.getenv('LOG_LEVEL', 'INFO')).upper()
+        levels = levels if levels is not None else _parse_levels(os.getenv('LOG_LEVELS'))
+        fmt = fmt or os.getenv('LOG_FORMAT', 'json')
+        debug_sample = debug_sample if debug_sample is not None else float(os.getenv('LOG_DEBUG_SAMPLE', '1.0'))
+        queue_size = queue_size or int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+
+        output = logging.StreamHandler(stream or sys.stdout)
+        output.setFormatter(JsonFormatter() if fmt == 'json' else TextFormatter())
+
+        log_queue = queue.Queue(maxsize=queue_size)
+        handler = DroppingQueueHandler(log_queue)
+        handler.addFilter(SamplingFilter(debug_sample))
+        handler.addFilter(RequestContextFilter())
+
+        root = logging.getLogger()
+        for existing in list(root.handlers):
+            root.removeHandler(existing)
+        root.addHandler(handler)
+        root.setLevel(level)
+        for name, name_level in levels.items():
+            logging.getLogger(name).setLevel(name_level)
+
+        _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+        _listener.handler = handler
+        _listener.start()
+        atexit.register(_listener.stop)
+        return _listener
+
+
+if __name__ == "__main__":
+    import io
+
+    sink = io.StringIO()
+    listener = setup_logging(level='DEBUG', debug_sample=0.1, stream=sink)
+    log = logging.getLogger('user.check')
+
+    started = time.perf_counter()
+    for i in range(10000):
+        log.debug("hot path event %d", i)
+    per_call = (time.perf_counter() - started) / 10000
+    log.info("Pest added", extra={'pest': 'Aphid', 'count': 3})
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        log.exception("Something failed")
+    listener.stop()
+
+    lines = sink.getvalue().splitlines()
+    print("Logging check:")
+    print("=" * 50)
+    print(f"1. 10000 debug calls at 10% sampling: {per_call * 1e6:.1f} us per call on the caller, "
+          f"{sum('hot path' in line for line in lines)} written")
+    print(f"2. structured: {lines[-2]}")
+    print(f"3. exception: {json.loads(lines[-1])['exc'].splitlines()[-1]}")
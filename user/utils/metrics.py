@@ -0,0 +1,534 @@
+# utils/metrics.py
+"""
+Process metrics and a Prometheus /metrics endpoint
+
+    from user.utils.metrics import registry
+    requests = registry.counter('thing_total', 'Things done', labels=('kind',))
+    requests.inc('a')
+    registry.histogram('thing_seconds', 'Time per thing').observe(0.12)
+
+Metrics(app) counts requests and times them per endpoint, and serves every
+registered metric in the Prometheus text format at /metrics. Set
+METRICS_TOKEN to require `Authorization: Bearer <token>`.
+
+Several gunicorn workers: set METRICS_DIR to a directory shared by the
+workers of one host; gunicorn.conf.py empties it when the server starts.
+Each worker writes its values to <dir>/metrics_<pid>_<id>.json every few
+seconds and on exit. The random id is new in every process, so a restarted
+worker that gets a reused pid starts its own file instead of overwriting
+the exited worker's counters.
+/metrics then adds up every file: counters and histograms from all workers,
+including ones that have exited, and gauges from live workers only. Other
+workers' values can lag by up to the flush interval.
+
+MongoCommandMetrics is a pymongo command listener (count and latency per
+command and collection); register it before the client is created.
+"""
+import atexit
+import glob
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from bisect import bisect_left
+
+from pymongo import monitoring
+
+log = logging.getLogger(__name__)
+
+# Upper bounds in seconds (Prometheus style, value <= bound)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, description, labels=()):
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def series(self):
+        """{label_values: value} copy"""
+        with self._lock:
+            return {labels: self._copy(value) for labels, value in self._series.items()}
+
+    @staticmethod
+    def _copy(value):
+        return value
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def inc(self, *label_values, amount=1):
+        with self._lock:
+            self._series[label_values] = self._series.get(label_values, 0) + amount
+
+
+class Gauge(_Metric):
+    kind = 'gauge'
+
+    def set(self, value, *label_values):
+        with self._lock:
+            self._series[label_values] = value
+
+    def inc(self, *label_values, amount=1):
+        with self._lock:
+            self._series[label_values] = self._series.get(label_values, 0) + amount
+
+    def dec(self, *label_values, amount=1):
+        self.inc(*label_values, amount=-amount)
+
+    def track(self, *label_values):
+        """Context manager: +1 while the block runs (in-flight / queue depth)"""
+        return _Tracked(self, label_values)
+
+
+class _Tracked:
+    __slots__ = ('gauge', 'label_values')
+
+    def __init__(self, gauge, label_values):
+        self.gauge = gauge
+        self.label_values = label_values
+
+    def __enter__(self):
+        self.gauge.inc(*self.label_values)
+        return self
+
+    def __exit__(self, *exc):
+        self.gauge.dec(*self.label_values)
+        return False
+
+
+class Histogram(_Metric):
+    """Bucket counts (not cumulative), sum and count per label combination"""
+
+    kind = 'histogram'
+
+    def __init__(self, name, description, labels=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, description, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    @staticmethod
+    def _copy(value):
+        return [list(value[0]), value[1], value[2]]
+
+    def observe(self, value, *label_values):
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][bisect_left(self.buckets, value)] += 1
+            series[1] += value
+            series[2] += 1
+
+    def time(self, *label_values):
+        """Context manager that observes the block's duration in seconds"""
+        return _Timed(self, label_values)
+
+    def snapshot(self):
+        """{label_values: {'buckets': [(bound, cumulative count)], 'sum': s, 'count': n}}"""
+        result = {}
+        for labels, (counts, total, count) in self.series().items():
+            result[labels] = {'buckets': _cumulative(self.buckets, counts), 'sum': total, 'count': count}
+        return result
+
+
+class _Timed:
+    __slots__ = ('histogram', 'label_values', 'started')
+
+    def __init__(self, histogram, label_values):
+        self.histogram = histogram
+        self.label_values = label_values
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.started, *self.label_values)
+        return False
+
+
+def _cumulative(bounds, counts):
+    running, buckets = 0, []
+    for bound, bucket_count in zip(tuple(bounds) + (float('inf'),), counts):
+        running += bucket_count
+        buckets.append((bound, running))
+    return buckets
+
+
+class MetricsRegistry:
+    """Named metrics for the process, plus callbacks evaluated at collection time"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name, description, labels, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, description, labels, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} is already registered as a {metric.kind}")
+            return metric
+
+    def counter(self, name, description, labels=()):
+        return self._get(Counter, name, description, labels)
+
+    def gauge(self, name, description, labels=()):
+        return self._get(Gauge, name, description, labels)
+
+    def histogram(self, name, description, labels=(), buckets=DEFAULT_BUCKETS):
+        return self._get(Histogram, name, description, labels, buckets=buckets)
+
+    def add_callback(self, callback):
+        """
+        callback() -> [(name, kind, description, {label: value}, value)], for
+        values another object already keeps (cache hit counts, queue sizes)
+        """
+        self._callbacks.append(callback)
+
+    def metrics(self):
+        with self._lock:
+            return list(self._metrics.values())
+
+    def reset(self):
+        """Forget all values (a forked worker must not report its parent's)"""
+        for metric in self.metrics():
+            metric.reset()
+
+    def collect(self):
+        """
+        Plain data for every metric:
+        {name: {'kind', 'description', 'labels', 'buckets', 'series': [[label_values, value]]}}
+        """
+        families = {}
+        for metric in self.metrics():
+            families[metric.name] = {
+                'kind': metric.kind,
+                'description': metric.description,
+                'labels': list(metric.labels),
+                'buckets': list(getattr(metric, 'buckets', ())),
+                'series': [[list(labels), value] for labels, value in metric.series().items()],
+            }
+        for callback in self._callbacks:
+            try:
+                samples = callback()
+            except Exception as e:
+                log.warning("Metrics callback failed: %s", e)
+                continue
+            for name, kind, description, labels, value in samples:
+                family = families.setdefault(name, {'kind': kind, 'description': description,
+                                                    'labels': list(labels), 'buckets': [], 'series': []})
+                family['series'].append([[str(labels[key]) for key in family['labels']], value])
+        return families
+
+    def snapshot(self):
+        """JSON-friendly view of every metric, for admin endpoints"""
+        result = {}
+        for name, family in sorted(self.collect().items()):
+            rows = []
+            for labels, value in sorted(family['series']):
+                row = {'labels': dict(zip(family['labels'], labels))}
+                if family['kind'] == 'histogram':
+                    row.update(count=value[2], sum=round(value[1], 6),
+                               buckets={('+Inf' if bound == float('inf') else str(bound)): count
+                                        for bound, count in _cumulative(family['buckets'], value[0])})
+                else:
+                    row['value'] = value
+                rows.append(row)
+            result[name] = rows
+        return result
+
+
+# Process-wide registry
+registry = MetricsRegistry()
+
+
+def merge(collections):
+    """Add up collect() results from several processes"""
+    merged = {}
+    for families in collections:
+        for name, family in families.items():
+            target = merged.get(name)
+            if target is None:
+                target = merged[name] = dict(family, series={})
+            for labels, value in family['series']:
+                key = tuple(labels)
+                current = target['series'].get(key)
+                if current is None:
+                    target['series'][key] = (Histogram._copy(value) if family['kind'] == 'histogram' else value)
+                elif family['kind'] == 'histogram':
+                    current[0] = [a + b for a, b in zip(current[0], value[0])]
+                    current[1] += value[1]
+                    current[2] += value[2]
+                else:
+                    target['series'][key] = current + value
+    for family in merged.values():
+        family['series'] = [[list(labels), value] for labels, value in family['series'].items()]
+    return merged
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _label_text(names, values, extra=()):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    pairs.extend(f'{name}="{value}"' for name, value in extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _number(value):
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def render(families):
+    """Prometheus text exposition format"""
+    lines = []
+    for name in sorted(families):
+        family = families[name]
+        lines.append(f"# HELP {name} {family['description']}")
+        lines.append(f"# TYPE {name} {family['kind']}")
+        for labels, value in sorted(family['series']):
+            if family['kind'] == 'histogram':
+                for bound, count in _cumulative(family['buckets'], value[0]):
+                    lines.append(f"{name}_bucket{_label_text(family['labels'], labels, [('le', _number(bound))])} {count}")
+                lines.append(f"{name}_sum{_label_text(family['labels'], labels)} {_number(value[1])}")
+                lines.append(f"{name}_count{_label_text(family['labels'], labels)} {value[2]}")
+            else:
+                lines.append(f"{name}{_label_text(family['labels'], labels)} {_number(value)}")
+    return '\n'.join(lines) + '\n'
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class MultiprocessStore:
+    """Per-worker snapshot files in a shared directory, merged at scrape time"""
+
+    def __init__(self, registry, directory, interval=5.0):
+        self.registry = registry
+        self.directory = directory
+        self.interval = interval
+        self._pid = None
+        self._id = uuid.uuid4().hex[:12]
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        os.register_at_fork(after_in_child=self._forked)
+
+    def _forked(self):
+        # A forked worker starts from zero in a file of its own; its parent's values are in the parent's file
+        self.registry.reset()
+        self._id = uuid.uuid4().hex[:12]
+
+    def path(self, pid=None, process_id=None):
+        """Snapshot file of a process (this one by default)"""
+        if pid is None:
+            pid, process_id = os.getpid(), self._id
+        return os.path.join(self.directory, f'metrics_{pid}_{process_id}.json')
+
+    @staticmethod
+    def clear(directory):
+        """Remove every snapshot in directory (at server start, before workers are forked)"""
+        for path in glob.glob(os.path.join(directory, 'metrics_*.json*')):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def flush(self):
+        data = {'pid': os.getpid(), 'written_at': time.time(), 'families': self.registry.collect()}
+        target = self.path()
+        temporary = f'{target}.tmp'
+        try:
+            with open(temporary, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(temporary, target)
+        except OSError as e:
+            log.warning("Metrics flush failed: %s", e)
+
+    def ensure_started(self):
+        """Start this process's flush thread (once per pid, so it works after fork)"""
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            thread = threading.Thread(target=self._flush_loop, name='metrics-flush', daemon=True)
+            thread.start()
+            atexit.register(self.flush)
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(self.interval)
+            self.flush()
+
+    def collect(self):
+        """This process's live values plus every other worker's last flush"""
+        collections = [self.registry.collect()]
+        own = self.path()
+        for path in glob.glob(os.path.join(self.directory, 'metrics_*.json')):
+            if path == own:
+                continue
+            try:
+                with open(path, encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            families = data.get('families', {})
+            if not _pid_alive(data.get('pid', 0)):
+                families = {name: family for name, family in families.items() if family['kind'] != 'gauge'}
+            collections.append(families)
+        return merge(collections)
+
+
+def add_ratios(families, counter_name, ratio_name, description, group_label, result_label='result', hit_values=('hit',)):
+    """Derive {group}: hits / lookups from a counter labelled hit/miss, after merging"""
+    family = families.get(counter_name)
+    if family is None:
+        return
+    group_index = family['labels'].index(group_label)
+    result_index = family['labels'].index(result_label)
+    totals = {}
+    for labels, value in family['series']:
+        hits, lookups = totals.get(labels[group_index], (0, 0))
+        if labels[result_index] in hit_values:
+            hits += value
+        totals[labels[group_index]] = (hits, lookups + value)
+    families[ratio_name] = {
+        'kind': 'gauge', 'description': description, 'labels': [group_label], 'buckets': [],
+        'series': [[[group], round(hits / lookups, 4) if lookups else 0.0] for group, (hits, lookups) in totals.items()],
+    }
+
+
+class Metrics:
+    """Request count/latency per endpoint and the /metrics view for a Flask app"""
+
+    def __init__(self, app=None, registry=registry, directory=None, token=None, flush_interval=5.0):
+        self.registry = registry
+        self.token = token
+        self.store = MultiprocessStore(self.registry, directory, flush_interval) if directory else None
+        self.requests = self.registry.counter('http_requests_total', 'HTTP requests',
+                                              labels=('endpoint', 'method', 'status'))
+        self.latency = self.registry.histogram('http_request_duration_seconds', 'HTTP request latency',
+                                               labels=('endpoint', 'method'))
+        self.in_flight = self.registry.gauge('http_requests_in_flight', 'Requests being handled')
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.before_request(self._start)
+        app.after_request(self._finish)
+        app.teardown_request(self._teardown)
+        app.add_url_rule('/metrics', 'metrics', self.expose)
+
+    def _start(self):
+        from flask import g
+        if self.store is not None:
+            self.store.ensure_started()
+        g.metrics_started = time.perf_counter()
+        self.in_flight.inc()
+
+    def _finish(self, response):
+        from flask import g, request
+        started = g.get('metrics_started')
+        if started is not None:
+            endpoint = request.endpoint or 'unmatched'
+            self.requests.inc(endpoint, request.method, str(response.status_code))
+            self.latency.observe(time.perf_counter() - started, endpoint, request.method)
+        return response
+
+    def _teardown(self, exc):
+        from flask import g
+        if g.pop('metrics_started', None) is not None:
+            self.in_flight.dec()
+
+    def collect(self):
+        families = self.store.collect() if self.store is not None else merge([self.registry.collect()])
+        add_ratios(families, 'cache_requests_total', 'cache_hit_ratio', 'Cache hits / lookups', 'cache')
+        return families
+
+    def expose(self):
+        from flask import Response, request
+        if self.token:
+            supplied = request.headers.get('Authorization', '')
+            if supplied != f'Bearer {self.token}':
+                return Response('Unauthorized\n', status=401, mimetype='text/plain')
+        return Response(render(self.collect()), content_type=CONTENT_TYPE)
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """pymongo command listener: count and latency per command and collection"""
+
+    def __init__(self, registry=registry):
+        self.commands = registry.counter('mongo_commands_total', 'MongoDB commands',
+                                         labels=('command', 'collection', 'status'))
+        self.latency = registry.histogram('mongo_command_duration_seconds', 'MongoDB command latency',
+                                          labels=('command', 'collection'))
+        self._collections = {}
+
+    def _key(self, event):
+        return (event.connection_id, event.request_id)
+
+    def started(self, event):
+        collection = event.command.get(event.command_name)
+        self._collections[self._key(event)] = collection if isinstance(collection, str) else ''
+
+    def _finished(self, event, status):
+        collection = self._collections.pop(self._key(event), '')
+        self.commands.inc(event.command_name, collection, status)
+        self.latency.observe(event.duration_micros / 1e6, event.command_name, collection)
+
+    def succeeded(self, event):
+        self._finished(event, 'ok')
+
+    def failed(self, event):
+        self._finished(event, 'error')
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    check = MetricsRegistry()
+    hits = check.counter('cache_requests_total', 'Cache lookups', labels=('cache', 'result'))
+    latency = check.histogram('work_seconds', 'Work latency', labels=('stage',))
+    for i in range(100):
+        hits.inc('page', 'hit' if i % 4 else 'miss')
+        latency.observe(i / 1000, 'decode')
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = MultiprocessStore(check, directory)
+        # Pretend another worker flushed the same values
+        with open(store.path(1, 'other'), 'w', encoding='utf-8') as f:
+            json.dump({'pid': 1, 'families': check.collect()}, f)
+        families = store.collect()
+    add_ratios(families, 'cache_requests_total', 'cache_hit_ratio', 'Cache hits / lookups', 'cache')
+    print(render(families))
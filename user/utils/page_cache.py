@@ -0,0 +1,203 @@
+# utils/page_cache.py
+"""
+Rendered page and fragment cache
+
+The public pest pages only vary by language, role and the pest knowledge-base
+version, so their rendered HTML can be reused across visitors. Entries live in
+an in-memory LRU; when a disk directory is configured they are also written
+there so other workers on the same host can reuse them.
+
+Responses carry an ETag and Last-Modified so browsers revalidate with
+If-None-Match / If-Modified-Since and get a 304 instead of the page.
+"""
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from datetime import datetime
+
+from flask import request, make_response, session
+
+log = logging.getLogger(__name__)
+
+CachedPage = namedtuple('CachedPage', ['body', 'etag', 'last_modified', 'render_ms', 'created'])
+
+
+def page_key(*parts):
+    """Cache key built from the values a page depends on"""
+    return '|'.join(str(part) for part in parts)
+
+
+def has_pending_flashes():
+    """Flashed messages are rendered into the layout, so such pages can't be shared"""
+    return bool(session.get('_flashes'))
+
+
+class PageCache:
+    """
+    LRU of rendered HTML with an optional on-disk tier.
+    Keys should include everything the page depends on (see page_key),
+    so stale entries are simply never asked for again.
+    """
+
+    def __init__(self, max_entries=256, disk_dir=None, max_age=300.0):
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.max_age = max_age
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            'hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'not_modified': 0,
+            'render_ms_saved': 0.0,
+        }
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    # ---------- storage ----------
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.page')
+
+    def _read_disk(self, key):
+        if not self.disk_dir:
+            return None
+        try:
+            with open(self._disk_path(key), 'rb') as f:
+                stored_key, entry = pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError, ValueError):
+            return None
+        if stored_key != key:
+            return None
+        return CachedPage(*entry)
+
+    def _write_disk(self, key, entry):
+        if not self.disk_dir:
+            return
+        try:
+            # Write to a temp file and rename so readers never see half a page
+            fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((key, tuple(entry)), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._disk_path(key))
+        except OSError as e:
+            log.warning("Could not write page cache entry: %s", e)
+
+    def _fresh(self, entry):
+        return time.time() - entry.created < self.max_age
+
+    def get(self, key):
+        """Cached entry for key, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._fresh(entry):
+                    self._entries.move_to_end(key)
+                    self._stats['hits'] += 1
+                    self._stats['render_ms_saved'] += entry.render_ms
+                    return entry
+                del self._entries[key]
+
+        entry = self._read_disk(key)
+        with self._lock:
+            if entry is not None and self._fresh(entry):
+                self._store(key, entry)
+                self._stats['disk_hits'] += 1
+                self._stats['render_ms_saved'] += entry.render_ms
+                return entry
+            self._stats['misses'] += 1
+        return None
+
+    def put(self, key, body, last_modified=None, render_ms=0.0):
+        """Store rendered HTML and return the new entry"""
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        etag = hashlib.sha1(body).hexdigest()[:16]
+        last_modified = (last_modified or datetime.now()).replace(microsecond=0)
+        entry = CachedPage(body, etag, last_modified, render_ms, time.time())
+        with self._lock:
+            self._store(key, entry)
+        self._write_disk(key, entry)
+        return entry
+
+    def _store(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop every entry, in memory and on disk"""
+        with self._lock:
+            self._entries.clear()
+        if self.disk_dir:
+            for name in os.listdir(self.disk_dir):
+                if name.endswith('.page'):
+                    try:
+                        os.remove(os.path.join(self.disk_dir, name))
+                    except OSError:
+                        pass
+
+    # ---------- rendering ----------
+
+    def fragment(self, key, render):
+        """Cached markup for an expensive part of a page; render() builds it on a miss"""
+        entry = self.get(key)
+        if entry is None:
+            started = time.perf_counter()
+            body = render()
+            entry = self.put(key, body, render_ms=(time.perf_counter() - started) * 1000)
+        return entry.body.decode('utf-8')
+
+    def respond(self, key, render, last_modified=None):
+        """
+        Serve a full page from the cache, rendering it on a miss.
+        Handles If-None-Match / If-Modified-Since with a 304.
+        """
+        entry = self.get(key)
+        if entry is None:
+            started = time.perf_counter()
+            body = render()
+            entry = self.put(key, body, last_modified, (time.perf_counter() - started) * 1000)
+
+        if self._not_modified(entry):
+            with self._lock:
+                self._stats['not_modified'] += 1
+            response = make_response('', 304)
+        else:
+            response = make_response(entry.body)
+            response.headers['Content-Type'] = 'text/html; charset=utf-8'
+        response.set_etag(entry.etag)
+        response.last_modified = entry.last_modified
+        # Pages depend on the session (language, role), so shared caches must not store them
+        response.headers['Cache-Control'] = 'private, no-cache'
+        response.headers['Vary'] = 'Cookie'
+        return response
+
+    @staticmethod
+    def _not_modified(entry):
+        if request.if_none_match:
+            return request.if_none_match.contains(entry.etag)
+        if request.if_modified_since:
+            return entry.last_modified <= request.if_modified_since.replace(tzinfo=None)
+        return False
+
+    # ---------- reporting ----------
+
+    def stats(self):
+        """Hit rate and render time saved since start-up"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = len(self._entries)
+        lookups = stats['hits'] + stats['disk_hits'] + stats['misses']
+        stats['hit_rate'] = round((stats['hits'] + stats['disk_hits']) / lookups, 4) if lookups else 0.0
+        stats['render_ms_saved'] = round(stats['render_ms_saved'], 2)
+        stats['disk_dir'] = self.disk_dir
+        return stats
+
@@ -0,0 +1,332 @@
+# utils/pest_store.py
+"""
+Unified read-through store for pest information
+
+Merges the three pest sources behind one cache:
+  - pest_group_data (utils/pests.py): the 11 model classes
+  - PEST_LIBRARY_DATA (utils/pest_library.py): the 6 library pests
+  - the Mongo `pests` collection: admin-added and detected pests
+
+Library and detail views are built once per language and reused until an
+admin changes pest data. Other workers notice the change through a version
+counter kept in the `app_meta` collection.
+"""
+import copy
+import logging
+import threading
+import time
+from datetime import datetime
+
+from bson.objectid import ObjectId
+
+from .image_variants import CARD_SIZES, DETAIL_SIZES
+from .pest_library import get_all_pests, get_pest_by_name
+from .pests import get_pest_details
+
+log = logging.getLogger(__name__)
+
+# Pest names that come from failed predictions, never shown in the library
+ERROR_PEST_NAMES = ['Unknown', 'Error', 'Server Error', 'Connection Error', 'Timeout Error']
+
+DEFAULT_PEST_IMAGE = "/static/images/pests/default.jpg"
+
+# List fields that admins enter as newline-separated text
+LIST_FIELDS = ['harmful_effects', 'organic_solutions', 'chemical_pesticides', 'prevention_methods']
+MULTILINGUAL_LIST_FIELDS = [
+    'hindi_harmful_effects', 'hindi_organic_solutions', 'hindi_chemical_pesticides', 'hindi_prevention_methods',
+    'bengali_harmful_effects', 'bengali_organic_solutions', 'bengali_chemical_pesticides', 'bengali_prevention_methods'
+]
+
+META_ID = 'pest_knowledge'
+
+
+def normalize_severity(severity):
+    """Collapse free-form severity labels to very_high/high/medium/low"""
+    severity = str(severity).lower()
+    if 'very' in severity:
+        return 'very_high'
+    elif 'high' in severity:
+        return 'high'
+    elif 'medium' in severity:
+        return 'medium'
+    return 'low'
+
+
+def library_image_url(image):
+    """Image URL for a bundled library pest"""
+    if not image:
+        return DEFAULT_PEST_IMAGE
+    if image.startswith(('http://', 'https://', '//')):
+        return image
+    return f"/static/images/pests/{image}"
+
+
+def custom_image_url(pest):
+    """Image URL for a pest stored in Mongo"""
+    image_url = pest.get('image_url') or pest.get('image') or pest.get('cloudinary_url')
+    if not image_url or not image_url.startswith(('http://', 'https://', '/')):
+        return DEFAULT_PEST_IMAGE
+    return image_url
+
+
+def split_lines(value):
+    """Turn newline-separated admin text into a list of non-empty lines"""
+    return [line.strip() for line in value.split('\n') if line.strip()]
+
+
+def _is_new(created_date, now):
+    """Admin pests stay flagged as new for five days"""
+    if not created_date:
+        return None
+    if isinstance(created_date, str):
+        try:
+            created_date = datetime.fromisoformat(created_date.replace('Z', '+00:00'))
+        except ValueError:
+            created_date = now
+    return (now - created_date).days <= 5
+
+
+class PestKnowledgeStore:
+    """
+    In-memory cache over all pest sources.
+    Returned records are shared between requests - treat them as read-only.
+    """
+
+    def __init__(self, db_getter, refresh_interval=5.0, max_age=300.0, image_variants=None):
+        # db_getter is called lazily so the store can be created before Mongo is reachable
+        self._db_getter = db_getter
+        self.image_variants = image_variants
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self._lock = threading.RLock()
+        self._predefined = {}
+        self._admin_pests = None
+        self._admin_built_at = 0.0
+        self._library_views = {}
+        self._details = {}
+        self._version = 0
+        self._updated_at = datetime.now()
+        self._last_version_check = 0.0
+        self._listeners = []
+        if image_variants is not None:
+            image_variants.add_listener(self._variants_ready)
+
+    # ---------- versioning ----------
+
+    @property
+    def version(self):
+        """Knowledge-base version, bumped on every admin change"""
+        self._sync_version()
+        return self._version
+
+    @property
+    def updated_at(self):
+        """When the knowledge base last changed (as far as this worker knows)"""
+        self._sync_version()
+        return self._updated_at
+
+    def add_listener(self, callback):
+        """Call callback() whenever this worker drops its cached views"""
+        self._listeners.append(callback)
+
+    def _meta(self):
+        return self._db_getter().app_meta
+
+    def _sync_version(self):
+        """Pick up invalidations made by other workers"""
+        now = time.monotonic()
+        if now - self._last_version_check < self.refresh_interval:
+            return
+        self._last_version_check = now
+        try:
+            meta = self._meta().find_one({'_id': META_ID})
+        except Exception as e:
+            log.warning("Could not read pest knowledge version: %s", e)
+            return
+        if meta and meta.get('version', 0) != self._version:
+            with self._lock:
+                self._clear()
+                self._version = meta.get('version', 0)
+                self._updated_at = meta.get('updated_at') or datetime.now()
+
+    def invalidate(self):
+        """Drop cached views after pest data changed, here and in other workers"""
+        with self._lock:
+            self._clear()
+            self._updated_at = datetime.now()
+            try:
+                meta = self._meta().find_one_and_update(
+                    {'_id': META_ID},
+                    {'$inc': {'version': 1}, '$set': {'updated_at': self._updated_at}},
+                    upsert=True,
+                    return_document=True
+                )
+                self._version = meta.get('version', self._version + 1)
+            except Exception as e:
+                log.warning("Could not publish pest knowledge version: %s", e)
+                self._version += 1
+            self._last_version_check = time.monotonic()
+
+    def _responsive_image(self, image_url, sizes):
+        """
+        srcset data for bundled images (see utils/image_variants.py)
+        Never generates variants here, with the store lock held: missing ones are
+        built in the background and the views rebuilt by _variants_ready()
+        """
+        if self.image_variants is None:
+            return None
+        return self.image_variants.responsive(image_url, sizes, wait=False)
+
+    def _variants_ready(self):
+        """Rebuild views that were made before their image variants existed (this worker only)"""
+        with self._lock:
+            self._predefined = {}
+            self._clear()
+
+    def _clear(self):
+        self._admin_pests = None
+        self._library_views = {}
+        self._details = {}
+        for callback in self._listeners:
+            try:
+                callback()
+            except Exception as e:
+                log.warning("Pest knowledge listener failed: %s", e)
+
+    # ---------- library ----------
+
+    def _predefined_pests(self, language):
+        """Bundled library pests for one language, normalized once"""
+        pests = self._predefined.get(language)
+        if pests is None:
+            pests = []
+            for pest in get_all_pests(language):
+                pest = copy.deepcopy(pest)
+                pest['pest_type'] = 'predefined'
+                pest['is_new'] = False
+                pest['image_url'] = library_image_url(pest.get('image'))
+                pest['responsive_image'] = self._responsive_image(pest['image_url'], CARD_SIZES)
+                pest['id'] = pest['name']
+                pest['severity'] = normalize_severity(pest.get('severity', 'Medium'))
+                pests.append(pest)
+            self._predefined[language] = pests
+        return pests
+
+    def _admin_added_pests(self):
+        """Admin-added pests from Mongo, normalized and cached"""
+        if self._admin_pests is not None and time.monotonic() - self._admin_built_at < self.max_age:
+            return self._admin_pests
+
+        now = datetime.now()
+        pests = list(self._db_getter().pests.find({
+            'name': {'$nin': ERROR_PEST_NAMES},
+            'category': 'admin_added'
+        }).sort('created_at', -1))
+
+        for pest in pests:
+            pest['pest_type'] = 'custom'
+            pest['id'] = str(pest['_id'])
+            is_new = _is_new(pest.get('created_at'), now)
+            if is_new is not None:
+                pest['is_new'] = is_new
+            pest['image_url'] = custom_image_url(pest)
+            pest['responsive_image'] = self._responsive_image(pest['image_url'], CARD_SIZES)
+            pest['severity'] = normalize_severity(pest.get('severity', 'medium'))
+
+        self._admin_pests = pests
+        self._admin_built_at = time.monotonic()
+        # Library views embed the admin list, so they expire with it
+        self._library_views = {}
+        return pests
+
+    def library_view(self, language='english'):
+        """Everything the pest library page needs for one language"""
+        self._sync_version()
+        language = language.lower()
+        with self._lock:
+            admin_pests = self._admin_added_pests()
+            view = self._library_views.get(language)
+            if view is not None:
+                return view
+
+            predefined_pests = self._predefined_pests(language)
+            all_pests = list(admin_pests) + predefined_pests
+            view = {
+                'pests': all_pests,
+                'total_pests': len(all_pests),
+                'predefined_pests_count': len(predefined_pests),
+                'custom_pests_count': len(admin_pests),
+                'new_pests_count': sum(1 for pest in admin_pests if pest.get('is_new', False)),
+                'high_severity_count': sum(
+                    1 for pest in all_pests
+                    if str(pest.get('severity', '')).lower() in ['high', 'very_high', 'very high']
+                )
+            }
+            self._library_views[language] = view
+            return view
+
+    # ---------- details ----------
+
+    def get_pest(self, pest_id, language='english'):
+        """
+        Look up a pest by library name, ObjectId or Mongo name.
+        Returns (pest_data, pest_type) or (None, None).
+        """
+        self._sync_version()
+        language = language.lower()
+        key = (pest_id, language)
+        with self._lock:
+            if key in self._details:
+                return self._details[key]
+
+        found = self._load_pest(pest_id, language)
+        if found[0] is not None:
+            with self._lock:
+                self._details[key] = found
+        return found
+
+    def _load_pest(self, pest_id, language):
+        # Bundled library pest (by name)
+        predefined_pest = get_pest_by_name(pest_id, language)
+        if predefined_pest:
+            pest_data = copy.deepcopy(predefined_pest)
+            pest_data['id'] = pest_id
+            pest_data['_id'] = pest_id
+            pest_data['image_url'] = library_image_url(pest_data.get('image'))
+            pest_data['responsive_image'] = self._responsive_image(pest_data['image_url'], DETAIL_SIZES)
+            return self._format_lists(pest_data), 'predefined'
+
+        # Pest stored in Mongo (by ObjectId, otherwise by name)
+        pests = self._db_getter().pests
+        if ObjectId.is_valid(pest_id):
+            db_pest = pests.find_one({'_id': ObjectId(pest_id)})
+        else:
+            db_pest = pests.find_one({'name': pest_id})
+        if not db_pest:
+            return None, None
+
+        db_pest['_id'] = str(db_pest.get('_id'))
+        db_pest['id'] = db_pest['_id']
+        if not db_pest.get('image_url'):
+            db_pest['image_url'] = db_pest.get('image') or DEFAULT_PEST_IMAGE
+        if not db_pest['image_url'].startswith(('http://', 'https://', '/')):
+            db_pest['image_url'] = DEFAULT_PEST_IMAGE
+        db_pest['responsive_image'] = self._responsive_image(db_pest['image_url'], DETAIL_SIZES)
+        return self._format_lists(db_pest), 'custom'
+
+    @staticmethod
+    def _format_lists(pest_data):
+        """Admin text fields may be stored as newline-separated strings"""
+        for field in LIST_FIELDS:
+            if isinstance(pest_data.get(field), str):
+                pest_data[field] = split_lines(pest_data[field])
+            elif field not in pest_data:
+                pest_data[field] = []
+        for field in MULTILINGUAL_LIST_FIELDS:
+            if isinstance(pest_data.get(field), str):
+                pest_data[field] = split_lines(pest_data[field])
+        return pest_data
+
+    def get_detection_details(self, pest_name, language='english'):
+        """Details for a model class (pest_group_data)"""
+        return get_pest_details(pest_name, language)
@@ -0,0 +1,357 @@
+# utils/query_profiler.py
+"""
+Slow / wasteful MongoDB query report per Flask endpoint
+
+QueryProfiler is a pymongo command listener. For every command it records
+the duration, namespace, filter shape (values replaced by '?') and number of
+documents returned, grouped by the endpoint that issued it:
+
+    {'endpoint': 'admin_user_management', 'command': 'aggregate',
+     'namespace': 'pest_detection.user_uploads', 'shape': '[{"$match":{"user_id":"?"}},...]',
+     'count': 240, 'total_ms': 310.2, 'max_per_request': 40, 'flags': ['n+1'], ...}
+
+Flags:
+  slow     a call took longer than slow_ms
+  collscan the query plan (explain, run once per shape in the background) scans the collection
+  n+1      the same shape ran n_plus_one times or more within one request
+
+Stats are per process; /admin/query-profile shows the current worker's.
+A saved JSON report can be printed with
+    python -m user.utils.query_profiler report.json [sort] [limit]
+"""
+import json
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from pymongo import monitoring
+
+log = logging.getLogger(__name__)
+
+# Driver housekeeping, not application queries
+IGNORED_COMMANDS = {'explain', 'hello', 'isMaster', 'ismaster', 'ping', 'buildInfo', 'buildinfo',
+                    'endSessions', 'saslStart', 'saslContinue', 'killCursors', 'getLastError'}
+EXPLAINABLE_COMMANDS = {'find', 'count', 'distinct', 'aggregate', 'update', 'delete', 'findAndModify'}
+# Fields of the command document that describe the query (the rest is session / driver state)
+QUERY_FIELDS = ('filter', 'query', 'q', 'sort', 'key', 'pipeline', 'updates', 'deletes', 'limit', 'skip', 'hint')
+
+MAX_OPEN_CURSORS = 10000
+
+SORT_KEYS = ('total_ms', 'max_ms', 'avg_ms', 'count', 'slow', 'n_plus_one', 'docs_returned')
+
+
+def shape_of(value):
+    """Query with literal values replaced by '?', keys and operators kept"""
+    if isinstance(value, dict):
+        return {key: shape_of(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        if any(isinstance(item, dict) for item in value):
+            return [shape_of(item) for item in value]
+        return ['?'] if value else []
+    return '?'
+
+
+def _dumps(value):
+    return json.dumps(value, separators=(',', ':'), default=str)
+
+
+def command_shape(command_name, command):
+    """Canonical string for the query part of a command"""
+    if command_name == 'find':
+        shape = {'filter': shape_of(command.get('filter', {}))}
+        if command.get('sort'):
+            shape['sort'] = dict(command['sort'])
+        return _dumps(shape)
+    if command_name == 'aggregate':
+        return _dumps(shape_of(command.get('pipeline', [])))
+    if command_name in ('count', 'findAndModify'):
+        return _dumps(shape_of(command.get('query', {})))
+    if command_name == 'distinct':
+        return _dumps({'key': command.get('key'), 'query': shape_of(command.get('query', {}))})
+    if command_name in ('update', 'delete'):
+        statements = command.get('updates' if command_name == 'update' else 'deletes') or [{}]
+        return _dumps(shape_of(statements[0].get('q', {})))
+    return ''
+
+
+def returned_count(command_name, reply):
+    """Documents returned (reads) or affected (writes) by one reply"""
+    cursor = reply.get('cursor')
+    if isinstance(cursor, dict):
+        return len(cursor.get('firstBatch') or cursor.get('nextBatch') or ())
+    if command_name == 'distinct':
+        return len(reply.get('values', ()))
+    if command_name == 'findAndModify':
+        return 1 if reply.get('value') else 0
+    return int(reply.get('n', 0) or 0)
+
+
+def has_collscan(explain):
+    """True if a winning plan in an explain() result contains a COLLSCAN stage"""
+    def walk(node, in_winning):
+        if isinstance(node, dict):
+            if in_winning and node.get('stage') == 'COLLSCAN':
+                return True
+            return any(walk(item, in_winning or key == 'winningPlan') for key, item in node.items())
+        if isinstance(node, list):
+            return any(walk(item, in_winning) for item in node)
+        return False
+    return walk(explain, False)
+
+
+class _Entry:
+    __slots__ = ('count', 'total_ms', 'max_ms', 'docs', 'slow', 'n_plus_one', 'max_per_request', 'collscan')
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.docs = 0
+        self.slow = 0
+        self.n_plus_one = 0
+        self.max_per_request = 0
+        self.collscan = None
+
+
+class QueryProfiler(monitoring.CommandListener):
+    """pymongo command listener that profiles queries per endpoint and shape"""
+
+    def __init__(self, client_getter=None, slow_ms=100.0, n_plus_one=5, explain=True, recent=100):
+        self.client_getter = client_getter
+        self.slow_ms = slow_ms
+        self.n_plus_one = n_plus_one
+        self.explain = explain and client_getter is not None
+        self._entries = {}
+        self._requests = {}
+        self._pending = {}
+        self._cursors = {}
+        self._plans = {}
+        self._recent_slow = deque(maxlen=recent)
+        self._lock = threading.Lock()
+        self._explainer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='query-explain') if self.explain else None
+
+    # -- listener -----------------------------------------------------------
+
+    def started(self, event):
+        name = event.command_name
+        if name in IGNORED_COMMANDS:
+            return
+        command = event.command
+        endpoint, per_request = self._request_state()
+
+        if name == 'getMore':
+            cursor_id = command.get('getMore')
+            key = self._cursors.get(cursor_id)
+            if key is not None:
+                self._pending[(event.connection_id, event.request_id)] = (key, False, cursor_id)
+            return
+
+        collection = command.get(name)
+        namespace = f"{event.database_name}.{collection if isinstance(collection, str) else ''}"
+        shape = command_shape(name, command)
+        key = (endpoint, name, namespace, shape)
+
+        repeats = 0
+        if per_request is not None:
+            repeats = per_request[key] = per_request.get(key, 0) + 1
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry()
+            entry.max_per_request = max(entry.max_per_request, repeats)
+            if repeats == self.n_plus_one:
+                entry.n_plus_one += 1
+            plan_key = (namespace, name, shape)
+            explain = self.explain and name in EXPLAINABLE_COMMANDS and plan_key not in self._plans
+            if explain:
+                self._plans[plan_key] = None
+            else:
+                entry.collscan = self._plans.get(plan_key, entry.collscan)
+        if repeats == self.n_plus_one:
+            log.warning("Repeated query in one request (N+1)",
+                        extra={'command': name, 'namespace': namespace, 'shape': shape, 'repeats': repeats})
+        if explain:
+            query = {field: command[field] for field in QUERY_FIELDS if field in command}
+            self._explainer.submit(self._explain, event.database_name, plan_key, {name: collection, **query})
+
+        self._pending[(event.connection_id, event.request_id)] = (key, True, None)
+
+    def succeeded(self, event):
+        self._finished(event, event.reply)
+
+    def failed(self, event):
+        self._finished(event, {})
+
+    def _finished(self, event, reply):
+        pending = self._pending.pop((event.connection_id, event.request_id), None)
+        if pending is None:
+            return
+        key, first, cursor_id = pending
+        elapsed_ms = event.duration_micros / 1000
+        docs = returned_count(event.command_name, reply)
+
+        # Follow open cursors so getMore batches count towards the query that opened them
+        cursor = reply.get('cursor')
+        if isinstance(cursor, dict):
+            if cursor.get('id'):
+                if len(self._cursors) >= MAX_OPEN_CURSORS:
+                    self._cursors.clear()
+                self._cursors[cursor['id']] = key
+            elif cursor_id is not None:
+                self._cursors.pop(cursor_id, None)
+
+        slow = elapsed_ms >= self.slow_ms
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            if first:
+                entry.count += 1
+            entry.total_ms += elapsed_ms
+            entry.max_ms = max(entry.max_ms, elapsed_ms)
+            entry.docs += docs
+            if slow:
+                entry.slow += 1
+                self._recent_slow.append({
+                    'at': time.time(), 'endpoint': key[0], 'command': key[1], 'namespace': key[2],
+                    'shape': key[3], 'ms': round(elapsed_ms, 1), 'docs': docs,
+                })
+        if slow:
+            log.warning("Slow Mongo query", extra={'endpoint': key[0], 'command': key[1], 'namespace': key[2],
+                                                  'shape': key[3], 'ms': round(elapsed_ms, 1), 'docs': docs})
+
+    def _request_state(self):
+        """(endpoint, per-request shape counts) for the current Flask request"""
+        try:
+            from flask import g, has_request_context, request
+        except ImportError:
+            return '-', None
+        if not has_request_context():
+            return '-', None
+        per_request = g.get('_query_profile')
+        if per_request is None:
+            per_request = g._query_profile = {}
+            endpoint = request.endpoint or 'unknown'
+            with self._lock:
+                self._requests[endpoint] = self._requests.get(endpoint, 0) + 1
+        return request.endpoint or 'unknown', per_request
+
+    def _explain(self, database, plan_key, command):
+        try:
+            if any(isinstance(stage, dict) and ('$out' in stage or '$merge' in stage)
+                   for stage in command.get('pipeline', ())):
+                return
+            result = self.client_getter()[database].command({'explain': command, 'verbosity': 'queryPlanner'})
+            collscan = has_collscan(result)
+        except Exception as e:
+            log.debug("Explain failed for %s: %s", plan_key[0], e)
+            return
+        with self._lock:
+            self._plans[plan_key] = collscan
+            for (endpoint, name, namespace, shape), entry in self._entries.items():
+                if (namespace, name, shape) == plan_key:
+                    entry.collscan = collscan
+        if collscan:
+            log.warning("Collection scan", extra={'namespace': plan_key[0], 'command': plan_key[1], 'shape': plan_key[2]})
+
+    # -- report -------------------------------------------------------------
+
+    def report(self, sort='total_ms', limit=50):
+        """Worst query shapes, endpoint summaries and recent slow calls"""
+        if sort not in SORT_KEYS:
+            sort = 'total_ms'
+        with self._lock:
+            entries = list(self._entries.items())
+            requests = dict(self._requests)
+            recent = list(self._recent_slow)
+
+        rows = []
+        endpoints = {}
+        for (endpoint, name, namespace, shape), entry in entries:
+            if not entry.count:
+                continue
+            flags = []
+            if entry.slow:
+                flags.append('slow')
+            if entry.collscan:
+                flags.append('collscan')
+            if entry.n_plus_one:
+                flags.append('n+1')
+            rows.append({
+                'endpoint': endpoint,
+                'command': name,
+                'namespace': namespace,
+                'shape': shape,
+                'count': entry.count,
+                'total_ms': round(entry.total_ms, 1),
+                'avg_ms': round(entry.total_ms / entry.count, 2),
+                'max_ms': round(entry.max_ms, 1),
+                'docs_returned': entry.docs,
+                'avg_docs': round(entry.docs / entry.count, 1),
+                'slow': entry.slow,
+                'collscan': entry.collscan,
+                'n_plus_one': entry.n_plus_one,
+                'max_per_request': entry.max_per_request,
+                'flags': flags,
+            })
+            summary = endpoints.setdefault(endpoint, {'endpoint': endpoint, 'requests': requests.get(endpoint, 0),
+                                                      'queries': 0, 'total_ms': 0.0, 'flagged': 0})
+            summary['queries'] += entry.count
+            summary['total_ms'] += entry.total_ms
+            summary['flagged'] += bool(flags)
+
+        for summary in endpoints.values():
+            summary['total_ms'] = round(summary['total_ms'], 1)
+            per_request = summary['requests'] or 1
+            summary['queries_per_request'] = round(summary['queries'] / per_request, 1)
+            summary['db_ms_per_request'] = round(summary['total_ms'] / per_request, 1)
+
+        rows.sort(key=lambda row: row[sort], reverse=True)
+        return {
+            'slow_ms': self.slow_ms,
+            'n_plus_one': self.n_plus_one,
+            'sort': sort,
+            'queries': rows[:limit],
+            'endpoints': sorted(endpoints.values(), key=lambda summary: summary['total_ms'], reverse=True),
+            'recent_slow': recent[::-1],
+        }
+
+    def reset(self):
+        with self._lock:
+            self._entries.clear()
+            self._requests.clear()
+            self._recent_slow.clear()
+
+
+def format_report(report, limit=20):
+    """Plain-text tables of a report() result"""
+    lines = [f"{'endpoint':<32} {'requests':>8} {'queries/req':>11} {'db ms/req':>9} {'flagged':>7}"]
+    for summary in report['endpoints']:
+        lines.append(f"{summary['endpoint'][:32]:<32} {summary['requests']:>8} {summary['queries_per_request']:>11} "
+                     f"{summary['db_ms_per_request']:>9} {summary['flagged']:>7}")
+    lines.append('')
+    lines.append(f"Worst queries by {report['sort']}:")
+    for row in report['queries'][:limit]:
+        lines.append(f"{row['total_ms']:>9.1f} ms  {row['count']:>6}x  max {row['max_ms']:>7.1f} ms  "
+                     f"docs {row['avg_docs']:>7}  {','.join(row['flags']) or '-':<16} "
+                     f"{row['endpoint']}  {row['command']} {row['namespace']} {row['shape'][:80]}")
+    return '\n'.join(lines)
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python -m user.utils.query_profiler report.json [sort] [limit]")
+        print(f"  report.json: saved output of /admin/api/query-profile, sort: {', '.join(SORT_KEYS)}")
+        sys.exit(1)
+    with open(sys.argv[1], encoding='utf-8') as f:
+        data = json.load(f)
+    data = data.get('report', data)
+    sort = sys.argv[2] if len(sys.argv) > 2 else data.get('sort', 'total_ms')
+    if sort in SORT_KEYS:
+        data['queries'].sort(key=lambda row: row[sort], reverse=True)
+        data['sort'] = sort
+    print(format_report(data, limit=int(sys.argv[3]) if len(sys.argv) > 3 else 20))
@@ -0,0 +1,256 @@
+# utils/static_assets.py
+"""
+Fingerprinted, precompressed static files
+
+Build step (run after changing anything in user/static):
+    python -m user.utils.static_assets build
+    python -m user.utils.static_assets report
+
+`build` copies every file in user/static (except uploads) to
+user/static/dist/<path>.<hash>.<ext>, writes .gz and .br (when the optional
+Brotli package is installed) next to compressible files, and records the
+mapping in user/static/dist/manifest.json.
+
+StaticAssets(app) rewrites url_for('static', ...) to the hashed path when the
+manifest knows the file, and serves hashed files with a one-year immutable
+Cache-Control plus the best precompressed variant the browser accepts.
+Without a manifest everything falls back to Flask's normal static handling.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import shutil
+import sys
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+log = logging.getLogger(__name__)
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'static')
+DIST_DIRNAME = 'dist'
+MANIFEST_NAME = 'manifest.json'
+
+# User uploads change under the same name, so they are never fingerprinted.
+# Image variants (utils/image_variants.py) already carry a content hash.
+SKIP_DIRS = {DIST_DIRNAME, 'uploads', 'variants'}
+IMMUTABLE_PREFIXES = ('variants/',)
+
+COMPRESSIBLE_EXTENSIONS = {'.css', '.js', '.svg', '.ico', '.json', '.txt', '.html', '.map'}
+
+# Keep a compressed variant only if it saves at least this fraction
+MIN_SAVING = 0.1
+
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+# Accept-Encoding token -> file suffix, in order of preference
+ENCODINGS = [('br', '.br'), ('gzip', '.gz')]
+
+
+def file_hash(path, length=10):
+    """Short content hash used in fingerprinted names"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:length]
+
+
+def hashed_name(relative_path, digest):
+    """css/style1.css -> css/style1.<digest>.css"""
+    root, ext = os.path.splitext(relative_path)
+    return f"{root}.{digest}{ext}"
+
+
+def _write_compressed(path, data, suffix, compress):
+    compressed = compress(data)
+    if len(compressed) > len(data) * (1 - MIN_SAVING):
+        return None
+    with open(path + suffix, 'wb') as f:
+        f.write(compressed)
+    return len(compressed)
+
+
+def build(static_dir=STATIC_DIR):
+    """Fingerprint and precompress static files, return the manifest"""
+    dist_dir = os.path.join(static_dir, DIST_DIRNAME)
+    if os.path.isdir(dist_dir):
+        shutil.rmtree(dist_dir)
+    os.makedirs(dist_dir)
+
+    files = {}
+    for root, dirs, names in os.walk(static_dir):
+        if root == static_dir:
+            dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        dirs.sort()
+        for name in sorted(names):
+            source = os.path.join(root, name)
+            relative = os.path.relpath(source, static_dir).replace(os.sep, '/')
+            target_relative = f"{DIST_DIRNAME}/{hashed_name(relative, file_hash(source))}"
+            target = os.path.join(static_dir, *target_relative.split('/'))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            shutil.copyfile(source, target)
+
+            entry = {'path': target_relative, 'size': os.path.getsize(source), 'gzip': None, 'br': None}
+            if os.path.splitext(name)[1].lower() in COMPRESSIBLE_EXTENSIONS:
+                with open(source, 'rb') as f:
+                    data = f.read()
+                entry['gzip'] = _write_compressed(target, data, '.gz',
+                                                  lambda d: gzip.compress(d, compresslevel=9, mtime=0))
+                if brotli is not None:
+                    entry['br'] = _write_compressed(target, data, '.br',
+                                                    lambda d: brotli.compress(d, quality=11))
+            files[relative] = entry
+
+    manifest = {'files': files}
+    with open(os.path.join(dist_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+def load_manifest(static_dir=STATIC_DIR):
+    """Manifest written by build(), or None if the build step hasn't run"""
+    try:
+        with open(os.path.join(static_dir, DIST_DIRNAME, MANIFEST_NAME), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+class StaticAssets:
+    """Hooks fingerprinted URLs and cache-friendly serving into a Flask app"""
+
+    def __init__(self, app=None):
+        self.files = {}
+        self._hashed = {}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.app = app
+        self.reload()
+        self._default_view = app.view_functions['static']
+        app.view_functions['static'] = self.send_static
+        app.url_defaults(self._hashed_url_defaults)
+        app.jinja_env.globals['static_url'] = self.static_url
+
+    def reload(self):
+        """Re-read the manifest after a build"""
+        manifest = load_manifest(self.app.static_folder) or {'files': {}}
+        self.files = manifest['files']
+        self._hashed = {entry['path']: entry for entry in self.files.values()}
+        if self.files:
+            log.info("Static asset manifest loaded: %s files", len(self.files))
+
+    def static_path(self, filename):
+        """Fingerprinted path for a static file, or the name itself if unknown"""
+        entry = self.files.get(filename)
+        return entry['path'] if entry else filename
+
+    def static_url(self, filename):
+        """url_for('static') replacement for templates: {{ static_url('css/style1.css') }}"""
+        from flask import url_for
+        return url_for('static', filename=filename)
+
+    def _hashed_url_defaults(self, endpoint, values):
+        # Makes every existing url_for('static', filename=...) emit the hashed name
+        if endpoint == 'static' and 'filename' in values:
+            values['filename'] = self.static_path(values['filename'])
+
+    def send_static(self, filename):
+        entry = self._hashed.get(filename)
+        if entry is None:
+            response = self._default_view(filename=filename)
+            if filename.startswith(IMMUTABLE_PREFIXES) and response.status_code == 200:
+                response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+            return response
+
+        from flask import request, send_from_directory
+
+        mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        encoding, suffix = None, ''
+        accepted = request.accept_encodings
+        for name, variant_suffix in ENCODINGS:
+            if entry.get(name) and accepted[name]:
+                encoding, suffix = name, variant_suffix
+                break
+
+        response = send_from_directory(self.app.static_folder, filename + suffix, mimetype=mimetype)
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        response.headers['Vary'] = 'Accept-Encoding'
+        response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+        return response
+
+
+def _header_bytes(status, headers):
+    return len(f"HTTP/1.1 {status}\r\n") + sum(len(f"{k}: {v}\r\n") for k, v in headers.items()) + 2
+
+
+def transfer_report(static_dir=STATIC_DIR, paths=None):
+    """
+    Bytes a first-time and a repeat visitor transfer for the given static
+    files, with Flask's default static handling and with StaticAssets.
+    A repeat visitor revalidates no-cache responses and skips fresh ones.
+    """
+    from flask import Flask
+
+    manifest = load_manifest(static_dir)
+    if manifest is None:
+        raise SystemExit("No manifest - run the build step first")
+    paths = paths or sorted(manifest['files'])
+    request_headers = {'Accept-Encoding': 'br, gzip'}
+
+    def visit(app, use_hashed):
+        client = app.test_client()
+        first = repeat = repeat_requests = 0
+        with app.test_request_context():
+            from flask import url_for
+            urls = [url_for('static', filename=path) if use_hashed else f"/static/{path}" for path in paths]
+        for url in urls:
+            response = client.get(url, headers=request_headers)
+            first += _header_bytes(response.status, response.headers) + len(response.data)
+            cache_control = response.cache_control
+            if cache_control.immutable or (cache_control.max_age or 0) > 0:
+                continue
+            repeat_requests += 1
+            conditional = dict(request_headers)
+            if response.headers.get('ETag'):
+                conditional['If-None-Match'] = response.headers['ETag']
+            again = client.get(url, headers=conditional)
+            repeat += _header_bytes(again.status, again.headers) + len(again.data)
+            response.close()
+            again.close()
+        return first, repeat, repeat_requests
+
+    before = visit(Flask(__name__, static_folder=static_dir), False)
+    app = Flask(__name__, static_folder=static_dir)
+    StaticAssets(app)
+    after = visit(app, True)
+    return {
+        'files': len(paths),
+        'brotli': brotli is not None,
+        'before': {'first_visit_bytes': before[0], 'repeat_visit_bytes': before[1], 'repeat_visit_requests': before[2]},
+        'after': {'first_visit_bytes': after[0], 'repeat_visit_bytes': after[1], 'repeat_visit_requests': after[2]},
+    }
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else 'build'
+    if command == 'build':
+        manifest = build()
+        total = sum(entry['size'] for entry in manifest['files'].values())
+        compressed = [entry for entry in manifest['files'].values() if entry['gzip'] or entry['br']]
+        print(f"✅ Fingerprinted {len(manifest['files'])} files ({total / 1024:.0f} KiB)")
+        print(f"   Precompressed: {len(compressed)} (brotli {'on' if brotli else 'not installed'})")
+    elif command == 'report':
+        report = transfer_report(paths=sys.argv[2:] or None)
+        print(json.dumps(report, indent=2))
+    else:
+        print("Usage: python -m user.utils.static_assets [build|report [static paths...]]")
+        sys.exit(1)